@@ -12,15 +12,6 @@ __version__ = "1.0.0"
 __author__ = "MongoDB Visualizer Team"
 __description__ = "Professional MongoDB Database Visualizer"
 
-from .config.settings import get_config
-from .utils.logging_config import initialize_logging, get_logger
-from .controllers.database_controller import DatabaseController
-from .models.data_models import ConnectionInfo, ApplicationState
-
-# Initialize default configuration and logging
-_config = get_config()
-_log_manager = initialize_logging(_config)
-
 __all__ = [
     'get_config',
     'initialize_logging', 
@@ -29,3 +20,24 @@ __all__ = [
     'ConnectionInfo',
     'ApplicationState'
 ]
+
+# Where each export is defined; importing a submodule such as src.styles
+# must not pull in Qt, pymongo and the logging setup through this package
+_EXPORTS = {
+    'get_config': '.config.settings',
+    'initialize_logging': '.utils.logging_config',
+    'get_logger': '.utils.logging_config',
+    'DatabaseController': '.controllers.database_controller',
+    'ConnectionInfo': '.models.data_models',
+    'ApplicationState': '.models.data_models',
+}
+
+
+def __getattr__(name):
+    """Import the package exports on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -7,6 +7,9 @@ database operations.
 """
 
 import asyncio
+import threading
+from collections import deque
+from dataclasses import replace
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime
 import json
@@ -34,20 +37,34 @@ class DatabaseWorker(QThread):
     def __init__(self, connection: MongoDBConnection):
         super().__init__()
         self.connection = connection
-        self.operation_queue = []
+        self.operation_queue = deque()
         self.current_operation = None
         self.logger = get_logger(__name__)
+        # Guards the queue and whether run() is still draining it
+        self._queue_lock = threading.Lock()
+        self._draining = False
     
     def add_operation(self, operation_name: str, operation_func: Callable, *args, **kwargs):
         """Add an operation to the queue."""
-        self.operation_queue.append((operation_name, operation_func, args, kwargs))
-        if not self.isRunning():
-            self.start()
+        with self._queue_lock:
+            self.operation_queue.append((operation_name, operation_func, args, kwargs))
+            if self._draining:
+                return
+            self._draining = True
+        
+        # run() has stopped taking operations but the thread may still be exiting
+        if self.isRunning():
+            self.wait()
+        self.start()
     
     def run(self):
         """Execute queued operations."""
-        while self.operation_queue:
-            operation_name, operation_func, args, kwargs = self.operation_queue.pop(0)
+        while True:
+            with self._queue_lock:
+                if not self.operation_queue:
+                    self._draining = False
+                    return
+                operation_name, operation_func, args, kwargs = self.operation_queue.popleft()
             self.current_operation = operation_name
             
             try:
@@ -77,6 +94,7 @@ class DatabaseController(QObject):
     databases_loaded = pyqtSignal(list)  # List[DatabaseInfo]
     collections_loaded = pyqtSignal(str, list)  # database_name, List[CollectionInfo]
     documents_loaded = pyqtSignal(str, str, list, DocumentStats)  # db, collection, documents, stats
+    documents_appended = pyqtSignal(str, str, list)  # db, collection, next page of documents
     query_executed = pyqtSignal(QueryInfo)
     error_occurred = pyqtSignal(ErrorInfo)
     performance_updated = pyqtSignal(PerformanceMetrics)
@@ -90,6 +108,13 @@ class DatabaseController(QObject):
         self.state = ApplicationState()
         self.logger = get_logger(__name__)
         
+        # Paging of the last find: the query, documents received so far,
+        # whether there is nothing more to fetch yet, and the page being fetched
+        self._page_query: Optional[QueryInfo] = None
+        self._page_loaded = 0
+        self._page_complete = True
+        self._more_query: Optional[QueryInfo] = None
+        
         # Performance monitoring
         self.auto_refresh_timer = QTimer()
         self.auto_refresh_timer.timeout.connect(self._auto_refresh)
@@ -129,6 +154,7 @@ class DatabaseController(QObject):
             self.state.current_connection = None
             self.state.current_database = None
             self.state.current_collection = None
+            self._start_paging(None)
             
             # Stop auto-refresh
             self.auto_refresh_timer.stop()
@@ -204,12 +230,60 @@ class DatabaseController(QObject):
             skip=skip
         )
         
+        self._start_paging(query_info)
         self.worker.add_operation(
             "load_documents",
             self._execute_load_documents,
             query_info
         )
     
+    def has_more_documents(self) -> bool:
+        """Check whether the last find may have more documents on the server."""
+        return (self._page_query is not None and not self._page_complete
+                and self._more_query is None)
+    
+    def load_more_documents(self) -> bool:
+        """
+        Load the next page of the last find.
+        
+        The documents are delivered through documents_appended.
+        
+        Returns:
+            True if a page was requested
+        """
+        if not self.has_more_documents() or not self.connection.is_connected():
+            return False
+        
+        page_query = self._page_query
+        self._more_query = replace(
+            page_query,
+            skip=page_query.skip + self._page_loaded,
+            execution_time=None,
+            result_count=None,
+            error=None,
+            executed_at=None
+        )
+        self.worker.add_operation(
+            "load_more_documents",
+            self.connection.execute_query,
+            self._more_query
+        )
+        return True
+    
+    def _start_paging(self, query_info: Optional[QueryInfo]) -> None:
+        """Make a find the one whose further pages can be loaded."""
+        self._page_query = query_info
+        self._page_loaded = 0
+        # Nothing more can be fetched until the first page has arrived
+        self._page_complete = True
+        self._more_query = None
+    
+    def _page_received(self, query_info: QueryInfo, count: int) -> None:
+        """Record a page of documents received for the paged find."""
+        self._page_loaded += count
+        # A limit of 0 returns everything in one go
+        self._page_complete = not query_info.limit or count < query_info.limit
+    
     def execute_custom_query(self, database_name: str, collection_name: str,
                            query: Dict[str, Any], query_type: QueryType = QueryType.FIND,
                            limit: int = None, skip: int = None) -> None:
@@ -243,6 +317,8 @@ class DatabaseController(QObject):
             skip=skip
         )
         
+        if query_type == QueryType.FIND:
+            self._start_paging(query_info)
         self.worker.add_operation(
             "execute_query",
             self.connection.execute_query,
@@ -378,14 +454,14 @@ class DatabaseController(QObject):
     
     # Private methods
     
-    def _execute_load_documents(self, query_info: QueryInfo) -> Tuple[DocumentList, DocumentStats]:
+    def _execute_load_documents(self, query_info: QueryInfo) -> Tuple[DocumentList, DocumentStats, QueryInfo]:
         """Execute document loading and generate statistics."""
         result, updated_query = self.connection.execute_query(query_info)
         
         # Generate document statistics
         stats = self._analyze_documents(result)
         
-        return result, stats
+        return result, stats, updated_query
     
     def _analyze_documents(self, documents: DocumentList) -> DocumentStats:
         """
@@ -509,7 +585,9 @@ class DatabaseController(QObject):
                 self.collections_loaded.emit(self.state.current_database, result)
             
             elif operation_name == "load_documents":
-                documents, stats = result
+                documents, stats, query_info = result
+                if query_info is self._page_query:
+                    self._page_received(query_info, len(documents))
                 self.documents_loaded.emit(
                     self.state.current_database,
                     self.state.current_collection,
@@ -524,6 +602,8 @@ class DatabaseController(QObject):
                 
                 # If it's a find query, also emit documents_loaded
                 if query_info.query_type == QueryType.FIND:
+                    if query_info is self._page_query:
+                        self._page_received(query_info, len(result_data))
                     stats = self._analyze_documents(result_data)
                     self.documents_loaded.emit(
                         query_info.database,
@@ -532,6 +612,18 @@ class DatabaseController(QObject):
                         stats
                     )
             
+            elif operation_name == "load_more_documents":
+                documents, query_info = result
+                if query_info is not self._more_query:
+                    return  # A newer find replaced the one this page belongs to
+                self._more_query = None
+                self._page_received(query_info, len(documents))
+                self.documents_appended.emit(
+                    query_info.database,
+                    query_info.collection,
+                    documents
+                )
+            
             elif operation_name == "export_data":
                 self.logger.info("Data export completed successfully")
             
@@ -543,6 +635,8 @@ class DatabaseController(QObject):
         if operation_name == "connect":
             self.state.connection_status = ConnectionStatus.ERROR
             self.connection_status_changed.emit(self.state.connection_status)
+        elif operation_name == "load_more_documents":
+            self._more_query = None
         
         self._emit_error(f"{operation_name} failed", error_message)
     
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 from enum import Enum
+import heapq
 import json
 
 
@@ -210,7 +211,8 @@ class DocumentStats:
     
     def get_most_common_fields(self, limit: int = 10) -> List[tuple]:
         """Get most common fields with their frequencies."""
-        return sorted(self.field_frequency.items(), key=lambda x: x[1], reverse=True)[:limit]
+        # Partial selection instead of sorting every field of wide schemas
+        return heapq.nlargest(limit, self.field_frequency.items(), key=lambda x: x[1])
 
 
 @dataclass
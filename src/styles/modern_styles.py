@@ -5,11 +5,38 @@ This module provides a comprehensive set of modern, engaging styles
 that follow Material Design principles and contemporary UI/UX standards.
 """
 
+import functools
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Mapping, Tuple
+
+
+# Names that may be color keys read by each cached getter, taken from the
+# string constants of its code
+_style_colors: Dict[str, FrozenSet[str]] = {}
+
+
+def _cached_style(getter: Callable) -> Callable:
+    """Cache a stylesheet getter's result for the current ModernStyles.COLORS."""
+    _style_colors[getter.__name__] = frozenset(
+        const for const in getter.__code__.co_consts if isinstance(const, str)
+    )
+    
+    @functools.wraps(getter)
+    def cached_getter(cls):
+        if cls.COLORS is not cls._style_cache_colors:
+            cls.update_style_cache()
+        style = cls._style_cache.get(getter.__name__)
+        if style is None:
+            style = cls._style_cache[getter.__name__] = getter(cls)
+        return style
+    return cached_getter
+
+
 class ModernStyles:
     """Collection of modern CSS styles for the MongoDB Visualizer application."""
     
-    # Color scheme
-    COLORS = {
+    # Color scheme; read-only, a theme change swaps in another palette
+    COLORS: Mapping[str, str] = MappingProxyType({
         'primary': '#1976d2',
         'primary_light': '#42a5f5',
         'primary_dark': '#1565c0',
@@ -32,9 +59,36 @@ class ModernStyles:
         'hover': '#e3f2fd',
         'selection': '#1976d2',
         'shadow': 'rgba(0, 0, 0, 0.1)'
-    }
+    })
+    
+    # Stylesheets by getter name for each color scheme used so far, and the
+    # ones for the current COLORS, so switching back to a theme is free
+    _style_caches: Dict[Tuple[Tuple[str, str], ...], Dict[str, str]] = {}
+    _style_cache: Dict[str, str] = {}
+    _style_cache_colors: Mapping[str, str] = {}
+    
+    @classmethod
+    def update_style_cache(cls):
+        """Switch to the cached stylesheets of COLORS, done by the getters when it is swapped."""
+        key = tuple(sorted(cls.COLORS.items()))
+        cache = cls._style_caches.get(key)
+        if cache is None:
+            # A new color scheme keeps the stylesheet parts that read no
+            # changed color; the complete stylesheet is joined again
+            changed = {
+                name for name, value in cls.COLORS.items()
+                if cls._style_cache_colors.get(name) != value
+            }
+            cache = cls._style_caches[key] = {
+                name: style for name, style in cls._style_cache.items()
+                if name in cls._STYLESHEET_PARTS and not _style_colors[name] & changed
+            }
+        
+        cls._style_cache = cache
+        cls._style_cache_colors = cls.COLORS
     
     @classmethod
+    @_cached_style
     def get_main_window_style(cls):
         """Get the main window stylesheet."""
         return f"""
@@ -73,6 +127,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_menu_bar_style(cls):
         """Get the menu bar stylesheet."""
         return f"""
@@ -126,6 +181,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_tool_bar_style(cls):
         """Get the toolbar stylesheet."""
         return f"""
@@ -180,6 +236,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_status_bar_style(cls):
         """Get the status bar stylesheet."""
         return f"""
@@ -221,10 +278,11 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_tree_widget_style(cls):
         """Get the tree widget stylesheet."""
         return f"""
-        QTreeWidget {{
+        QTreeView {{
             background-color: {cls.COLORS['surface']};
             alternate-background-color: #fafafa;
             color: {cls.COLORS['text_primary']};
@@ -237,7 +295,7 @@ class ModernStyles:
             padding: 4px;
         }}
         
-        QTreeWidget::item {{
+        QTreeView::item {{
             padding: 10px 15px;
             border: none;
             border-bottom: 1px solid transparent;
@@ -246,7 +304,7 @@ class ModernStyles:
             font-weight: 500;
         }}
         
-        QTreeWidget::item:hover {{
+        QTreeView::item:hover {{
             background-color: {cls.COLORS['hover']};
             border-radius: 6px;
             margin: 1px;
@@ -254,7 +312,7 @@ class ModernStyles:
             font-weight: 600;
         }}
         
-        QTreeWidget::item:selected {{
+        QTreeView::item:selected {{
             background-color: {cls.COLORS['primary']};
             color: white;
             border-radius: 6px;
@@ -262,35 +320,35 @@ class ModernStyles:
             font-weight: 600;
         }}
         
-        QTreeWidget::item:selected:!active {{
+        QTreeView::item:selected:!active {{
             background-color: {cls.COLORS['primary_light']};
             color: white;
             font-weight: 600;
         }}
         
-        QTreeWidget::branch {{
+        QTreeView::branch {{
             background-color: transparent;
         }}
         
-        QTreeWidget::branch:has-siblings:!adjoins-item {{
+        QTreeView::branch:has-siblings:!adjoins-item {{
             border-image: url(none);
         }}
         
-        QTreeWidget::branch:has-siblings:adjoins-item {{
+        QTreeView::branch:has-siblings:adjoins-item {{
             border-image: url(none);
         }}
         
-        QTreeWidget::branch:!has-children:!has-siblings:adjoins-item {{
+        QTreeView::branch:!has-children:!has-siblings:adjoins-item {{
             border-image: url(none);
         }}
         
-        QTreeWidget::branch:has-children:!has-siblings:closed,
-        QTreeWidget::branch:closed:has-children:has-siblings {{
+        QTreeView::branch:has-children:!has-siblings:closed,
+        QTreeView::branch:closed:has-children:has-siblings {{
             image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTYgNCAxMiA4IDYgMTJWNFoiIGZpbGw9IiM3NTc1NzUiLz4KPC9zdmc+);
         }}
         
-        QTreeWidget::branch:open:has-children:!has-siblings,
-        QTreeWidget::branch:open:has-children:has-siblings {{
+        QTreeView::branch:open:has-children:!has-siblings,
+        QTreeView::branch:open:has-children:has-siblings {{
             image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTQgNiA4IDEyIDEyIDZINFoiIGZpbGw9IiM3NTc1NzUiLz4KPC9zdmc+);
         }}
         
@@ -306,6 +364,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_button_style(cls):
         """Get button stylesheet."""
         return f"""
@@ -377,11 +436,12 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_enhanced_button_styles(cls):
         """Get enhanced button styles for specific button types."""
         return f"""
         /* Enhanced Connect Button */
-        QPushButton[objectName="connect_button"] {{
+        QPushButton[variant="connect"] {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #4caf50, stop:1 #2e7d32) !important;
             color: white !important;
@@ -394,20 +454,20 @@ class ModernStyles:
             min-width: 100px;
         }}
         
-        QPushButton[objectName="connect_button"]:hover {{
+        QPushButton[variant="connect"]:hover {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #66bb6a, stop:1 #388e3c) !important;
             color: white !important;
         }}
         
-        QPushButton[objectName="connect_button"]:pressed {{
+        QPushButton[variant="connect"]:pressed {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #2e7d32, stop:1 #1b5e20) !important;
             color: white !important;
         }}
         
         /* Enhanced Disconnect Button */
-        QPushButton[objectName="disconnect_button"] {{
+        QPushButton[variant="disconnect"] {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #f44336, stop:1 #c62828) !important;
             color: white !important;
@@ -420,20 +480,20 @@ class ModernStyles:
             min-width: 100px;
         }}
         
-        QPushButton[objectName="disconnect_button"]:hover {{
+        QPushButton[variant="disconnect"]:hover {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #ef5350, stop:1 #d32f2f) !important;
             color: white !important;
         }}
         
-        QPushButton[objectName="disconnect_button"]:pressed {{
+        QPushButton[variant="disconnect"]:pressed {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #c62828, stop:1 #b71c1c) !important;
             color: white !important;
         }}
         
         /* Enhanced Refresh Button */
-        QPushButton[objectName="refresh_button"] {{
+        QPushButton[variant="refresh"] {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #2196f3, stop:1 #1565c0) !important;
             color: white !important;
@@ -446,20 +506,20 @@ class ModernStyles:
             min-width: 100px;
         }}
         
-        QPushButton[objectName="refresh_button"]:hover {{
+        QPushButton[variant="refresh"]:hover {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #42a5f5, stop:1 #1976d2) !important;
             color: white !important;
         }}
         
-        QPushButton[objectName="refresh_button"]:pressed {{
+        QPushButton[variant="refresh"]:pressed {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #1565c0, stop:1 #0d47a1) !important;
             color: white !important;
         }}
         
         /* Enhanced Export Button */
-        QPushButton[objectName="export_button"] {{
+        QPushButton[variant="export"] {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #ff9800, stop:1 #ef6c00) !important;
             color: white !important;
@@ -472,13 +532,13 @@ class ModernStyles:
             min-width: 100px;
         }}
         
-        QPushButton[objectName="export_button"]:hover {{
+        QPushButton[variant="export"]:hover {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #ffb74d, stop:1 #f57c00) !important;
             color: white !important;
         }}
         
-        QPushButton[objectName="export_button"]:pressed {{
+        QPushButton[variant="export"]:pressed {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                 stop:0 #ef6c00, stop:1 #e65100) !important;
             color: white !important;
@@ -551,6 +611,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_input_style(cls):
         """Get input field stylesheet."""
         return f"""
@@ -668,6 +729,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_dialog_style(cls):
         """Get dialog stylesheet."""
         return f"""
@@ -732,10 +794,11 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_table_style(cls):
         """Get table widget stylesheet."""
         return f"""
-        QTableWidget {{
+        QTableView {{
             background-color: {cls.COLORS['surface']};
             alternate-background-color: #fafafa;
             color: {cls.COLORS['text_primary']};
@@ -746,16 +809,16 @@ class ModernStyles:
             font-size: 14px;
         }}
         
-        QTableWidget::item {{
+        QTableView::item {{
             padding: 8px 12px;
             border: none;
         }}
         
-        QTableWidget::item:hover {{
+        QTableView::item:hover {{
             background-color: {cls.COLORS['hover']};
         }}
         
-        QTableWidget::item:selected {{
+        QTableView::item:selected {{
             background-color: {cls.COLORS['primary_light']};
             color: white;
         }}
@@ -776,6 +839,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_tab_widget_style(cls):
         """Get tab widget stylesheet."""
         return f"""
@@ -825,6 +889,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_splitter_style(cls):
         """Get splitter stylesheet."""
         return f"""
@@ -859,6 +924,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_scroll_bar_style(cls):
         """Get scrollbar stylesheet."""
         return f"""
@@ -920,6 +986,7 @@ class ModernStyles:
         """
     
     @classmethod
+    @_cached_style
     def get_card_style(cls):
         """Get card style for document containers."""
         return f"""
@@ -953,23 +1020,10 @@ class ModernStyles:
         """
     
     @classmethod
-    def get_complete_stylesheet(cls):
-        """Get the complete application stylesheet."""
+    @_cached_style
+    def get_tooltip_and_selection_style(cls):
+        """Get the tooltip and text selection stylesheet."""
         return f"""
-        {cls.get_main_window_style()}
-        {cls.get_menu_bar_style()}
-        {cls.get_tool_bar_style()}
-        {cls.get_status_bar_style()}
-        {cls.get_tree_widget_style()}
-        {cls.get_button_style()}
-        {cls.get_enhanced_button_styles()}
-        {cls.get_input_style()}
-        {cls.get_dialog_style()}
-        {cls.get_table_style()}
-        {cls.get_tab_widget_style()}
-        {cls.get_splitter_style()}
-        {cls.get_scroll_bar_style()}
-        
         /* Tooltips */
         QToolTip {{
             background-color: {cls.COLORS['on_surface']};
@@ -987,3 +1041,28 @@ class ModernStyles:
             color: white;
         }}
         """
+    
+    # Getters joined, in order, into the complete stylesheet
+    _STYLESHEET_PARTS = (
+        'get_main_window_style',
+        'get_menu_bar_style',
+        'get_tool_bar_style',
+        'get_status_bar_style',
+        'get_tree_widget_style',
+        'get_button_style',
+        'get_enhanced_button_styles',
+        'get_input_style',
+        'get_dialog_style',
+        'get_table_style',
+        'get_tab_widget_style',
+        'get_splitter_style',
+        'get_scroll_bar_style',
+        'get_tooltip_and_selection_style',
+    )
+    
+    @classmethod
+    @_cached_style
+    def get_complete_stylesheet(cls):
+        """Get the complete application stylesheet."""
+        return '\n'.join(getattr(cls, name)() for name in cls._STYLESHEET_PARTS)
+
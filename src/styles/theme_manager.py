@@ -6,7 +6,8 @@ application-wide styling.
 """
 
 from enum import Enum
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QObject, pyqtSignal
 from .modern_styles import ModernStyles
@@ -27,10 +28,12 @@ class ThemeManager(QObject):
         super().__init__()
         self.current_theme = ThemeType.LIGHT
         self.themes = self._initialize_themes()
+        # Theme whose stylesheet the application currently has
+        self._applied_theme = None
     
-    def _initialize_themes(self) -> Dict[ThemeType, Dict[str, str]]:
-        """Initialize all available themes."""
-        return {
+    def _initialize_themes(self) -> Dict[ThemeType, Mapping[str, str]]:
+        """Initialize all available themes as read-only palettes."""
+        themes = {
             ThemeType.LIGHT: {
                 'primary': '#1976d2',
                 'primary_light': '#42a5f5',
@@ -128,6 +131,7 @@ class ThemeManager(QObject):
                 'shadow': 'rgba(46, 125, 50, 0.1)'
             }
         }
+        return {theme: MappingProxyType(colors) for theme, colors in themes.items()}
     
     def get_current_theme(self) -> ThemeType:
         """Get the current theme."""
@@ -135,6 +139,8 @@ class ThemeManager(QObject):
     
     def set_theme(self, theme: ThemeType):
         """Set the application theme."""
+        if theme is self._applied_theme:
+            return
         if theme in self.themes:
             self.current_theme = theme
             self._apply_theme()
@@ -144,14 +150,15 @@ class ThemeManager(QObject):
         """Apply the current theme to the application."""
         colors = self.themes[self.current_theme]
         
-        # Update ModernStyles colors
-        ModernStyles.COLORS.update(colors)
+        # Swap in the theme's palette, the styles pick up its cached stylesheets
+        ModernStyles.COLORS = colors
         
         # Apply to QApplication
         app = QApplication.instance()
         if app:
             stylesheet = ModernStyles.get_complete_stylesheet()
             app.setStyleSheet(stylesheet)
+            self._applied_theme = self.current_theme
     
     def get_theme_names(self) -> list:
         """Get list of available theme names."""
@@ -5,7 +5,8 @@ from .logging_config import initialize_logging, get_logger, get_log_manager
 
 __all__ = [
     'format_bytes', 'format_number', 'format_duration', 'truncate_string',
-    'validate_json', 'validate_mongodb_query', 'escape_html', 'sanitize_filename',
+    'validate_json', 'validate_mongodb_query', 'escape_html', 'json_to_colored_html',
+    'sanitize_filename',
     'ColorGenerator', 'FontHelper', 'SystemInfo', 'SettingsManager',
     'show_error_message', 'show_info_message', 'show_warning_message',
     'JsonFormatter', 'create_backup_filename', 'ensure_directory_exists',
@@ -7,9 +7,11 @@ and helper classes used throughout the application.
 
 import json
 import re
+import html
 import hashlib
 import platform
 import psutil
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Union, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,7 +19,21 @@ import logging
 
 from PyQt5.QtCore import QSettings
 from PyQt5.QtWidgets import QMessageBox, QWidget
-from PyQt5.QtGui import QFont, QFontMetrics
+from PyQt5.QtGui import QFont, QFontMetrics, QIcon
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, falls back to the json module
+    orjson = None
+
+
+# Operators accepted by validate_mongodb_query
+MONGODB_QUERY_OPERATORS = frozenset({
+    '$eq', '$ne', '$gt', '$gte', '$lt', '$lte', '$in', '$nin',
+    '$and', '$or', '$not', '$nor', '$exists', '$type', '$regex',
+    '$where', '$all', '$elemMatch', '$size', '$mod', '$text',
+    '$search', '$language', '$caseSensitive', '$diacriticSensitive'
+})
 
 
 def format_bytes(bytes_count: int) -> str:
@@ -120,6 +136,14 @@ def validate_json(json_string: str) -> Tuple[bool, Optional[Dict], Optional[str]
     if not json_string.strip():
         return True, {}, None
     
+    if orjson is not None:
+        try:
+            return True, orjson.loads(json_string), None
+        except orjson.JSONDecodeError:
+            # Fall through to json, which also accepts NaN and big integers
+            # and provides the error message
+            pass
+    
     try:
         parsed = json.loads(json_string)
         return True, parsed, None
@@ -142,33 +166,30 @@ def validate_mongodb_query(query: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         if not isinstance(query, dict):
             return False, "Query must be a dictionary"
         
-        # Check for common MongoDB operators
-        valid_operators = {
-            '$eq', '$ne', '$gt', '$gte', '$lt', '$lte', '$in', '$nin',
-            '$and', '$or', '$not', '$nor', '$exists', '$type', '$regex',
-            '$where', '$all', '$elemMatch', '$size', '$mod', '$text',
-            '$search', '$language', '$caseSensitive', '$diacriticSensitive'
-        }
-        
-        def validate_recursive(obj):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key.startswith('$') and key not in valid_operators:
-                        return False, f"Unknown operator: {key}"
-                    if not validate_recursive(value)[0]:
-                        return validate_recursive(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    if not validate_recursive(item)[0]:
-                        return validate_recursive(item)
-            return True, None
-        
-        return validate_recursive(query)
+        error = _find_unknown_operator(query)
+        return error is None, error
         
     except Exception as e:
         return False, f"Query validation error: {str(e)}"
 
 
+def _find_unknown_operator(obj: Any) -> Optional[str]:
+    """Get an error message for the first unknown operator in a query, if any."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key.startswith('$') and key not in MONGODB_QUERY_OPERATORS:
+                return f"Unknown operator: {key}"
+            error = _find_unknown_operator(value)
+            if error is not None:
+                return error
+    elif isinstance(obj, list):
+        for item in obj:
+            error = _find_unknown_operator(item)
+            if error is not None:
+                return error
+    return None
+
+
 def escape_html(text: str) -> str:
     """
     Escape HTML special characters.
@@ -189,6 +210,125 @@ def escape_html(text: str) -> str:
     return "".join(html_escape_table.get(c, c) for c in text)
 
 
+# Inline styles for JSON tokens, matching the JsonSyntaxHighlighter colors
+JSON_HTML_STYLES = {
+    'key': 'color:#228b22;font-weight:bold',
+    'string': 'color:#8b4513',
+    'number': 'color:#0000ff',
+    'boolean': 'color:#ff1493;font-weight:bold',
+    'null': 'color:#808080;font-weight:bold',
+    'structure': 'color:#800080;font-weight:bold',
+}
+
+
+def _json_span(kind: str, text: str) -> str:
+    """Wrap already escaped text in a span styled for a JSON token kind."""
+    return f'<span style="{JSON_HTML_STYLES[kind]}">{text}</span>'
+
+
+_HTML_OPEN_BRACE = _json_span('structure', '{')
+_HTML_CLOSE_BRACE = _json_span('structure', '}')
+_HTML_OPEN_BRACKET = _json_span('structure', '[')
+_HTML_CLOSE_BRACKET = _json_span('structure', ']')
+_HTML_EMPTY_OBJECT = _json_span('structure', '{}')
+_HTML_EMPTY_ARRAY = _json_span('structure', '[]')
+_HTML_COLON = _json_span('structure', ':') + ' '
+_HTML_COMMA = _json_span('structure', ',')
+_HTML_NULL = _json_span('null', 'null')
+_HTML_TRUE = _json_span('boolean', 'true')
+_HTML_FALSE = _json_span('boolean', 'false')
+
+
+def _json_string_html(text: str) -> str:
+    """Quote, JSON-escape and HTML-escape a string."""
+    return html.escape(json.dumps(text, ensure_ascii=False), quote=False)
+
+
+def _append_json_html(value: Any, parts: List[str], level: int, indent: int) -> None:
+    """Append the colored HTML of a value to parts."""
+    append = parts.append
+    
+    if isinstance(value, dict):
+        if not value:
+            append(_HTML_EMPTY_OBJECT)
+            return
+        pad = ' ' * (indent * (level + 1))
+        append(_HTML_OPEN_BRACE)
+        append('\n')
+        last = len(value) - 1
+        for i, (key, item) in enumerate(value.items()):
+            append(pad)
+            append(_json_span('key', _json_string_html(str(key))))
+            append(_HTML_COLON)
+            _append_json_html(item, parts, level + 1, indent)
+            if i < last:
+                append(_HTML_COMMA)
+            append('\n')
+        append(' ' * (indent * level))
+        append(_HTML_CLOSE_BRACE)
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            append(_HTML_EMPTY_ARRAY)
+            return
+        pad = ' ' * (indent * (level + 1))
+        append(_HTML_OPEN_BRACKET)
+        append('\n')
+        last = len(value) - 1
+        for i, item in enumerate(value):
+            append(pad)
+            _append_json_html(item, parts, level + 1, indent)
+            if i < last:
+                append(_HTML_COMMA)
+            append('\n')
+        append(' ' * (indent * level))
+        append(_HTML_CLOSE_BRACKET)
+    elif value is None:
+        append(_HTML_NULL)
+    elif isinstance(value, bool):
+        append(_HTML_TRUE if value else _HTML_FALSE)
+    elif isinstance(value, (int, float)):
+        append(_json_span('number', json.dumps(value)))
+    else:
+        # Strings and anything else (ObjectId, datetime, ...) render as strings
+        text = value if isinstance(value, str) else str(value)
+        append(_json_span('string', _json_string_html(text)))
+
+
+def json_to_colored_html(data: Any, indent: int = 2, max_length: Optional[int] = None) -> str:
+    """
+    Render data as indented, syntax-colored JSON HTML.
+    
+    The Python object is walked directly, so no JSON text has to be
+    produced and re-parsed, and the result can be shown in any rich text
+    widget without running a syntax highlighter.
+    
+    Args:
+        data: Data to render
+        indent: Indentation level
+        max_length: If given, the HTML is cut at the last line ending before
+            this many characters and a note with the number of elided lines
+            is appended
+        
+    Returns:
+        HTML fragment wrapped in a <pre> element
+    """
+    parts = ['<pre style="margin:0">']
+    _append_json_html(data, parts, 0, indent)
+    html_text = ''.join(parts)
+    
+    if max_length is not None and len(html_text) > max_length:
+        # Every element is closed on the line it was opened, so cutting at
+        # a line ending keeps the markup balanced
+        cut = html_text.rfind('\n', 0, max_length)
+        if cut > 0:
+            elided = html_text.count('\n', cut)
+            html_text = (
+                html_text[:cut]
+                + f'\n<span style="color:#888888">… ({elided} more lines elided)</span>'
+            )
+    return html_text + '</pre>'
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename by removing/replacing invalid characters.
@@ -316,11 +456,35 @@ class SettingsManager:
     
     def __init__(self, organization: str = "MongoDBVisualizer", application: str = "Settings"):
         self.settings = QSettings(organization, application)
+        self._batch_depth = 0
+        self._sync_pending = False
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group settings writes so they reach storage in a single sync.
+        
+        Calls to sync() inside the block are deferred until it exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._sync_pending:
+                self._sync_pending = False
+                self.settings.sync()
+    
+    def _set_value(self, key: str, value: Any) -> None:
+        """Store a value, leaving the settings untouched if it is unchanged."""
+        if self.settings.contains(key) and self.settings.value(key) == value:
+            return
+        self.settings.setValue(key, value)
     
     def save_window_geometry(self, widget: QWidget) -> None:
         """Save window geometry."""
-        self.settings.setValue("geometry", widget.saveGeometry())
-        self.settings.setValue("windowState", widget.saveState() if hasattr(widget, 'saveState') else None)
+        self._set_value("geometry", widget.saveGeometry())
+        self._set_value("windowState", widget.saveState() if hasattr(widget, 'saveState') else None)
     
     def restore_window_geometry(self, widget: QWidget) -> None:
         """Restore window geometry."""
@@ -334,7 +498,7 @@ class SettingsManager:
     
     def save_splitter_state(self, splitter, name: str) -> None:
         """Save splitter state."""
-        self.settings.setValue(f"splitter_{name}", splitter.saveState())
+        self._set_value(f"splitter_{name}", splitter.saveState())
     
     def restore_splitter_state(self, splitter, name: str) -> None:
         """Restore splitter state."""
@@ -344,7 +508,7 @@ class SettingsManager:
     
     def save_value(self, key: str, value: Any) -> None:
         """Save a value to settings."""
-        self.settings.setValue(key, value)
+        self._set_value(key, value)
     
     def get_value(self, key: str, default: Any = None) -> Any:
         """Get a value from settings with proper type conversion."""
@@ -370,6 +534,9 @@ class SettingsManager:
     
     def sync(self) -> None:
         """Sync settings to storage."""
+        if self._batch_depth:
+            self._sync_pending = True
+            return
         self.settings.sync()
 
 
@@ -426,6 +593,30 @@ def show_warning_message(parent: QWidget, title: str, message: str) -> bool:
     return reply == QMessageBox.Yes
 
 
+# qtawesome icons by (name, color), created on first use since they need
+# a QApplication
+_icons: Dict[Tuple[str, str], QIcon] = {}
+
+
+def get_icon(name: str, color: str) -> QIcon:
+    """
+    Get a qtawesome icon, shared by every widget that shows it.
+    
+    Args:
+        name: qtawesome icon name, e.g. 'fa5s.plug'
+        color: Icon color
+        
+    Returns:
+        The cached icon
+    """
+    key = (name, color)
+    icon = _icons.get(key)
+    if icon is None:
+        import qtawesome as qta
+        icon = _icons[key] = qta.icon(name, color=color)
+    return icon
+
+
 class JsonFormatter:
     """JSON formatting utilities."""
     
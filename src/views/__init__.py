@@ -1,7 +1,6 @@
 """Views package for MongoDB Visualizer."""
 
 from .main_window import MainWindow
-from .connection_dialog import ConnectionDialog
 from .document_viewer import DocumentViewer
 from .syntax_highlighter import JsonSyntaxHighlighter, MongoQueryHighlighter
 
@@ -12,3 +11,11 @@ __all__ = [
     'JsonSyntaxHighlighter',
     'MongoQueryHighlighter'
 ]
+
+
+def __getattr__(name):
+    """Import ConnectionDialog on first access, it is not needed at startup."""
+    if name == 'ConnectionDialog':
+        from .connection_dialog import ConnectionDialog
+        return ConnectionDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
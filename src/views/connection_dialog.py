@@ -13,12 +13,15 @@ from PyQt5.QtWidgets import (
     QSplitter, QFrame, QMessageBox, QSizePolicy, QApplication,
     QGraphicsDropShadowEffect
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QTimer, QPoint
-from PyQt5.QtGui import QFont, QIcon, QPixmap, QPainter, QColor, QLinearGradient
-import qtawesome as qta
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, pyqtSlot, QTimer, QPoint, QTemporaryDir
+)
+from PyQt5.QtGui import (
+    QFont, QIcon, QPixmap, QPixmapCache, QPainter, QColor, QLinearGradient
+)
 
 from ..models.data_models import ConnectionInfo, ConnectionStatus
-from ..utils.helpers import show_error_message, show_info_message
+from ..utils.helpers import show_error_message, show_info_message, get_icon
 from ..utils.logging_config import get_logger
 from ..styles.modern_styles import ModernStyles
 
@@ -26,6 +29,81 @@ from ..styles.modern_styles import ModernStyles
 # CustomTitleBar class has been removed as it's no longer needed
 
 
+# Vertical gradient stops (top, bottom) for each Connect button state
+GRADIENT_BUTTON_STATES = {
+    "connect_btn_normal": ("#4caf50", "#2e7d32"),
+    "connect_btn_hover": ("#66bb6a", "#388e3c"),
+    "connect_btn_pressed": ("#2e7d32", "#1b5e20"),
+}
+
+_gradient_paths = {}
+# Per-process directory for the gradient images, removed when it is released
+_gradient_dir: Optional[QTemporaryDir] = None
+
+
+def get_gradient_image_path(key: str, height: int = 45) -> Optional[str]:
+    """
+    Get the path of a pre-rendered gradient image for a button state.
+    
+    The gradient is rasterized once into a 1px wide pixmap, kept in
+    QPixmapCache and written to a temporary directory owned by this
+    process so that stylesheets can reference it with url() instead of
+    evaluating qlineargradient on every repaint.
+    
+    Args:
+        key: Key into GRADIENT_BUTTON_STATES
+        height: Pixmap height in pixels
+        
+    Returns:
+        Path to the rendered PNG image, or None if it could not be written
+    """
+    global _gradient_dir
+    if key in _gradient_paths:
+        return _gradient_paths[key]
+    
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        top, bottom = GRADIENT_BUTTON_STATES[key]
+        pixmap = QPixmap(1, height)
+        gradient = QLinearGradient(0, 0, 0, height)
+        gradient.setColorAt(0, QColor(top))
+        gradient.setColorAt(1, QColor(bottom))
+        painter = QPainter(pixmap)
+        painter.fillRect(pixmap.rect(), gradient)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    
+    if _gradient_dir is None:
+        _gradient_dir = QTemporaryDir()
+    path = None
+    if _gradient_dir.isValid():
+        # Qt paths already use forward slashes, as QSS url() expects
+        path = _gradient_dir.filePath(f"{key}.png")
+        if not pixmap.save(path, "PNG"):
+            get_logger(__name__).warning(f"Could not write gradient image {path}")
+            path = None
+    _gradient_paths[key] = path
+    return path
+
+
+def gradient_background(key: str) -> str:
+    """
+    Get the QSS background declaration for a button state gradient.
+    
+    Args:
+        key: Key into GRADIENT_BUTTON_STATES
+        
+    Returns:
+        A url() background image, or a qlineargradient if no image is available
+    """
+    path = get_gradient_image_path(key)
+    if path is not None:
+        return f"background-image: url({path});"
+    top, bottom = GRADIENT_BUTTON_STATES[key]
+    return (f"background: qlineargradient(x1:0, y1:0, x2:0, y2:1, "
+            f"stop:0 {top}, stop:1 {bottom});")
+
+
 class ConnectionTestWorker(QThread):
     """Worker thread for testing database connections."""
     
@@ -696,8 +774,15 @@ class ConnectionDialog(QDialog):
         self.controller = controller
         self.logger = get_logger(__name__)
         self.test_worker = None
+        self.title_bar = None
         self.dragging = False
-        self.drag_position = None
+        self.drag_position = QPoint()
+        
+        # Single reusable timer for clearing the status label; restarting it
+        # cancels any pending clear from a previous test
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self.clear_status)
         
         self.init_ui()
         self.setup_connections()
@@ -711,6 +796,10 @@ class ConnectionDialog(QDialog):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setModal(True)
         
+        # Suspend repaints while the widget tree is being built so the
+        # ~15 child widgets are polished and laid out in a single pass
+        self.setUpdatesEnabled(False)
+        
         # Main layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -747,6 +836,7 @@ class ConnectionDialog(QDialog):
         main_layout = QHBoxLayout()
         main_layout.setSpacing(15)
         main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setEnabled(False)
         
         # Recent connections (left side)
         if self.controller:
@@ -811,9 +901,10 @@ class ConnectionDialog(QDialog):
         self.basic_widget = BasicConnectionWidget()
         self.tab_widget.addTab(self.basic_widget, "Basic")
         
-        # Advanced settings tab
-        self.advanced_widget = AdvancedConnectionWidget()
-        self.tab_widget.addTab(self.advanced_widget, "Advanced")
+        # Advanced settings tab (built on first selection)
+        self.advanced_widget = None
+        self.tab_widget.addTab(QWidget(), "Advanced")
+        self.tab_widget.currentChanged.connect(self._ensure_advanced_built)
         
         settings_layout.addWidget(self.tab_widget)
         main_layout.addWidget(settings_widget)
@@ -844,13 +935,22 @@ class ConnectionDialog(QDialog):
         self.status_label = QLabel("")
         self.status_label.setWordWrap(True)
         self.status_label.setMinimumHeight(25)
+        self.status_label.setObjectName("status_label")
         self.status_label.setStyleSheet("""
-            QLabel {
+            QLabel#status_label {
                 font-size: 13px;
                 padding: 5px 10px;
                 border-radius: 5px;
                 background-color: transparent;
             }
+            QLabel#status_label[status="ok"] {
+                color: green;
+                font-weight: bold;
+            }
+            QLabel#status_label[status="error"] {
+                color: red;
+                font-weight: bold;
+            }
         """)
         content_layout.addWidget(self.status_label)
         
@@ -860,7 +960,7 @@ class ConnectionDialog(QDialog):
         button_layout.setContentsMargins(0, 20, 0, 0)
         
         self.test_btn = QPushButton("Test Connection")
-        self.test_btn.setIcon(qta.icon('fa5s.vial', color='white'))
+        self.test_btn.setIcon(get_icon('fa5s.vial', 'white'))
         self.test_btn.setObjectName("test_button")
         self.test_btn.setMinimumHeight(45)
         self.test_btn.setMinimumWidth(140)
@@ -897,7 +997,7 @@ class ConnectionDialog(QDialog):
         button_layout.addStretch()
         
         self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.setIcon(qta.icon('fa5s.times', color='#666'))
+        self.cancel_btn.setIcon(get_icon('fa5s.times', '#666'))
         self.cancel_btn.setObjectName("cancel_button")
         self.cancel_btn.setMinimumHeight(45)
         self.cancel_btn.setMinimumWidth(110)
@@ -927,16 +1027,17 @@ class ConnectionDialog(QDialog):
         button_layout.addWidget(self.cancel_btn)
         
         self.connect_btn = QPushButton("Connect")
-        self.connect_btn.setIcon(qta.icon('fa5s.plug', color='white'))
-        self.connect_btn.setObjectName("connect_button")
+        self.connect_btn.setIcon(get_icon('fa5s.plug', 'white'))
+        self.connect_btn.setProperty("variant", "connect")
         self.connect_btn.setDefault(True)
         self.connect_btn.setMinimumHeight(45)
         self.connect_btn.setMinimumWidth(130)
         self.connect_btn.setToolTip("Connect to the database")
         self.connect_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4caf50, stop:1 #2e7d32);
+                background-color: #2e7d32;
+                %s
+                background-repeat: repeat-x;
                 color: white;
                 border: none;
                 padding: 12px 24px;
@@ -947,26 +1048,35 @@ class ConnectionDialog(QDialog):
                 box-shadow: 0 3px 6px rgba(76, 175, 80, 0.3);
             }
             QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66bb6a, stop:1 #388e3c);
+                %s
                 box-shadow: 0 4px 8px rgba(76, 175, 80, 0.4);
             }
             QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2e7d32, stop:1 #1b5e20);
+                %s
                 box-shadow: 0 2px 4px rgba(76, 175, 80, 0.2);
             }
             QPushButton:disabled {
                 background-color: #ccc;
+                background-image: none;
                 color: #999;
                 box-shadow: none;
             }
-        """)
+        """ % (
+            gradient_background("connect_btn_normal"),
+            gradient_background("connect_btn_hover"),
+            gradient_background("connect_btn_pressed"),
+        ))
         self.connect_btn.clicked.connect(self.accept)
         button_layout.addWidget(self.connect_btn)
         
         content_layout.addLayout(button_layout)
         layout.addWidget(content_widget)
+        
+        # Re-enable layout management and painting once everything is in place
+        main_layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
+        self.ensurePolished()
+        self.adjustSize()
     
     def setup_connections(self):
         """Setup signal connections."""
@@ -993,12 +1103,10 @@ class ConnectionDialog(QDialog):
             show_error_message(self, "Error", "No controller available for testing")
             return
         
-        # Validate form
-        if not self.validate_form():
-            return
-        
-        # Get connection info
+        # Get connection info and validate it
         connection_info = self.get_connection_info()
+        if not self.validate_form(connection_info):
+            return
         
         # Show progress
         self.show_progress("Testing connection...")
@@ -1015,15 +1123,15 @@ class ConnectionDialog(QDialog):
         
         if success:
             self.status_label.setText(f"✓ {message}")
-            self.status_label.setStyleSheet("color: green; font-weight: bold;")
+            self._set_status_state("ok")
             show_info_message(self, "Connection Test", message)
         else:
             self.status_label.setText(f"✗ {message}")
-            self.status_label.setStyleSheet("color: red; font-weight: bold;")
+            self._set_status_state("error")
             show_error_message(self, "Connection Test Failed", message)
         
-        # Clean up timer to clear status
-        QTimer.singleShot(5000, self.clear_status)
+        # Clear status after a delay
+        self._status_timer.start(5000)
     
     def show_progress(self, message: str):
         """Show progress bar and disable buttons."""
@@ -1042,11 +1150,25 @@ class ConnectionDialog(QDialog):
     def clear_status(self):
         """Clear the status label."""
         self.status_label.setText("")
-        self.status_label.setStyleSheet("")
+        self._set_status_state("")
     
-    def validate_form(self) -> bool:
-        """Validate the connection form."""
-        connection_info = self.basic_widget.get_connection_info()
+    def _set_status_state(self, state: str):
+        """Select the status label style through its 'status' property."""
+        self.status_label.setProperty("status", state)
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
+    
+    def validate_form(self, connection_info: Optional[ConnectionInfo] = None) -> bool:
+        """
+        Validate the connection form.
+        
+        Args:
+            connection_info: Already collected form values; read from the
+                basic widget when not given
+        """
+        if connection_info is None:
+            connection_info = self.basic_widget.get_connection_info()
         
         # Basic validation
         if not connection_info.host:
@@ -1070,26 +1192,41 @@ class ConnectionDialog(QDialog):
     # Window dragging functionality
     def mousePressEvent(self, event):
         """Handle mouse press for dragging the window."""
-        if hasattr(self, 'title_bar') and self.title_bar.underMouse() and event.button() == Qt.LeftButton:
+        if self.title_bar is not None and self.title_bar.underMouse() and event.button() == Qt.LeftButton:
             self.dragging = True
             self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
             event.accept()
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging the window."""
-        if hasattr(self, 'dragging') and self.dragging and event.buttons() == Qt.LeftButton:
+        if self.dragging and event.buttons() == Qt.LeftButton:
             self.move(event.globalPos() - self.drag_position)
             event.accept()
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release for dragging the window."""
-        if hasattr(self, 'dragging'):
-            self.dragging = False
+        self.dragging = False
+    
+    def _ensure_advanced_built(self, index: int):
+        """Build the advanced settings tab the first time it is selected."""
+        if index != 1 or self.advanced_widget is not None:
+            return
+        
+        self.advanced_widget = AdvancedConnectionWidget()
+        self.tab_widget.blockSignals(True)
+        placeholder = self.tab_widget.widget(1)
+        self.tab_widget.removeTab(1)
+        self.tab_widget.insertTab(1, self.advanced_widget, "Advanced")
+        self.tab_widget.setCurrentIndex(1)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
     
     def get_connection_info(self) -> ConnectionInfo:
         """Get the complete connection information."""
         connection_info = self.basic_widget.get_connection_info()
-        self.advanced_widget.apply_to_connection(connection_info)
+        # Defaults from ConnectionInfo apply until the advanced tab is opened
+        if self.advanced_widget is not None:
+            self.advanced_widget.apply_to_connection(connection_info)
         return connection_info
     
     def accept(self):
@@ -6,30 +6,325 @@ modes, query execution, and data analysis capabilities.
 """
 
 import json
-from typing import Dict, List, Any, Optional
+import functools
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTextEdit, QTableWidget,
-    QTableWidgetItem, QTreeWidget, QTreeWidgetItem, QSplitter, QGroupBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTextEdit, QTableView,
+    QTreeWidget, QTreeWidgetItem, QSplitter, QGroupBox,
     QFormLayout, QLabel, QLineEdit, QPushButton, QSpinBox, QComboBox,
     QHeaderView, QAbstractItemView, QFrame, QProgressBar, QCheckBox,
-    QMessageBox, QStyledItemDelegate
+    QMessageBox, QStyledItemDelegate, QStackedWidget
 )
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QTimer, QAbstractTableModel, QModelIndex,
+    QSignalBlocker, QObject, QRunnable, QThreadPool, QMimeData
+)
+from PyQt5 import sip
 from PyQt5.QtGui import QFont, QTextCharFormat, QColor
-import qtawesome as qta
 
 from ..models.data_models import DocumentStats, QueryInfo, QueryType
 from ..utils.helpers import (
     format_bytes, format_number, format_duration, FontHelper,
-    JsonFormatter, validate_json, validate_mongodb_query
+    JsonFormatter, validate_json, validate_mongodb_query, json_to_colored_html,
+    escape_html, get_icon
 )
 from ..utils.logging_config import get_logger
 from ..styles.modern_styles import ModernStyles
 from ..styles.style_utils import StyleUtils
 from .syntax_highlighter import JsonSyntaxHighlighter
 
+try:
+    import orjson
+except ImportError:  # Optional dependency, falls back to the json module
+    orjson = None
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to compact JSON text, using orjson when available."""
+    if orjson is not None:
+        try:
+            # Datetimes go through str() as with json, not orjson's ISO format
+            return orjson.dumps(
+                value, default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            ).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(value, default=str)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Fall through to json, which also accepts NaN and big integers
+            # and provides the error message
+            pass
+    return json.loads(text)
+
+
+# Encoder for the fixed pretty-print options used by document cards
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, default=str, ensure_ascii=False)
+
+
+def _dumps_pretty(value: Any) -> str:
+    """Serialize a value to JSON text indented by two spaces."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value, default=str,
+                option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME)
+            ).decode()
+        except TypeError:
+            pass
+    return _PRETTY_ENCODER.encode(value)
+
+
+# Type name per Python type, shared by the tree view
+_type_names: Dict[type, str] = {}
+
+
+# Monospace fonts by point size, created on first use
+_mono_fonts: Dict[int, QFont] = {}
+
+
+def _mono(size: int) -> QFont:
+    """Get a cached monospace font of the given point size."""
+    font = _mono_fonts.get(size)
+    if font is None:
+        font = _mono_fonts[size] = FontHelper.get_monospace_font(size)
+    return font
+
+
+def _type_name(value: Any) -> str:
+    """Get the display type name of a value."""
+    value_type = type(value)
+    name = _type_names.get(value_type)
+    if name is None:
+        name = _type_names[value_type] = value_type.__name__
+    return name
+
+
+# Stylesheets shared by every document card
+_STYLE_CARD_BUTTON = """
+    QPushButton {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background-color: #f5f5f5;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #e0e0e0;
+    }
+"""
+
+_STYLE_SAVE_BUTTON = """
+    QPushButton {
+        background-color: #4caf50;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+
+_STYLE_CANCEL_BUTTON = """
+    QPushButton {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #d32f2f;
+    }
+"""
+
+_STYLE_SEPARATOR = "border: none; background-color: #e0e0e0; height: 1px;"
+
+_STYLE_READONLY = """
+    QLabel {
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        background-color: #fafafa;
+        padding: 8px;
+        color: #333;
+    }
+"""
+
+_STYLE_EDITING = """
+    QTextEdit {
+        background-color: #ffffff;
+        border: 2px solid #ff9800;
+        border-radius: 4px;
+        padding: 8px;
+        color: #333;
+    }
+"""
+
+# Card stylesheets depending on the theme colors, rebuilt when they change
+_themed_card_styles: Dict[Tuple[str, ...], Tuple[str, str, str]] = {}
+
+
+def _card_styles() -> Tuple[str, str, str]:
+    """
+    Get the theme dependent card stylesheets.
+    
+    Returns:
+        Tuple of the card frame, document number and ObjectId label stylesheets
+    """
+    colors = ModernStyles.COLORS
+    key = (
+        colors['surface'], colors['border'], colors['primary'], colors['hover'],
+        colors['shadow'], colors['background'], colors['text_secondary']
+    )
+    styles = _themed_card_styles.get(key)
+    if styles is not None:
+        return styles
+    
+    surface, border, primary, hover, shadow, background, text_secondary = key
+    styles = _themed_card_styles[key] = (
+        f"""
+            QFrame {{
+                background-color: {surface};
+                border: 1px solid {border};
+                border-radius: 12px;
+                margin: 4px 0px;
+            }}
+            QFrame:hover {{
+                border-color: {primary};
+                background-color: {hover};
+                box-shadow: 0 4px 12px {shadow};
+            }}
+        """,
+        f"""
+            font-weight: bold;
+            color: {primary};
+            font-size: 14px;
+            padding: 4px 8px;
+            background-color: {background};
+            border-radius: 6px;
+        """,
+        f"""
+            color: {text_secondary};
+            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+            font-size: 12px;
+            padding: 4px 8px;
+            background-color: {background};
+            border-radius: 4px;
+        """,
+    )
+    return styles
+
+
+class FormatJobSignals(QObject):
+    """Signals emitted by a document formatting job."""
+    
+    finished = pyqtSignal(int, list, list)  # generation, formatted documents, _id labels
+
+
+class DocumentFormatJob(QRunnable):
+    """Thread pool job formatting documents for the JSON view off the UI thread."""
+    
+    def __init__(self, generation: int, documents: List[Optional[Dict[str, Any]]], formatter):
+        super().__init__()
+        self.generation = generation
+        self.documents = documents
+        self.formatter = formatter
+        self.cancelled = False
+        self.signals = FormatJobSignals()
+    
+    def run(self):
+        """Format every document unless the job gets cancelled.
+        
+        ``None`` entries (documents whose card is reused) are passed through.
+        """
+        formatted = []
+        for document in self.documents:
+            if self.cancelled:
+                return
+            formatted.append(self.formatter(document) if document is not None else None)
+        
+        # Header label text of each card, parallel to the formatted documents
+        id_labels = [
+            f"ObjectId: {document['_id']}" if document is not None and '_id' in document else None
+            for document in self.documents
+        ]
+        self.signals.finished.emit(self.generation, formatted, id_labels)
+
+
+class UpdateJobSignals(QObject):
+    """Signals emitted by a document update job."""
+    
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class DocumentUpdateJob(QRunnable):
+    """Thread pool job saving an edited document without blocking the UI."""
+    
+    def __init__(self, controller, database: str, collection: str,
+                 document_id: str, document: Dict[str, Any]):
+        super().__init__()
+        self.controller = controller
+        self.database = database
+        self.collection = collection
+        self.document_id = document_id
+        self.document = document
+        self.signals = UpdateJobSignals()
+    
+    def run(self):
+        """Perform the update and report the outcome."""
+        try:
+            success = self.controller.update_document(
+                self.database, self.collection, self.document_id, self.document
+            )
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+            return
+        self.signals.finished.emit(bool(success), "")
+
+
+class LazyTextMimeData(QMimeData):
+    """Clipboard text that is only formatted once something asks for it."""
+    
+    TEXT_FORMAT = 'text/plain'
+    
+    def __init__(self, value: Any, formatter):
+        super().__init__()
+        self.value = value
+        self.formatter = formatter
+        self._text: Optional[str] = None
+    
+    def formats(self) -> List[str]:
+        return [self.TEXT_FORMAT]
+    
+    def hasFormat(self, mime_type: str) -> bool:
+        return mime_type == self.TEXT_FORMAT
+    
+    def retrieveData(self, mime_type: str, preferred_type):
+        if mime_type != self.TEXT_FORMAT:
+            return super().retrieveData(mime_type, preferred_type)
+        if self._text is None:
+            self._text = self.formatter(self.value)
+        return self._text
+
 
 class ItemSpacingDelegate(QStyledItemDelegate):
     """Custom delegate to add spacing between items."""
@@ -47,6 +342,11 @@ class QueryWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.logger = get_logger(__name__)
+        
+        # Last successfully validated query, reused when the text is unchanged
+        self._last_query_text = None
+        self._last_parsed = None
+        
         self.init_ui()
     
     def init_ui(self):
@@ -132,14 +432,14 @@ class QueryWidget(QWidget):
         
         # Execute button
         self.execute_btn = QPushButton("Execute Query")
-        self.execute_btn.setIcon(qta.icon('fa5s.play', color='white'))
-        self.execute_btn.setObjectName("execute_button")
+        self.execute_btn.setIcon(get_icon('fa5s.play', 'white'))
+        self.execute_btn.setProperty("variant", "execute")
         self.execute_btn.clicked.connect(self.execute_query)
         self.execute_btn.setMinimumWidth(170)  # Increased minimum width for full text
         self.execute_btn.setMaximumWidth(200)  # Increased max width to prevent cutting
         self.execute_btn.setToolTip("Execute the MongoDB query")
         self.execute_btn.setStyleSheet("""
-            QPushButton[objectName="execute_button"] {
+            QPushButton[variant="execute"] {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 #9c27b0, stop:1 #6a1b9a) !important;
                 color: white !important;
@@ -152,13 +452,13 @@ class QueryWidget(QWidget):
                 min-width: 120px;
             }
             
-            QPushButton[objectName="execute_button"]:hover {
+            QPushButton[variant="execute"]:hover {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 #ba68c8, stop:1 #8e24aa) !important;
                 color: white !important;
             }
             
-            QPushButton[objectName="execute_button"]:pressed {
+            QPushButton[variant="execute"]:pressed {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 #6a1b9a, stop:1 #4a148c) !important;
                 color: white !important;
@@ -168,14 +468,14 @@ class QueryWidget(QWidget):
         
         # Clear button
         clear_btn = QPushButton("Clear")
-        clear_btn.setIcon(qta.icon('fa5s.eraser', color='white'))
-        clear_btn.setObjectName("clear_button")
+        clear_btn.setIcon(get_icon('fa5s.eraser', 'white'))
+        clear_btn.setProperty("variant", "clear")
         clear_btn.clicked.connect(self.clear_query)
         clear_btn.setMinimumWidth(100)  # Increased minimum width for full text
         clear_btn.setMaximumWidth(120)  # Increased max width to prevent cutting
         clear_btn.setToolTip("Clear the query and reset filters")
         clear_btn.setStyleSheet("""
-            QPushButton[objectName="clear_button"] {
+            QPushButton[variant="clear"] {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 #607d8b, stop:1 #37474f) !important;
                 color: white !important;
@@ -188,13 +488,13 @@ class QueryWidget(QWidget):
                 min-width: 100px;
             }
 
-            QPushButton[objectName="clear_button"]:hover {
+            QPushButton[variant="clear"]:hover {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 #78909c, stop:1 #455a64) !important;
                 color: white !important;
             }
 
-            QPushButton[objectName="clear_button"]:pressed {
+            QPushButton[variant="clear"]:pressed {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 #37474f, stop:1 #263238) !important;
                 color: white !important;
@@ -206,7 +506,7 @@ class QueryWidget(QWidget):
         
         # Query text editor (properly sized for comfortable editing)
         self.query_editor = QTextEdit()
-        self.query_editor.setFont(FontHelper.get_monospace_font(10))  # Slightly larger font
+        self.query_editor.setFont(_mono(10))  # Slightly larger font
         self.query_editor.setMinimumHeight(90)   # Increased for better visibility
         self.query_editor.setMaximumHeight(100)  # Increased max height for comfortable editing
         self.query_editor.setPlaceholderText('Enter MongoDB query (e.g., {"status": "active"})')
@@ -218,6 +518,9 @@ class QueryWidget(QWidget):
     
     def on_query_type_changed(self, query_type: str):
         """Handle query type change."""
+        # Validation rules depend on the query type
+        self._last_query_text = None
+        
         if query_type == "find":
             self.query_editor.setPlaceholderText('{"field": "value"}')
         elif query_type == "count":
@@ -232,6 +535,11 @@ class QueryWidget(QWidget):
         query_text = self.query_editor.toPlainText().strip()
         query_type = self.query_type_combo.currentText()
         
+        # Same text as the last valid query: skip parsing and validation
+        if query_text == self._last_query_text:
+            self.query_requested.emit(self._last_parsed, query_type)
+            return
+        
         if not query_text:
             query = {}
         else:
@@ -248,6 +556,8 @@ class QueryWidget(QWidget):
                 self.logger.error(f"Invalid MongoDB query: {error}")
                 return
         
+        self._last_query_text = query_text
+        self._last_parsed = query
         self.query_requested.emit(query, query_type)
     
     def clear_query(self):
@@ -265,89 +575,262 @@ class QueryWidget(QWidget):
         return self.skip_spin.value()
 
 
-class DocumentTableWidget(QTableWidget):
-    """Enhanced table widget for document display."""
+class DocumentsModel(QAbstractTableModel):
+    """
+    Table model exposing a list of documents as rows and their fields as columns.
+    
+    Cell text is produced lazily in data(), so only the cells the view
+    actually paints are ever formatted. Values are stored column-major
+    (one list per field) so a cell lookup is two list indexes.
+    """
+    
+    # Number of dict/list cell texts kept in the cell cache
+    CELL_CACHE_SIZE = 4096
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_count = 0
+        self._fields: List[str] = []
+        self._columns: List[List[Any]] = []
+        self.fields_sampled = False
+        # JSON text of dict/list cell values by id(); the values are held by
+        # _columns, so an id cannot be reused while its entry is cached
+        self._cell_cache: "OrderedDict[int, str]" = OrderedDict()
+    
+    def set_documents(self, documents: List[Dict[str, Any]], sample_size: int = 200):
+        """
+        Replace the model contents with a new list of documents.
+        
+        Args:
+            documents: Documents to display
+            sample_size: When there are more than twice this many documents,
+                columns are inferred from the first and last sample_size
+                documents only
+        """
+        self.beginResetModel()
+        self._row_count = len(documents)
+        self.fields_sampled = len(documents) > sample_size * 2
+        if self.fields_sampled:
+            sample = documents[:sample_size] + documents[-sample_size:]
+        else:
+            sample = documents
+        self._fields = self._collect_fields(sample)
+        self._columns = [[doc.get(field, '') for doc in documents] for field in self._fields]
+        self._cell_cache.clear()
+        self.endResetModel()
+    
+    def append_documents(self, documents: List[Dict[str, Any]]) -> bool:
+        """
+        Append rows for documents after the current ones.
+        
+        Args:
+            documents: Documents to append
+            
+        Returns:
+            False, without changing the model, if the documents have fields
+            that have no column yet
+        """
+        known = set(self._fields)
+        if any(key not in known for doc in documents for key in doc):
+            return False
+        if not documents:
+            return True
+        
+        self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + len(documents) - 1)
+        for field, values in zip(self._fields, self._columns):
+            values.extend(doc.get(field, '') for doc in documents)
+        self._row_count += len(documents)
+        self.endInsertRows()
+        return True
+    
+    @staticmethod
+    def _collect_fields(documents: List[Dict[str, Any]]) -> List[str]:
+        """
+        Get the union of field names over all documents.
+        
+        When every document has the same keys the first document's field
+        order is kept as is; otherwise the names are sorted.
+        """
+        if not documents:
+            return []
+        
+        fields = list(dict.fromkeys(
+            itertools.chain.from_iterable(doc.keys() for doc in documents)
+        ))
+        first_len = len(documents[0])
+        if len(fields) == first_len and all(len(doc) == first_len for doc in documents):
+            return fields
+        return sorted(fields)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._fields)
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._fields[section]
+        return str(section + 1)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == Qt.DisplayRole:
+            # Long values are elided by the view when painted
+            return self._format_cell(self._columns[index.column()][index.row()])
+        
+        if role == Qt.ToolTipRole:
+            return str(self._columns[index.column()][index.row()])
+        
+        return None
+    
+    def _format_cell(self, value: Any) -> str:
+        """Format a value for a table cell, caching the JSON text of containers."""
+        if value is None:
+            return 'null'
+        if not isinstance(value, (dict, list)):
+            return str(value)
+        
+        key = id(value)
+        text = self._cell_cache.get(key)
+        if text is not None:
+            self._cell_cache.move_to_end(key)
+            return text
+        
+        text = _dumps(value)
+        self._cell_cache[key] = text
+        if len(self._cell_cache) > self.CELL_CACHE_SIZE:
+            self._cell_cache.popitem(last=False)
+        return text
+    
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """Sort documents by the string form of the given field."""
+        if not 0 <= column < len(self._fields):
+            return
+        
+        keys = [str(value) for value in self._columns[column]]
+        self.layoutAboutToBeChanged.emit()
+        rows = sorted(
+            range(self._row_count),
+            key=keys.__getitem__,
+            reverse=order == Qt.DescendingOrder
+        )
+        self._columns = [[values[row] for row in rows] for values in self._columns]
+        
+        # Move selection, current index and editors along with their documents
+        new_rows = [0] * self._row_count
+        for new_row, old_row in enumerate(rows):
+            new_rows[old_row] = new_row
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [
+            self.index(new_rows[index.row()], index.column()) for index in old_indexes
+        ])
+        self.layoutChanged.emit()
+
+
+class DocumentTableWidget(QTableView):
+    """Enhanced table view for document display."""
+    
+    # Number of rows sampled when sizing columns to their contents
+    RESIZE_SAMPLE_ROWS = 200
     
     def __init__(self):
         super().__init__()
         self.logger = get_logger(__name__)
+        self.documents_model = DocumentsModel(self)
+        self.setModel(self.documents_model)
         self.init_ui()
     
     def init_ui(self):
-        """Initialize the table widget."""
+        """Initialize the table view."""
         self.setSortingEnabled(True)
         self.setAlternatingRowColors(True)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setTextElideMode(Qt.ElideRight)
+        self.setWordWrap(False)
         
         # Configure headers
         horizontal_header = self.horizontalHeader()
         horizontal_header.setStretchLastSection(True)
         horizontal_header.setSectionResizeMode(QHeaderView.Interactive)
+        horizontal_header.setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
         
         vertical_header = self.verticalHeader()
         vertical_header.setVisible(True)
         vertical_header.setDefaultSectionSize(25)
     
-    def populate_documents(self, documents: List[Dict[str, Any]]):
-        """Populate the table with documents."""
-        if not documents:
-            self.setRowCount(0)
-            self.setColumnCount(0)
-            return
+    def populate_documents(self, documents: List[Dict[str, Any]], sample_size: int = 200):
+        """
+        Populate the table with documents.
         
+        Args:
+            documents: Documents to display
+            sample_size: Number of documents from each end of the list used to
+                infer the columns of large result sets
+        """
+        # Repaint once after the reset and column sizing instead of per change
+        self.setUpdatesEnabled(False)
         try:
-            # Get all unique field names
-            all_fields = set()
-            for doc in documents:
-                all_fields.update(doc.keys())
-            
-            field_list = sorted(list(all_fields))
-            
-            # Setup table dimensions
-            self.setRowCount(len(documents))
-            self.setColumnCount(len(field_list))
-            self.setHorizontalHeaderLabels(field_list)
-            
-            # Populate data
-            for row, doc in enumerate(documents):
-                for col, field in enumerate(field_list):
-                    value = doc.get(field, '')
-                    
-                    # Convert complex values to JSON string
-                    if isinstance(value, (dict, list)):
-                        display_value = json.dumps(value, default=str)
-                    elif value is None:
-                        display_value = 'null'
-                    else:
-                        display_value = str(value)
-                    
-                    # Truncate very long values
-                    if len(display_value) > 100:
-                        display_value = display_value[:97] + "..."
-                    
-                    item = QTableWidgetItem(display_value)
-                    item.setToolTip(str(value))
-                    self.setItem(row, col, item)
+            self.documents_model.set_documents(documents or [], sample_size)
+            if self.documents_model.fields_sampled:
+                self.setToolTip("⚠️ Columns inferred from a sample of the documents")
+                self.logger.info(
+                    f"Table columns inferred from {sample_size * 2} of {len(documents)} documents"
+                )
+            else:
+                self.setToolTip("")
+            if not documents:
+                return
             
-            # Auto-resize columns
+            # Auto-resize columns (sampled, see RESIZE_SAMPLE_ROWS)
             self.resizeColumnsToContents()
             
             # Limit column width
-            for col in range(self.columnCount()):
+            for col in range(self.documents_model.columnCount()):
                 width = self.columnWidth(col)
                 if width > 200:
                     self.setColumnWidth(col, 200)
                     
         except Exception as e:
             self.logger.error(f"Error populating table: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def append_documents(self, all_documents: List[Dict[str, Any]],
+                         new_documents: List[Dict[str, Any]]):
+        """
+        Add rows for newly loaded documents.
+        
+        Args:
+            all_documents: Every displayed document, including the new ones
+            new_documents: Documents appended at the end
+        """
+        if not self.documents_model.append_documents(new_documents):
+            # New fields need new columns, rebuild the table
+            self.populate_documents(all_documents)
 
 
 class DocumentTreeWidget(QTreeWidget):
-    """Tree widget for hierarchical document display."""
+    """
+    Tree widget for hierarchical document display.
+    
+    Child items are created on demand: a node holding a dict or list only
+    gets a placeholder child until it is expanded for the first time.
+    """
+    
+    # Data role marking the placeholder child of a not yet populated node
+    LAZY_ROLE = Qt.UserRole + 1
     
     def __init__(self):
         super().__init__()
+        # Value of each not yet populated node. Kept out of the item data,
+        # where PyQt would convert dicts to sorted QVariantMap copies.
+        self._lazy_values: Dict[QTreeWidgetItem, Any] = {}
         self.init_ui()
     
     def init_ui(self):
@@ -355,6 +838,7 @@ class DocumentTreeWidget(QTreeWidget):
         self.setHeaderLabels(["Field", "Value", "Type"])
         self.setAlternatingRowColors(True)
         self.setRootIsDecorated(True)
+        self.itemExpanded.connect(self._on_item_expanded)
         
         # Configure headers
         header = self.header()
@@ -365,52 +849,103 @@ class DocumentTreeWidget(QTreeWidget):
     
     def populate_documents(self, documents: List[Dict[str, Any]]):
         """Populate the tree with documents."""
-        self.clear()
-        
-        if not documents:
-            return
-        
-        for i, doc in enumerate(documents):
-            doc_item = QTreeWidgetItem(self)
-            doc_item.setText(0, f"Document {i + 1}")
-            doc_item.setText(1, f"{len(doc)} fields")
-            doc_item.setText(2, "object")
+        self.setUpdatesEnabled(False)
+        try:
+            # No slots need to see the individual insertions
+            blocker = QSignalBlocker(self)
+            self.clear()
             
-            self.populate_object(doc_item, doc)
+            if not documents:
+                return
+            
+            doc_items = []
+            for i, doc in enumerate(documents):
+                doc_item = QTreeWidgetItem()
+                doc_item.setText(0, f"Document {i + 1}")
+                doc_item.setText(1, f"{len(doc)} fields")
+                doc_item.setText(2, "object")
+                self._set_lazy(doc_item, doc)
+                doc_items.append(doc_item)
+            self.addTopLevelItems(doc_items)
+            blocker.unblock()
+            
+            # Only the first level of each document is materialized here;
+            # this relies on itemExpanded, so signals must be unblocked
+            self.expandToDepth(0)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+    
+    def clear(self):
+        """Remove all items and the values of unpopulated nodes."""
+        self._lazy_values.clear()
+        super().clear()
+    
+    def _set_lazy(self, item: QTreeWidgetItem, obj: Any):
+        """Attach a value to an item and give it a placeholder child."""
+        self._lazy_values[item] = obj
+        placeholder = QTreeWidgetItem(item)
+        placeholder.setData(0, self.LAZY_ROLE, True)
+    
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """Replace the placeholder child with real children on first expand."""
+        if item.childCount() != 1 or not item.child(0).data(0, self.LAZY_ROLE):
+            return
         
-        self.expandToDepth(1)
+        item.takeChild(0)
+        self.populate_object(item, self._lazy_values.pop(item))
     
     def populate_object(self, parent_item: QTreeWidgetItem, obj: Any, key: str = None):
-        """Recursively populate object in tree."""
-        if isinstance(obj, dict):
-            for field_key, field_value in obj.items():
-                field_item = QTreeWidgetItem(parent_item)
-                field_item.setText(0, str(field_key))
-                field_item.setText(2, type(field_value).__name__)
-                
-                if isinstance(field_value, (dict, list)):
-                    if isinstance(field_value, dict):
-                        field_item.setText(1, f"{len(field_value)} fields")
-                    else:
-                        field_item.setText(1, f"{len(field_value)} items")
-                    self.populate_object(field_item, field_value, field_key)
-                else:
-                    field_item.setText(1, str(field_value))
-        
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                item_node = QTreeWidgetItem(parent_item)
-                item_node.setText(0, f"[{i}]")
-                item_node.setText(2, type(item).__name__)
-                
-                if isinstance(item, (dict, list)):
-                    if isinstance(item, dict):
-                        item_node.setText(1, f"{len(item)} fields")
-                    else:
-                        item_node.setText(1, f"{len(item)} items")
-                    self.populate_object(item_node, item)
-                else:
-                    item_node.setText(1, str(item))
+        """Populate one level of an object in the tree."""
+        handler = self._get_child_handler(type(obj))
+        if handler is not None:
+            handler(self, parent_item, obj)
+    
+    def _populate_dict(self, parent_item: QTreeWidgetItem, obj: Dict[str, Any]):
+        """Add an item per field of a dict."""
+        for field_key, field_value in obj.items():
+            self._add_value_item(parent_item, str(field_key), field_value)
+    
+    def _populate_list(self, parent_item: QTreeWidgetItem, obj: List[Any]):
+        """Add an item per element of a list."""
+        for i, item in enumerate(obj):
+            self._add_value_item(parent_item, f"[{i}]", item)
+    
+    # Child handler per value type; None marks a leaf type. Types not listed
+    # yet (e.g. dict subclasses) are resolved once in _get_child_handler.
+    _child_handlers = {dict: _populate_dict, list: _populate_list}
+    
+    # Unit shown next to the size of a container value
+    _container_units = {_populate_dict: "fields", _populate_list: "items"}
+    
+    @classmethod
+    def _get_child_handler(cls, value_type: type):
+        """Get the child handler for a value type, or None for leaf values."""
+        try:
+            return cls._child_handlers[value_type]
+        except KeyError:
+            if issubclass(value_type, dict):
+                handler = cls._populate_dict
+            elif issubclass(value_type, list):
+                handler = cls._populate_list
+            else:
+                handler = None
+            cls._child_handlers[value_type] = handler
+            return handler
+    
+    def _add_value_item(self, parent_item: QTreeWidgetItem, label: str, value: Any):
+        """Add an item showing a single value below parent_item."""
+        item = QTreeWidgetItem(parent_item)
+        item.setText(0, label)
+        item.setText(2, _type_name(value))
+        
+        handler = self._get_child_handler(type(value))
+        if handler is None:
+            item.setText(1, str(value))
+        else:
+            item.setText(1, f"{len(value)} {self._container_units[handler]}")
+            if value:
+                self._set_lazy(item, value)
 
 
 class StatisticsWidget(QWidget):
@@ -427,7 +962,7 @@ class StatisticsWidget(QWidget):
         # Statistics text area
         self.stats_text = QTextEdit()
         self.stats_text.setReadOnly(True)
-        self.stats_text.setFont(FontHelper.get_monospace_font(9))
+        self.stats_text.setFont(_mono(9))
         layout.addWidget(self.stats_text)
     
     def display_statistics(self, stats: DocumentStats):
@@ -437,44 +972,350 @@ class StatisticsWidget(QWidget):
     
     def format_statistics(self, stats: DocumentStats) -> str:
         """Format statistics for display."""
-        text = "Document Collection Statistics\n"
-        text += "=" * 50 + "\n\n"
+        parts = []
+        append = parts.append
+        
+        append("Document Collection Statistics")
+        append("=" * 50)
+        append("")
         
         # Basic info
-        text += f"Total Documents: {format_number(stats.total_count)}\n"
-        text += f"Unique Fields: {len(stats.unique_fields)}\n"
-        text += f"Common Fields: {len(stats.common_fields)}\n"
+        append(f"Total Documents: {format_number(stats.total_count)}")
+        append(f"Unique Fields: {len(stats.unique_fields)}")
+        append(f"Common Fields: {len(stats.common_fields)}")
         if stats.avg_document_size > 0:
-            text += f"Average Document Size: {format_bytes(int(stats.avg_document_size))}\n"
-        text += "\n"
+            append(f"Average Document Size: {format_bytes(int(stats.avg_document_size))}")
+        append("")
         
         # Field frequency
-        text += "Field Frequency:\n"
-        text += "-" * 30 + "\n"
-        most_common = stats.get_most_common_fields(20)
-        for field, count in most_common:
-            percentage = stats.get_field_coverage(field)
-            text += f"{field:25} {count:>6} ({percentage:>5.1f}%)\n"
-        text += "\n"
+        append("Field Frequency:")
+        append("-" * 30)
+        total_count = stats.total_count
+        for field, count in stats.get_most_common_fields(20):
+            percentage = count / total_count * 100 if total_count else 0.0
+            append(f"{field:25} {count:>6} ({percentage:>5.1f}%)")
+        append("")
         
         # Field types
-        text += "Field Types:\n"
-        text += "-" * 30 + "\n"
-        for field in sorted(stats.field_types.keys())[:20]:
-            text += f"{field}:\n"
-            for type_name, count in stats.field_types[field].items():
-                text += f"  {type_name:15} {count:>6}\n"
-        text += "\n"
+        append("Field Types:")
+        append("-" * 30)
+        field_types = stats.field_types
+        top_fields = heapq.nsmallest(20, field_types)
+        for field in top_fields:
+            append(f"{field}:")
+            for type_name, count in field_types[field].items():
+                append(f"  {type_name:15} {count:>6}")
+        append("")
         
         # Sample values
-        text += "Sample Values:\n"
-        text += "-" * 30 + "\n"
-        for field in sorted(stats.sample_values.keys())[:15]:
-            values = stats.sample_values[field][:5]
+        append("Sample Values:")
+        append("-" * 30)
+        sample_values = stats.sample_values
+        for field in heapq.nsmallest(15, sample_values):
+            values = sample_values[field][:5]
             if values:
-                text += f"{field:20} {', '.join(values)}\n"
+                append(f"{field:20} {', '.join(values)}")
         
-        return text
+        append("")
+        return "\n".join(parts)
+
+
+class DocumentCard(QFrame):
+    """
+    MongoDB Compass-style card showing one document in the JSON view.
+    
+    The document is shown read-only as pre-colored HTML in a label; the
+    editor and the save/cancel buttons are only built the first time the
+    card enters edit mode.
+    """
+    
+    def __init__(self, viewer: "DocumentViewer", document: Dict[str, Any], index: int,
+                 formatted_html: Optional[str] = None, id_label: Optional[str] = None):
+        super().__init__()
+        self.viewer = viewer
+        self.original_document = document
+        self.is_editing = False
+        self.content_edit: Optional[QTextEdit] = None
+        self.highlighter: Optional[JsonSyntaxHighlighter] = None
+        self.update_job: Optional[DocumentUpdateJob] = None
+        self.card_key: Optional[str] = None
+        self.save_btn: Optional[QPushButton] = None
+        self.cancel_btn: Optional[QPushButton] = None
+        self.init_ui(index, formatted_html, id_label)
+    
+    def init_ui(self, index: int, formatted_html: Optional[str], id_label: Optional[str]):
+        """Build the card widgets."""
+        document = self.original_document
+        card_style, number_style, id_style = _card_styles()
+        
+        # Main card frame
+        self.setStyleSheet(card_style)
+        self.setContentsMargins(0, 0, 0, 0)
+        
+        self.card_layout = QVBoxLayout(self)
+        self.card_layout.setContentsMargins(15, 12, 15, 12)
+        self.card_layout.setSpacing(8)
+        
+        # Header with document index and _id
+        header_layout = QHBoxLayout()
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Document number
+        self.doc_number = QLabel(f"Document {index + 1}")
+        self.doc_number.setStyleSheet(number_style)
+        header_layout.addWidget(self.doc_number)
+        
+        # Object ID (if present)
+        if '_id' in document:
+            if id_label is None:
+                id_label = f"ObjectId: {document['_id']}"
+            id_widget = QLabel(id_label)
+            id_widget.setStyleSheet(id_style)
+            header_layout.addWidget(id_widget)
+        
+        header_layout.addStretch()
+        
+        # Header buttons, one page while viewing and one while editing
+        self.button_stack = QStackedWidget()
+        view_buttons = QWidget()
+        view_layout = QHBoxLayout(view_buttons)
+        view_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Copy button
+        self.copy_btn = QPushButton()
+        self.copy_btn.setIcon(get_icon('fa5s.copy', '#666'))
+        self.copy_btn.setToolTip("Copy document to clipboard")
+        self.copy_btn.setFixedSize(24, 24)
+        self.copy_btn.setStyleSheet(_STYLE_CARD_BUTTON)
+        self.copy_btn.clicked.connect(self.copy_to_clipboard)
+        view_layout.addWidget(self.copy_btn)
+        
+        # Edit button
+        self.edit_btn = QPushButton()
+        self.edit_btn.setIcon(get_icon('fa5s.edit', '#666'))
+        self.edit_btn.setToolTip("Edit document")
+        self.edit_btn.setFixedSize(24, 24)
+        self.edit_btn.setStyleSheet(_STYLE_CARD_BUTTON)
+        self.edit_btn.clicked.connect(self.toggle_edit_mode)
+        view_layout.addWidget(self.edit_btn)
+        
+        # Expand/Collapse button
+        self.expand_btn = QPushButton()
+        self.expand_btn.setIcon(get_icon('fa5s.chevron-up', '#666'))
+        self.expand_btn.setToolTip("Collapse document")
+        self.expand_btn.setFixedSize(24, 24)
+        self.expand_btn.setStyleSheet(_STYLE_CARD_BUTTON)
+        self.expand_btn.clicked.connect(self.toggle_expand)
+        view_layout.addWidget(self.expand_btn)
+        
+        # The save/cancel page is added when the card is first edited
+        self.button_stack.addWidget(view_buttons)
+        header_layout.addWidget(self.button_stack)
+        
+        self.card_layout.addLayout(header_layout)
+        
+        # Separator line
+        separator = QFrame()
+        separator.setFrameShape(QFrame.HLine)
+        separator.setStyleSheet(_STYLE_SEPARATOR)
+        self.card_layout.addWidget(separator)
+        
+        # Document content, shown read-only as pre-colored HTML in a label
+        self.content_label = QLabel()
+        self.content_label.setTextFormat(Qt.RichText)
+        self.content_label.setTextInteractionFlags(
+            Qt.TextSelectableByMouse | Qt.LinksAccessibleByMouse
+        )
+        self.content_label.setWordWrap(True)
+        self.content_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.content_label.setFont(_mono(11))
+        self.content_label.setMinimumHeight(60)
+        self.content_label.setMaximumHeight(400)  # Prevent huge documents
+        self.content_label.setStyleSheet(_STYLE_READONLY)
+        if formatted_html is None:
+            formatted_html = self.viewer.format_document_html(document)
+        self.content_label.setText(formatted_html)
+        self.card_layout.addWidget(self.content_label)
+    
+    def copy_to_clipboard(self):
+        """Copy the card's document to the clipboard."""
+        self.viewer.copy_document_to_clipboard(self.original_document)
+    
+    def toggle_expand(self):
+        """Show or hide the document content."""
+        if self.content_label.isVisible():
+            self.content_label.hide()
+            self.expand_btn.setIcon(get_icon('fa5s.chevron-down', '#666'))
+            self.expand_btn.setToolTip("Expand document")
+        else:
+            self.content_label.show()
+            self.expand_btn.setIcon(get_icon('fa5s.chevron-up', '#666'))
+            self.expand_btn.setToolTip("Collapse document")
+    
+    def create_edit_buttons(self):
+        """Build the save/cancel page of the header buttons."""
+        edit_actions_widget = QWidget()
+        edit_actions_layout = QHBoxLayout(edit_actions_widget)
+        edit_actions_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Save button
+        self.save_btn = QPushButton("Save")
+        self.save_btn.setIcon(get_icon('fa5s.save', 'white'))
+        self.save_btn.setStyleSheet(_STYLE_SAVE_BUTTON)
+        self.save_btn.clicked.connect(self.save_document)
+        edit_actions_layout.addWidget(self.save_btn)
+        
+        # Cancel button  
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setIcon(get_icon('fa5s.times', 'white'))
+        self.cancel_btn.setStyleSheet(_STYLE_CANCEL_BUTTON)
+        self.cancel_btn.clicked.connect(self.cancel_edit)
+        edit_actions_layout.addWidget(self.cancel_btn)
+        
+        self.button_stack.addWidget(edit_actions_widget)
+    
+    def create_content_edit(self) -> QTextEdit:
+        """Build the editor, placed right after the read-only content."""
+        content_edit = QTextEdit()
+        content_edit.setFont(_mono(11))
+        
+        # Remove scrollbars and auto-size to content
+        content_edit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        content_edit.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        content_edit.setLineWrapMode(QTextEdit.WidgetWidth)
+        content_edit.setStyleSheet(_STYLE_EDITING)
+        
+        # Auto-resize to content height
+        content_edit.document().documentLayout().documentSizeChanged.connect(
+            self._on_edit_size_changed
+        )
+        self.card_layout.insertWidget(
+            self.card_layout.indexOf(self.content_label) + 1, content_edit
+        )
+        return content_edit
+    
+    def _on_edit_size_changed(self, size):
+        """Queue the editor for resizing when its content size changes."""
+        self.viewer._schedule_resize(self.content_edit)
+    
+    def toggle_edit_mode(self):
+        """Enter edit mode with plain text and live highlighting."""
+        if self.is_editing:
+            # Already in edit mode, this shouldn't happen as edit button is hidden
+            return
+        
+        # The editor and its buttons are only built the first time
+        if self.content_edit is None:
+            self.create_edit_buttons()
+            self.content_edit = self.create_content_edit()
+        content_edit = self.content_edit
+        content_edit.setPlainText(
+            self.viewer.format_document_for_display(self.original_document)
+        )
+        content_edit.measured_for = None
+        self.highlighter = JsonSyntaxHighlighter(content_edit.document())
+        self.is_editing = True
+        
+        self._show_mode(True)
+        self.viewer._schedule_resize(content_edit)
+    
+    def _show_mode(self, editing: bool):
+        """Swap content and header buttons for edit or view mode in one repaint."""
+        if editing:
+            hidden, shown = self.content_label, self.content_edit
+        else:
+            hidden, shown = self.content_edit, self.content_label
+        
+        self.setUpdatesEnabled(False)
+        hidden.hide()
+        shown.show()
+        self.button_stack.setCurrentIndex(int(editing))
+        self.setUpdatesEnabled(True)
+    
+    def save_document(self):
+        """Validate the edited JSON and save it in the thread pool."""
+        viewer = self.viewer
+        try:
+            # Parse the JSON to validate it
+            new_content = self.content_edit.toPlainText()
+            parsed_doc = _loads(new_content)
+            
+            # Get the document ID from the original document
+            original_doc = self.original_document
+            if '_id' not in original_doc:
+                QMessageBox.warning(viewer, "Error", "Cannot update document: No _id field found")
+                return
+            
+            document_id = str(original_doc['_id'])
+            
+            # Check if we have database and collection info
+            if not viewer.current_database or not viewer.current_collection:
+                QMessageBox.warning(viewer, "Error", "No database or collection selected")
+                return
+            
+            # Perform the update through the controller in the thread pool;
+            # the card stays in edit mode until the result comes back
+            job = DocumentUpdateJob(
+                viewer.controller,
+                viewer.current_database,
+                viewer.current_collection,
+                document_id,
+                parsed_doc
+            )
+            # Not a bound method, so the result is reported even if the card
+            # was deleted meanwhile
+            job.signals.finished.connect(
+                functools.partial(self._on_document_saved, original_doc, parsed_doc)
+            )
+            self.update_job = job
+            self.save_btn.setEnabled(False)
+            self.cancel_btn.setEnabled(False)
+            QThreadPool.globalInstance().start(job)
+            
+        except json.JSONDecodeError as e:
+            QMessageBox.warning(viewer, "Invalid JSON", f"Invalid JSON format:\n{str(e)}")
+        except Exception as e:
+            QMessageBox.critical(viewer, "Error", f"Failed to save document:\n{str(e)}")
+    
+    def _on_document_saved(self, original_doc: Dict[str, Any], parsed_doc: Dict[str, Any],
+                           success: bool, error: str):
+        """Leave edit mode and report the outcome of a save."""
+        viewer = self.viewer
+        # The card may have been removed by a new query while saving
+        card_alive = not sip.isdeleted(self)
+        if card_alive:
+            self.update_job = None
+            self.save_btn.setEnabled(True)
+            self.cancel_btn.setEnabled(True)
+        
+        if error:
+            QMessageBox.critical(viewer, "Error", f"Failed to save document:\n{error}")
+        elif success:
+            # Update the stored original document
+            viewer._fmt_cache.pop(('display', id(original_doc)), None)
+            viewer._fmt_cache.pop(('clipboard', id(original_doc)), None)
+            if card_alive:
+                self.original_document = parsed_doc.copy()
+                if '_id' not in self.original_document:
+                    self.original_document['_id'] = original_doc['_id']
+                self.exit_edit_mode()
+            QMessageBox.information(viewer, "Success", "Document updated successfully!")
+        else:
+            QMessageBox.warning(viewer, "Update Failed", "Document could not be updated. It may have been deleted or modified by another user.")
+    
+    def cancel_edit(self):
+        """Discard the edit; the original content is restored."""
+        self.exit_edit_mode()
+    
+    def exit_edit_mode(self):
+        """Exit edit mode and go back to the pre-colored HTML label."""
+        self.is_editing = False
+        if self.highlighter is not None:
+            self.highlighter.setDocument(None)
+            self.highlighter = None
+        self.content_label.setText(self.viewer.format_document_html(self.original_document))
+        
+        self._show_mode(False)
 
 
 class DocumentViewer(QWidget):
@@ -484,6 +1325,23 @@ class DocumentViewer(QWidget):
     Provides JSON view, table view, tree view, and statistics for MongoDB documents.
     """
     
+    # Number of document cards built per page in the Documents tab
+    JSON_PAGE_SIZE = 50
+    
+    # Number of cards built per event loop iteration while a page renders
+    JSON_RENDER_CHUNK = 10
+    
+    # Read-only card content is cut to this many HTML characters; cards are
+    # at most 400px high, so the rest could not be seen anyway. The editor and
+    # clipboard copies always get the full document.
+    CARD_HTML_LIMIT = 64 * 1024
+    
+    # Number of formatted document texts kept for edit mode and copying
+    FORMAT_CACHE_SIZE = 256
+    
+    # Maximum number of tree items created when the tree view is populated
+    TREE_NODE_BUDGET = 5000
+    
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
@@ -492,6 +1350,38 @@ class DocumentViewer(QWidget):
         self.current_stats = None
         self.current_database = None
         self.current_collection = None
+        self._json_documents = []
+        self._json_rendered = 0
+        self._json_page_end = 0
+        self.render_progress = None
+        self.summary_label = None
+        # Set while the next page of documents is requested from the server
+        self._fetching_more = False
+        
+        # Formatted card content from the active background formatting job
+        self._formatted_html: Optional[List[Optional[str]]] = None
+        self._id_labels: Optional[List[Optional[str]]] = None
+        self._format_generation = 0
+        self._active_format_job: Optional[DocumentFormatJob] = None
+        
+        # Most recently used formatted text per (kind, id(document)), with the
+        # document kept alongside so a recycled id() never returns another
+        # document's text
+        self._fmt_cache: "OrderedDict[Tuple[str, int], Tuple[Dict[str, Any], str]]" = OrderedDict()
+        
+        # Cards kept from the previous result, keyed by stringified _id
+        self._card_widgets: Dict[str, QFrame] = {}
+        
+        # Drives chunked card rendering so the UI stays responsive
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self._render_next_chunk)
+        
+        # Text edits waiting for a height update, flushed by one timer
+        self._resize_pending = set()
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._flush_resizes)
         
         self.init_ui()
         self.setup_connections()
@@ -650,7 +1540,23 @@ class DocumentViewer(QWidget):
         self.documents_layout.addStretch()
         
         scroll_area.setWidget(self.documents_container)
-        self.tab_widget.addTab(scroll_area, "Documents")
+        
+        # Cards are built one page at a time as the user scrolls towards the end
+        scroll_area.verticalScrollBar().valueChanged.connect(self._on_json_scrolled)
+        
+        # Appends the next page when the cards don't fill the viewport yet
+        self.load_more_btn = QPushButton("Show more documents")
+        self.load_more_btn.setIcon(get_icon('fa5s.angle-double-down', '#666'))
+        self.load_more_btn.clicked.connect(self.show_more_documents)
+        self.load_more_btn.hide()
+        
+        json_tab = QWidget()
+        json_tab_layout = QVBox(json_tab)
+        json_tab_layout.setContentsMargins(0, 0, 0, 0)
+        json_tab_layout.setSpacing(4)
+        json_tab_layout.addWidget(scroll_area)
+        json_tab_layout.addWidget(self.load_more_btn)
+        self.tab_widget.addTab(json_tab, "Documents")
         
         # Store reference for updates
         self.json_scroll_area = scroll_area
@@ -689,43 +1595,204 @@ class DocumentViewer(QWidget):
         self.current_stats = stats
         self.current_database = database
         self.current_collection = collection
+        self._fetching_more = False
         
         # Update header
         self.collection_label.setText(f"{database}.{collection}")
-        document_count = len(documents)
+        self._update_count_label()
+        
+        # Update all views, repainting the tabs once at the end
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self.update_json_view(documents)
+            self.update_table_view(documents)
+            self.update_tree_view(documents)
+            self.update_statistics_view(stats)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+        
+        self.logger.info(f"Displayed {len(documents)} documents from {database}.{collection}")
+    
+    def append_documents(self, database: str, collection: str, documents: List[Dict[str, Any]]):
+        """
+        Append the next page of documents loaded from the server.
+        
+        Args:
+            database: Database name
+            collection: Collection name
+            documents: Documents following the ones already displayed
+        """
+        self._fetching_more = False
+        if database != self.current_database or collection != self.current_collection:
+            return  # Page of a collection that is no longer shown
+        if not documents:
+            self._update_load_more_button()
+            return
+        
+        start = len(self.current_documents)
+        self.current_documents = self.current_documents + documents
+        self._update_count_label()
+        self.table_widget.append_documents(self.current_documents, documents)
+        
+        # Format only the new documents; the cards before them are built already
+        self._cancel_format_job()
+        self._json_documents = self.current_documents
+        count = len(self._json_documents)
+        if self.summary_label is not None:
+            count_text = "document" if count == 1 else "documents"
+            self.summary_label.setText(f"Showing {count} {count_text}")
+        if self.render_progress is not None:
+            self.render_progress.setRange(0, count)
+            self.render_progress.show()
+        to_format = [None] * start + documents
+        job = DocumentFormatJob(self._format_generation, to_format, self.format_document_html)
+        job.signals.finished.connect(self._on_documents_formatted)
+        self._active_format_job = job
+        QThreadPool.globalInstance().start(job)
+    
+    def _update_count_label(self):
+        """Show the number of displayed documents in the header."""
+        document_count = len(self.current_documents)
         if document_count == 1:
             self.count_label.setText(f"{format_number(document_count)} document")
         else:
             self.count_label.setText(f"{format_number(document_count)} documents")
-        
-        # Update all views
-        self.update_json_view(documents)
-        self.update_table_view(documents)
-        self.update_tree_view(documents)
-        self.update_statistics_view(stats)
-        
-        self.logger.info(f"Displayed {len(documents)} documents from {database}.{collection}")
     
     def update_json_view(self, documents: List[Dict[str, Any]]):
         """Update the JSON view with MongoDB Compass-like document cards."""
-        # Clear existing documents
-        self.clear_documents_container()
+        # Clear existing documents, keeping cards that are shown again
+        self.recycle_documents_container(documents)
+        self._fmt_cache.clear()
+        self._json_documents = documents
+        self._json_rendered = 0
         
         if not documents:
+            self.load_more_btn.hide()
             self.add_no_documents_message()
             return
         
         # Add summary header
         self.add_documents_summary(len(documents))
+        if self.render_progress is not None:
+            self.render_progress.show()
+        
+        # Format the documents in the thread pool; cards are built once done.
+        # Documents that keep their card don't need formatting again.
+        card_widgets = self._card_widgets
+        to_format = [
+            None if self._card_key(document) in card_widgets else document
+            for document in documents
+        ]
+        job = DocumentFormatJob(self._format_generation, to_format, self.format_document_html)
+        job.signals.finished.connect(self._on_documents_formatted)
+        self._active_format_job = job
+        QThreadPool.globalInstance().start(job)
+    
+    @pyqtSlot(int, list, list)
+    def _on_documents_formatted(self, generation: int, formatted: List[str],
+                                id_labels: List[Optional[str]]):
+        """Start building cards once the background formatting finished."""
+        if generation != self._format_generation:
+            return  # Result of a superseded render
+        
+        self._active_format_job = None
+        self._formatted_html = formatted
+        self._id_labels = id_labels
+        self.render_next_json_page()
+    
+    def _cancel_format_job(self):
+        """Cancel the running formatting job and discard its result."""
+        self._format_generation += 1
+        self._formatted_html = None
+        self._id_labels = None
+        if self._active_format_job is not None:
+            self._active_format_job.cancelled = True
+            self._active_format_job = None
+    
+    def render_next_json_page(self):
+        """Start appending the next page of document cards to the JSON view."""
+        self._json_page_end = min(
+            self._json_rendered + self.JSON_PAGE_SIZE, len(self._json_documents)
+        )
+        self.load_more_btn.hide()
+        if self.render_progress is not None:
+            self.render_progress.show()
+        self._render_next_chunk()
+    
+    @pyqtSlot(int)
+    def _on_json_scrolled(self, value: int):
+        """Render the next page of cards once scrolled near the end."""
+        scroll_bar = self.json_scroll_area.verticalScrollBar()
+        if value < scroll_bar.maximum() - scroll_bar.pageStep():
+            return
         
+        # Nothing to do while formatting or the current page is still building
+        if self._active_format_job is not None or self._json_rendered < self._json_page_end:
+            return
+        self.show_more_documents()
+    
+    def show_more_documents(self):
+        """Render the next page of cards, loading it from the server if needed."""
+        if self._json_rendered < len(self._json_documents):
+            self.render_next_json_page()
+        elif not self._fetching_more and self.controller.load_more_documents():
+            self._fetching_more = True
+            self._update_load_more_button()
+    
+    def _update_load_more_button(self):
+        """Show the load more button when documents are left to display."""
+        remaining = len(self._json_documents) - self._json_rendered
+        if remaining > 0:
+            self.load_more_btn.setText(f"Show more documents ({remaining} remaining)")
+            self.load_more_btn.setEnabled(True)
+            self.load_more_btn.show()
+        elif self._fetching_more:
+            self.load_more_btn.setText("Loading more documents...")
+            self.load_more_btn.setEnabled(False)
+            self.load_more_btn.show()
+        elif self._json_documents and self.controller.has_more_documents():
+            self.load_more_btn.setText("Load more documents")
+            self.load_more_btn.setEnabled(True)
+            self.load_more_btn.show()
+        else:
+            self.load_more_btn.hide()
+    
+    def _render_next_chunk(self):
+        """Build the next chunk of cards and yield to the event loop."""
+        documents = self._json_documents
+        start = self._json_rendered
+        end = min(start + self.JSON_RENDER_CHUNK, self._json_page_end)
+        
+        # Suppress intermediate paints while the chunk is being built
+        self.documents_container.setUpdatesEnabled(False)
+        
+        # Take the trailing stretch out so cards can be appended, then put it back
+        layout = self.documents_layout
+        stretch = layout.takeAt(layout.count() - 1)
         try:
             # Add each document as a separate card
-            for i, doc in enumerate(documents):
-                doc_card = self.create_document_card(doc, i)
-                self.documents_layout.insertWidget(self.documents_layout.count() - 1, doc_card)
+            for i in range(start, end):
+                layout.addWidget(self._take_document_card(documents[i], i))
         except Exception as e:
             self.add_error_message(f"Error displaying documents: {str(e)}")
             self.logger.error(f"Error updating JSON view: {e}")
+            end = self._json_page_end
+        finally:
+            layout.addItem(stretch)
+            self.documents_container.setUpdatesEnabled(True)
+        
+        self._json_rendered = end
+        if self.render_progress is not None:
+            self.render_progress.setValue(end)
+        
+        if end < self._json_page_end:
+            self._render_timer.start(0)
+            return
+        
+        # Page complete
+        if self.render_progress is not None:
+            self.render_progress.hide()
+        self._update_load_more_button()
     
     def add_documents_summary(self, count: int):
         """Add a summary header showing document count."""
@@ -745,6 +1812,7 @@ class DocumentViewer(QWidget):
         # Document count
         count_text = "document" if count == 1 else "documents"
         summary_label = QLabel(f"Showing {count} {count_text}")
+        self.summary_label = summary_label
         summary_label.setStyleSheet("""
             color: #495057;
             font-weight: 500;
@@ -763,15 +1831,85 @@ class DocumentViewer(QWidget):
         """)
         summary_layout.addWidget(actions_label)
         
+        # Rendering progress, visible while card chunks are being built
+        self.render_progress = QProgressBar()
+        self.render_progress.setRange(0, count)
+        self.render_progress.setValue(0)
+        self.render_progress.setTextVisible(False)
+        self.render_progress.setMaximumWidth(120)
+        self.render_progress.setMaximumHeight(8)
+        self.render_progress.hide()
+        summary_layout.addWidget(self.render_progress)
+        
         self.documents_layout.insertWidget(0, summary_frame)
     
     def clear_documents_container(self):
         """Clear all document cards from the container."""
+        self.recycle_documents_container([])
+    
+    def recycle_documents_container(self, documents: List[Dict[str, Any]]):
+        """
+        Clear the container, keeping the cards of documents shown again.
+        
+        Cards are matched by ``_id``; kept cards are hidden until their
+        position is rendered so paging only builds the cards that changed.
+        
+        Args:
+            documents: Documents about to be displayed
+        """
+        # Cancel any formatting or chunked rendering still in progress
+        self._cancel_format_job()
+        self._render_timer.stop()
+        self.render_progress = None
+        self.summary_label = None
+        self._resize_pending.clear()
+        
+        new_keys = {self._card_key(document) for document in documents}
+        new_keys.discard(None)
+        kept = {}
+        
         # Remove all widgets except the stretch at the end
         while self.documents_layout.count() > 1:
             child = self.documents_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            widget = child.widget()
+            if widget is None:
+                continue
+            key = getattr(widget, 'card_key', None)
+            if key in new_keys and key not in kept:
+                widget.hide()
+                kept[key] = widget
+            else:
+                widget.deleteLater()
+        
+        # Cards kept earlier but never rendered again
+        for key, widget in self._card_widgets.items():
+            if key in new_keys and key not in kept:
+                kept[key] = widget
+            else:
+                widget.deleteLater()
+        self._card_widgets = kept
+    
+    @staticmethod
+    def _card_key(document: Dict[str, Any]) -> Optional[str]:
+        """Return the key a document's card is reused under, if any."""
+        if '_id' not in document:
+            return None
+        return str(document['_id'])
+    
+    def _take_document_card(self, document: Dict[str, Any], index: int) -> QFrame:
+        """Return the kept card for a document, or create a new one."""
+        key = self._card_key(document)
+        card = self._card_widgets.pop(key, None) if key is not None else None
+        if card is not None:
+            if card.original_document == document:
+                card.doc_number.setText(f"Document {index + 1}")
+                card.show()
+                return card
+            card.deleteLater()  # Same _id but the content changed
+        
+        card = self.create_document_card(document, index)
+        card.card_key = key
+        return card
     
     def add_no_documents_message(self):
         """Add a message when no documents are available."""
@@ -814,346 +1952,41 @@ class DocumentViewer(QWidget):
     
     def create_document_card(self, document: Dict[str, Any], index: int) -> QFrame:
         """Create a MongoDB Compass-style document card."""
-        # Main card frame
-        card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {ModernStyles.COLORS['surface']};
-                border: 1px solid {ModernStyles.COLORS['border']};
-                border-radius: 12px;
-                margin: 4px 0px;
-            }}
-            QFrame:hover {{
-                border-color: {ModernStyles.COLORS['primary']};
-                background-color: {ModernStyles.COLORS['hover']};
-                box-shadow: 0 4px 12px {ModernStyles.COLORS['shadow']};
-            }}
-        """)
-        card.setContentsMargins(0, 0, 0, 0)
-        
-        card_layout = QVBoxLayout(card)
-        card_layout.setContentsMargins(15, 12, 15, 12)
-        card_layout.setSpacing(8)
-        
-        # Header with document index and _id
-        header_layout = QHBoxLayout()
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Document number
-        doc_number = QLabel(f"Document {index + 1}")
-        doc_number.setStyleSheet(f"""
-            font-weight: bold;
-            color: {ModernStyles.COLORS['primary']};
-            font-size: 14px;
-            padding: 4px 8px;
-            background-color: {ModernStyles.COLORS['background']};
-            border-radius: 6px;
-        """)
-        header_layout.addWidget(doc_number)
-        
-        # Object ID (if present)
-        if '_id' in document:
-            id_label = QLabel(f"ObjectId: {str(document['_id'])}")
-            id_label.setStyleSheet(f"""
-                color: {ModernStyles.COLORS['text_secondary']};
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 12px;
-                padding: 4px 8px;
-                background-color: {ModernStyles.COLORS['background']};
-                border-radius: 4px;
-            """)
-            header_layout.addWidget(id_label)
-        
-        header_layout.addStretch()
-        
-        # Copy button
-        copy_btn = QPushButton()
-        copy_btn.setIcon(qta.icon('fa5s.copy', color='#666'))
-        copy_btn.setToolTip("Copy document to clipboard")
-        copy_btn.setFixedSize(24, 24)
-        copy_btn.setStyleSheet("""
-            QPushButton {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: #f5f5f5;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-        copy_btn.clicked.connect(lambda: self.copy_document_to_clipboard(document))
-        header_layout.addWidget(copy_btn)
-        
-        # Edit button
-        edit_btn = QPushButton()
-        edit_btn.setIcon(qta.icon('fa5s.edit', color='#666'))
-        edit_btn.setToolTip("Edit document")
-        edit_btn.setFixedSize(24, 24)
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: #f5f5f5;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-        header_layout.addWidget(edit_btn)
-        
-        # Expand/Collapse button
-        expand_btn = QPushButton()
-        expand_btn.setIcon(qta.icon('fa5s.chevron-up', color='#666'))
-        expand_btn.setToolTip("Collapse document")
-        expand_btn.setFixedSize(24, 24)
-        expand_btn.setStyleSheet("""
-            QPushButton {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: #f5f5f5;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-        header_layout.addWidget(expand_btn)
-        
-        card_layout.addLayout(header_layout)
-        
-        # Edit action buttons (initially hidden)
-        edit_actions_layout = QHBoxLayout()
-        edit_actions_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Save button
-        save_btn = QPushButton("Save")
-        save_btn.setIcon(qta.icon('fa5s.save', color='white'))
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4caf50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
-        edit_actions_layout.addWidget(save_btn)
-        
-        # Cancel button  
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setIcon(qta.icon('fa5s.times', color='white'))
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-        """)
-        edit_actions_layout.addWidget(cancel_btn)
-        
-        edit_actions_layout.addStretch()
-        
-        edit_actions_widget = QWidget()
-        edit_actions_widget.setLayout(edit_actions_layout)
-        edit_actions_widget.hide()
-        card_layout.addWidget(edit_actions_widget)
-        
-        # Separator line
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("border: none; background-color: #e0e0e0; height: 1px;")
-        card_layout.addWidget(separator)
-        
-        # Document content
-        content_text = QTextEdit()
-        content_text.setReadOnly(True)  # Start in read-only mode
-        content_text.setFont(FontHelper.get_monospace_font(11))
-        
-        # Remove scrollbars and auto-size to content
-        content_text.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        content_text.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        content_text.setLineWrapMode(QTextEdit.WidgetWidth)
-        
-        # Store original document for cancel operation
-        content_text.original_document = document
-        content_text.is_editing = False
-        
-        # Format the document nicely
-        formatted_json = self.format_document_for_display(document)
-        content_text.setPlainText(formatted_json)
-        
-        # Auto-resize to content height
-        content_text.document().documentLayout().documentSizeChanged.connect(
-            lambda: self.resize_text_edit_to_content(content_text)
-        )
-        
-        # Initial resize
-        self.resize_text_edit_to_content(content_text)
-        
-        # Add syntax highlighting
-        highlighter = JsonSyntaxHighlighter(content_text.document())
-        
-        # Style the text area
-        content_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                background-color: #fafafa;
-                padding: 8px;
-                color: #333;
-            }
-            QTextEdit:focus {
-                border-color: #2196f3;
-            }
-            QTextEdit[readOnly="false"] {
-                background-color: #ffffff;
-                border: 2px solid #ff9800;
-            }
-        """)
-        
-        # Connect expand/collapse functionality
-        def toggle_expand():
-            if content_text.isVisible():
-                content_text.hide()
-                expand_btn.setIcon(qta.icon('fa5s.chevron-down', color='#666'))
-                expand_btn.setToolTip("Expand document")
-            else:
-                content_text.show()
-                expand_btn.setIcon(qta.icon('fa5s.chevron-up', color='#666'))
-                expand_btn.setToolTip("Collapse document")
-        
-        expand_btn.clicked.connect(toggle_expand)
-        
-        # Edit mode functionality
-        def toggle_edit_mode():
-            if content_text.is_editing:
-                # Already in edit mode, this shouldn't happen as edit button is hidden
-                return
-            else:
-                # Enter edit mode
-                content_text.setReadOnly(False)
-                content_text.is_editing = True
-                content_text.setStyleSheet(content_text.styleSheet() + """
-                    QTextEdit {
-                        background-color: #ffffff !important;
-                        border: 2px solid #ff9800 !important;
-                    }
-                """)
-                
-                # Show edit action buttons
-                edit_actions_widget.show()
-                save_btn.show()
-                cancel_btn.show()
-                
-                # Hide regular buttons 
-                copy_btn.hide()
-                edit_btn.hide()
-                expand_btn.hide()
-        
-        def save_document():
-            try:
-                # Parse the JSON to validate it
-                new_content = content_text.toPlainText()
-                parsed_doc = json.loads(new_content)
-                
-                # Get the document ID from the original document
-                original_doc = content_text.original_document
-                if '_id' not in original_doc:
-                    QMessageBox.warning(self, "Error", "Cannot update document: No _id field found")
-                    return
-                
-                document_id = str(original_doc['_id'])
-                
-                # Check if we have database and collection info
-                if not self.current_database or not self.current_collection:
-                    QMessageBox.warning(self, "Error", "No database or collection selected")
-                    return
-                
-                # Perform the update through the controller
-                success = self.controller.update_document(
-                    self.current_database,
-                    self.current_collection, 
-                    document_id,
-                    parsed_doc
-                )
-                
-                if success:
-                    # Update the stored original document
-                    content_text.original_document = parsed_doc.copy()
-                    if '_id' not in content_text.original_document:
-                        content_text.original_document['_id'] = original_doc['_id']
-                    
-                    exit_edit_mode()
-                    QMessageBox.information(self, "Success", "Document updated successfully!")
-                else:
-                    QMessageBox.warning(self, "Update Failed", "Document could not be updated. It may have been deleted or modified by another user.")
-                
-            except json.JSONDecodeError as e:
-                QMessageBox.warning(self, "Invalid JSON", f"Invalid JSON format:\n{str(e)}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save document:\n{str(e)}")
-        
-        def cancel_edit():
-            # Restore original content
-            formatted_json = self.format_document_for_display(content_text.original_document)
-            content_text.setPlainText(formatted_json)
-            exit_edit_mode()
-        
-        def exit_edit_mode():
-            # Exit edit mode
-            content_text.setReadOnly(True)
-            content_text.is_editing = False
-            content_text.setStyleSheet("""
-                QTextEdit {
-                    border: 1px solid #e0e0e0;
-                    border-radius: 4px;
-                    background-color: #fafafa;
-                    padding: 8px;
-                    color: #333;
-                }
-                QTextEdit:focus {
-                    border-color: #2196f3;
-                }
-            """)
-            
-            # Hide edit action buttons
-            edit_actions_widget.hide()
-            save_btn.hide()
-            cancel_btn.hide()
-            
-            # Show regular buttons
-            copy_btn.show()
-            edit_btn.show()
-            expand_btn.show()
-        
-        # Connect button functionality
-        edit_btn.clicked.connect(toggle_edit_mode)
-        save_btn.clicked.connect(save_document)
-        cancel_btn.clicked.connect(cancel_edit)
-        
-        card_layout.addWidget(content_text)
-        
-        return card
+        # Content and header text precomputed by the formatting job
+        formatted_html = self._formatted_html
+        html = id_label = None
+        if formatted_html is not None and index < len(formatted_html):
+            html = formatted_html[index]
+            id_label = self._id_labels[index]
+        return DocumentCard(self, document, index, html, id_label)
+    
+    def _schedule_resize(self, text_edit: QTextEdit):
+        """Queue a text edit for resizing, coalescing bursts of layout changes."""
+        self._resize_pending.add(text_edit)
+        self._resize_timer.start(50)
+    
+    def _flush_resizes(self):
+        """Resize every queued text edit once."""
+        pending, self._resize_pending = self._resize_pending, set()
+        for text_edit in pending:
+            self.resize_text_edit_to_content(text_edit)
     
     def resize_text_edit_to_content(self, text_edit: QTextEdit):
         """Resize QTextEdit to fit its content without scrollbars."""
         try:
             doc = text_edit.document()
-            doc.setTextWidth(text_edit.viewport().width())
+            width = text_edit.viewport().width()
+            
+            # Skip the layout pass when neither the text nor the width changed
+            measured_for = (doc.revision(), width)
+            if getattr(text_edit, 'measured_for', None) == measured_for:
+                return
+            text_edit.measured_for = measured_for
+            
+            # The editor normally keeps the document at the viewport width;
+            # setting it again would throw away the layout used for painting
+            if doc.textWidth() != width:
+                doc.setTextWidth(width)
             
             # Calculate required height
             height = doc.size().height()
@@ -1172,29 +2005,74 @@ class DocumentViewer(QWidget):
             # Fallback to a default height if calculation fails
             text_edit.setFixedHeight(120)
     
+    def _get_display_document(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Get a document with its _id formatted for display.
+        
+        Only documents that have an _id are copied; the copy is shallow, so
+        nested values are shared with the original document.
+        """
+        if '_id' not in document:
+            return document
+        
+        # Keep _id for reference but format it nicely
+        display_doc = document.copy()
+        display_doc['_id'] = f"ObjectId('{document['_id']}')"
+        return display_doc
+    
+    def _cached_text(self, kind: str, document: Dict[str, Any], formatter) -> str:
+        """
+        Return formatter(document), reusing the text formatted earlier.
+        
+        Args:
+            kind: Name of the format, so one document can cache several
+            document: Document to format
+            formatter: Callable producing the text for the document
+            
+        Returns:
+            Formatted text
+        """
+        key = (kind, id(document))
+        cached = self._fmt_cache.get(key)
+        if cached is not None and cached[0] is document:
+            self._fmt_cache.move_to_end(key)
+            return cached[1]
+        
+        text = formatter(document)
+        self._fmt_cache[key] = (document, text)
+        if len(self._fmt_cache) > self.FORMAT_CACHE_SIZE:
+            self._fmt_cache.popitem(last=False)
+        return text
+    
     def format_document_for_display(self, document: Dict[str, Any]) -> str:
         """Format a document for display in a card."""
         try:
-            # Remove _id from display if it's an ObjectId (already shown in header)
-            display_doc = document.copy()
-            if '_id' in display_doc:
-                # Keep _id for reference but format it nicely
-                if hasattr(display_doc['_id'], '__str__'):
-                    display_doc['_id'] = f"ObjectId('{display_doc['_id']}')"
-            
             # Pretty print with proper indentation
-            formatted = json.dumps(display_doc, indent=2, default=str, ensure_ascii=False)
-            return formatted
+            return self._cached_text(
+                'display', document,
+                lambda doc: _dumps_pretty(self._get_display_document(doc))
+            )
         except Exception as e:
             return f"Error formatting document: {str(e)}"
     
+    def format_document_html(self, document: Dict[str, Any]) -> str:
+        """Format a document as syntax-colored HTML for read-only display."""
+        try:
+            return json_to_colored_html(
+                self._get_display_document(document), max_length=self.CARD_HTML_LIMIT
+            )
+        except Exception as e:
+            return f"Error formatting document: {escape_html(str(e))}"
+    
     def copy_document_to_clipboard(self, document: Dict[str, Any]):
         """Copy document to clipboard."""
         try:
             from PyQt5.QtWidgets import QApplication
-            formatted = json.dumps(document, indent=2, default=str, ensure_ascii=False)
+            # The text is only formatted when it is pasted
+            mime_data = LazyTextMimeData(
+                document, lambda doc: self._cached_text('clipboard', doc, _dumps_pretty)
+            )
             clipboard = QApplication.clipboard()
-            clipboard.setText(formatted)
+            clipboard.setMimeData(mime_data)
             self.logger.info("Document copied to clipboard")
         except Exception as e:
             self.logger.error(f"Failed to copy document: {e}")
@@ -1205,12 +2083,24 @@ class DocumentViewer(QWidget):
     
     def update_tree_view(self, documents: List[Dict[str, Any]]):
         """Update the tree view."""
-        # Limit tree view to first 10 documents for performance
-        display_docs = documents[:10] if len(documents) > 10 else documents
+        # Limit the tree by the number of items created up front rather than
+        # by document count: each document gets an item plus one per field,
+        # deeper levels are only built on expand
+        display_count = 0
+        nodes = 0
+        for doc in documents:
+            nodes += 1 + len(doc)
+            if nodes > self.TREE_NODE_BUDGET and display_count:
+                break
+            display_count += 1
+        
+        display_docs = documents[:display_count] if display_count < len(documents) else documents
         self.tree_widget.populate_documents(display_docs)
         
-        if len(documents) > 10:
-            self.logger.info("Tree view limited to first 10 documents for performance")
+        if display_count < len(documents):
+            self.logger.info(
+                f"Tree view limited to first {display_count} of {len(documents)} documents for performance"
+            )
     
     def update_statistics_view(self, stats: DocumentStats):
         """Update the statistics view."""
@@ -1252,9 +2142,13 @@ class DocumentViewer(QWidget):
         self.collection_label.setText("No collection selected")
         self.count_label.setText("0 documents")
         
-        self.json_text.clear()
-        self.table_widget.setRowCount(0)
-        self.table_widget.setColumnCount(0)
+        self.clear_documents_container()
+        self._fmt_cache.clear()
+        self._json_documents = []
+        self._json_rendered = 0
+        self._fetching_more = False
+        self.load_more_btn.hide()
+        self.table_widget.populate_documents([])
         self.tree_widget.clear()
         self.statistics_widget.stats_text.clear()
         
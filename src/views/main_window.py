@@ -6,19 +6,21 @@ modern interface following Qt design patterns and best practices.
 """
 
 import sys
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QTabWidget, QTextEdit, QTableWidget,
+    QTreeView, QTabWidget, QTextEdit, QTableWidget,
     QTableWidgetItem, QMenuBar, QStatusBar, QToolBar, QAction, QActionGroup,
     QLabel, QPushButton, QComboBox, QSpinBox, QLineEdit, QGroupBox,
-    QFormLayout, QProgressBar, QFrame, QHeaderView, QAbstractItemView
+    QFormLayout, QProgressBar, QFrame, QHeaderView, QAbstractItemView, QMessageBox
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSlot, QThread, QSize, QAbstractItemModel, QModelIndex
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot, QThread, QSize
 from PyQt5.QtGui import QIcon, QFont, QPixmap, QKeySequence
-import qtawesome as qta
 
 from ..controllers.database_controller import DatabaseController
 from ..models.data_models import (
@@ -27,18 +29,49 @@ from ..models.data_models import (
 )
 from ..utils.helpers import (
     format_bytes, format_number, format_duration, FontHelper,
-    SettingsManager, show_error_message, show_info_message, JsonFormatter
+    SettingsManager, show_error_message, show_info_message, JsonFormatter, get_icon
 )
 from ..utils.logging_config import get_logger
 from ..styles.theme_manager import theme_manager, ThemeType
-from .connection_dialog import ConnectionDialog
 from .document_viewer import DocumentViewer
-from .syntax_highlighter import JsonSyntaxHighlighter
+
+
+# Rich text of the about dialog
+ABOUT_HTML = """
+<h2>MongoDB Visualizer</h2>
+<p>Version 1.0.0</p>
+<p>A professional PyQt5-based desktop application for MongoDB database visualization and management.</p>
+<p>Features:</p>
+<ul>
+<li>Database and collection browsing</li>
+<li>Document visualization and analysis</li>
+<li>Query execution and history</li>
+<li>Performance monitoring</li>
+<li>Data export capabilities</li>
+</ul>
+<p>Built with PyQt5 and PyMongo</p>
+"""
 
 
 class StatusBarWidget(QWidget):
     """Custom status bar widget with multiple status indicators."""
     
+    # Connection label colors, selected through its "state" property
+    CONNECTION_STYLE = (
+        "QLabel { font-weight: bold; }"
+        "QLabel[state='disconnected'] { color: #757575; }"
+        "QLabel[state='connecting'] { color: #f57c00; }"
+        "QLabel[state='connected'] { color: #388e3c; }"
+        "QLabel[state='error'] { color: #d32f2f; }"
+    )
+    
+    # Label text and style state of the statuses without a connection name
+    STATUS_DISPLAY = {
+        ConnectionStatus.CONNECTING: ("Connecting...", "connecting"),
+        ConnectionStatus.ERROR: ("Connection Error", "error"),
+    }
+    DISCONNECTED_DISPLAY = ("Disconnected", "disconnected")
+    
     def __init__(self):
         super().__init__()
         self.init_ui()
@@ -50,7 +83,8 @@ class StatusBarWidget(QWidget):
         
         # Connection status
         self.connection_label = QLabel("Disconnected")
-        self.connection_label.setStyleSheet("color: #d32f2f; font-weight: bold;")
+        self.connection_label.setProperty("state", "disconnected")
+        self.connection_label.setStyleSheet(self.CONNECTION_STYLE)
         layout.addWidget(self.connection_label)
         
         # Separator
@@ -79,17 +113,20 @@ class StatusBarWidget(QWidget):
     def update_connection_status(self, status: ConnectionStatus, connection: ConnectionInfo = None):
         """Update connection status display."""
         if status == ConnectionStatus.CONNECTED:
-            self.connection_label.setText(f"Connected to {connection.get_display_name()}")
-            self.connection_label.setStyleSheet("color: #388e3c; font-weight: bold;")
-        elif status == ConnectionStatus.CONNECTING:
-            self.connection_label.setText("Connecting...")
-            self.connection_label.setStyleSheet("color: #f57c00; font-weight: bold;")
-        elif status == ConnectionStatus.ERROR:
-            self.connection_label.setText("Connection Error")
-            self.connection_label.setStyleSheet("color: #d32f2f; font-weight: bold;")
+            text, state = f"Connected to {connection.get_display_name()}", "connected"
         else:
-            self.connection_label.setText("Disconnected")
-            self.connection_label.setStyleSheet("color: #757575; font-weight: bold;")
+            text, state = self.STATUS_DISPLAY.get(status, self.DISCONNECTED_DISPLAY)
+        self.connection_label.setText(text)
+        self._set_connection_state(state)
+    
+    def _set_connection_state(self, state: str):
+        """Restyle the connection label for a state without a new stylesheet."""
+        label = self.connection_label
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
     
     def update_selection(self, database: str = None, collection: str = None):
         """Update current selection display."""
@@ -118,21 +155,339 @@ class StatusBarWidget(QWidget):
         self.progress_bar.setVisible(False)
 
 
-class DatabaseTreeWidget(QTreeWidget):
-    """Custom tree widget for database structure display."""
+class DatabaseTreeNode:
+    """A database or collection entry of the database tree model."""
+    
+    __slots__ = ('kind', 'info', 'parent', 'row', 'children', 'fetching', 'loaded_at', 'tooltip')
+    
+    def __init__(self, kind: str, info, parent: Optional['DatabaseTreeNode'] = None, row: int = 0):
+        self.kind = kind
+        self.info = info
+        self.parent = parent
+        self.row = row
+        # Collections of a database node, None until they have been loaded
+        self.children: Optional[List['DatabaseTreeNode']] = None if kind == 'database' else []
+        self.fetching = False
+        # time.monotonic() of the last collections load of a database node
+        self.loaded_at: Optional[float] = None
+        # Tooltip text, built on the first hover
+        self.tooltip: Optional[str] = None
+
+
+class DatabaseTreeModel(QAbstractItemModel):
+    """
+    Item model exposing databases and their collections.
+    
+    Collections are loaded on demand through fetchMore() when a database
+    is expanded, and all item data is produced lazily in data().
+    """
+    
+    # Icon name and color per node kind
+    _icon_specs = {
+        'database': ('fa5s.database', '#2c3e50'),
+        'collection': ('fa5s.table', '#3498db'),
+    }
+    
+    # Seconds during which loaded collections are not requested again
+    COLLECTIONS_TTL = 5.0
+    
+    def __init__(self, controller: DatabaseController, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self._databases: List[DatabaseTreeNode] = []
+        self._database_nodes: Dict[str, DatabaseTreeNode] = {}
+    
+    def set_databases(self, databases: List[DatabaseInfo]):
+        """
+        Set the databases of the model.
+        
+        Databases that are already shown are diffed against the new list,
+        so kept databases retain their loaded collections.
+        
+        Args:
+            databases: Databases of the connection, in display order
+        """
+        if not self._databases or not databases:
+            self.beginResetModel()
+            self._databases = [
+                DatabaseTreeNode('database', db_info, row=row)
+                for row, db_info in enumerate(databases)
+            ]
+            self.endResetModel()
+        else:
+            self._merge_rows(QModelIndex(), None, self._databases, 'database', databases)
+        self._database_nodes = {node.info.name: node for node in self._databases}
+    
+    def set_collections(self, database_name: str, collections: List[CollectionInfo]) -> QModelIndex:
+        """
+        Set the collections of a database.
+        
+        Collections that were already loaded are diffed against the new
+        list instead of being rebuilt.
+        
+        Args:
+            database_name: Name of the database
+            collections: Collections of the database
+            
+        Returns:
+            Index of the database, invalid if it is not in the model
+        """
+        db_node = self._database_nodes.get(database_name)
+        if db_node is None:
+            return QModelIndex()
+        
+        db_index = self.createIndex(db_node.row, 0, db_node)
+        db_node.fetching = False
+        db_node.loaded_at = time.monotonic()
+        
+        if db_node.children is None:
+            db_node.children = []
+            self._insert_rows(db_index, db_node, db_node.children, 0, 'collection', collections)
+        else:
+            self._merge_rows(db_index, db_node, db_node.children, 'collection', collections)
+        return db_index
+    
+    def _insert_rows(self, parent_index: QModelIndex, parent_node: Optional[DatabaseTreeNode],
+                     nodes: List[DatabaseTreeNode], row: int, kind: str, infos: list):
+        """Insert a run of rows built from info objects."""
+        if not infos:
+            return
+        
+        new_nodes = [DatabaseTreeNode(kind, info, parent_node) for info in infos]
+        self.beginInsertRows(parent_index, row, row + len(new_nodes) - 1)
+        nodes[row:row] = new_nodes
+        self._renumber(nodes, row)
+        self.endInsertRows()
+    
+    def _merge_rows(self, parent_index: QModelIndex, parent_node: Optional[DatabaseTreeNode],
+                    nodes: List[DatabaseTreeNode], kind: str, infos: list):
+        """
+        Update a list of rows in place from new info objects.
+        
+        Stale rows are removed, new ones inserted and changed ones refreshed,
+        so rows that did not change keep their nodes and view state.
+        
+        Args:
+            parent_index: Index of the parent, invalid for databases
+            parent_node: Node of the parent, None for databases
+            nodes: Current rows, updated in place
+            kind: Node kind of the rows
+            infos: New info objects, in display order
+        """
+        new_names = {info.name for info in infos}
+        
+        # Remove runs of stale rows from the bottom up so row numbers stay
+        # valid; the rows below a run are renumbered before the view is told
+        # it is gone, as parent() of their children reads the cached row
+        row = len(nodes)
+        while row > 0:
+            row -= 1
+            if nodes[row].info.name in new_names:
+                continue
+            last = row
+            while row > 0 and nodes[row - 1].info.name not in new_names:
+                row -= 1
+            self.beginRemoveRows(parent_index, row, last)
+            del nodes[row:last + 1]
+            self._renumber(nodes, row)
+            self.endRemoveRows()
+        
+        # The remaining rows must already be in the new order to be kept
+        kept_order = [node.info.name for node in nodes]
+        kept_names = set(kept_order)
+        if kept_order != [info.name for info in infos if info.name in kept_names]:
+            if nodes:
+                self.beginRemoveRows(parent_index, 0, len(nodes) - 1)
+                nodes.clear()
+                self.endRemoveRows()
+            self._insert_rows(parent_index, parent_node, nodes, 0, kind, infos)
+            return
+        
+        row = 0
+        pending = []
+        for info in infos:
+            if row < len(nodes) and nodes[row].info.name == info.name:
+                if pending:
+                    self._insert_rows(parent_index, parent_node, nodes, row, kind, pending)
+                    row += len(pending)
+                    pending = []
+                node = nodes[row]
+                if self._display_key(node.info) != self._display_key(info):
+                    node.info = info
+                    node.tooltip = None
+                    index = self.createIndex(row, 0, node)
+                    self.dataChanged.emit(index, index)
+                else:
+                    node.info = info
+                row += 1
+            else:
+                pending.append(info)
+        if pending:
+            self._insert_rows(parent_index, parent_node, nodes, row, kind, pending)
+    
+    @staticmethod
+    def _display_key(info) -> tuple:
+        """Get the statistics of a database or collection shown by the tree."""
+        if isinstance(info, DatabaseInfo):
+            return (info.collection_count, info.data_size, info.storage_size)
+        return (info.document_count, info.data_size, info.index_count,
+                info.avg_document_size)
+    
+    @staticmethod
+    def _renumber(nodes: List[DatabaseTreeNode], start: int):
+        """Refresh the cached row of nodes from a position onwards."""
+        for row in range(start, len(nodes)):
+            nodes[row].row = row
+    
+    def node(self, index: QModelIndex) -> Optional[DatabaseTreeNode]:
+        """Get the node of an index."""
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+    
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        if column != 0:
+            return QModelIndex()
+        if not parent.isValid():
+            nodes = self._databases
+        else:
+            nodes = parent.internalPointer().children or []
+        if 0 <= row < len(nodes):
+            return self.createIndex(row, column, nodes[row])
+        return QModelIndex()
+    
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._databases)
+        if parent.column() != 0:
+            return 0
+        return len(parent.internalPointer().children or ())
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 1
+    
+    def hasChildren(self, parent=QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._databases)
+        children = parent.internalPointer().children
+        # Databases show an expander until their collections are known
+        return children is None or bool(children)
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid():
+            return False
+        node = parent.internalPointer()
+        return node.children is None and not node.fetching
+    
+    def fetchMore(self, parent: QModelIndex):
+        """Request the collections of a database; they arrive asynchronously."""
+        if self.canFetchMore(parent):
+            self.request_collections(parent.internalPointer())
+    
+    def request_collections(self, node: DatabaseTreeNode, force: bool = False) -> bool:
+        """
+        Request the collections of a database unless they are fresh.
+        
+        Args:
+            node: Node of the database
+            force: Request them even if they were loaded recently
+            
+        Returns:
+            True if a load was requested
+        """
+        if node.kind != 'database' or node.fetching:
+            return False
+        if (not force and node.loaded_at is not None
+                and time.monotonic() - node.loaded_at <= self.COLLECTIONS_TTL):
+            return False
+        node.fetching = True
+        self.controller.load_collections(node.info.name)
+        return True
+    
+    def refresh_collections(self, force: bool = False):
+        """Request the collections of every database that has loaded them."""
+        for node in self._databases:
+            if node.children is not None:
+                self.request_collections(node, force)
+    
+    def cancel_fetches(self):
+        """Forget outstanding collection requests, e.g. after a failed load."""
+        for node in self._databases:
+            node.fetching = False
+    
+    def collections_loaded(self, database_name: str) -> bool:
+        """Check whether the collections of a database have been loaded."""
+        node = self._database_nodes.get(database_name)
+        return node is not None and node.children is not None
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Database Structure"
+        return None
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.info.name
+        if role == Qt.DecorationRole:
+            return get_icon(*self._icon_specs[node.kind])
+        if role == Qt.ToolTipRole:
+            if node.tooltip is None:
+                node.tooltip = self._tooltip(node)
+            return node.tooltip
+        if role == Qt.UserRole:
+            return {'type': node.kind, 'info': node.info}
+        return None
+    
+    @staticmethod
+    def _tooltip(node: DatabaseTreeNode) -> str:
+        """Build the tooltip text of a node."""
+        info = node.info
+        if node.kind == 'database':
+            tooltip = f"Database: {info.name}\n"
+            tooltip += f"Collections: {info.collection_count}\n"
+            tooltip += f"Data Size: {info.get_formatted_data_size()}\n"
+            tooltip += f"Storage Size: {format_bytes(info.storage_size)}"
+        else:
+            tooltip = f"Collection: {info.name}\n"
+            tooltip += f"Documents: {format_number(info.document_count)}\n"
+            tooltip += f"Data Size: {info.get_formatted_data_size()}\n"
+            tooltip += f"Indexes: {info.index_count}\n"
+            tooltip += f"Average Doc Size: {format_bytes(int(info.avg_document_size))}"
+        return tooltip
+
+
+class DatabaseTreeWidget(QTreeView):
+    """Custom tree view for database structure display."""
     
     def __init__(self, controller: DatabaseController):
         super().__init__()
         self.controller = controller
         self.logger = get_logger(__name__)
+        self.tree_model = DatabaseTreeModel(controller, self)
+        self.setModel(self.tree_model)
         self.init_ui()
         self.setup_connections()
     
     def init_ui(self):
         """Initialize the tree widget UI."""
-        self.setHeaderLabel("Database Structure")
         self.setRootIsDecorated(True)
         self.setAlternatingRowColors(True)
+        # Every row uses the same font and icon size, so let Qt measure one
+        self.setUniformRowHeights(True)
+        # Double-click loads documents, it should not also toggle expansion
+        self.setExpandsOnDoubleClick(False)
         self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         
@@ -140,113 +495,69 @@ class DatabaseTreeWidget(QTreeWidget):
     
     def setup_connections(self):
         """Setup signal connections."""
-        self.itemClicked.connect(self.on_item_clicked)
-        self.itemDoubleClicked.connect(self.on_item_double_clicked)
-        self.itemExpanded.connect(self.on_item_expanded)
+        self.clicked.connect(self.on_item_clicked)
+        self.doubleClicked.connect(self.on_item_double_clicked)
+        self.expanded.connect(self.on_item_expanded)
         self.customContextMenuRequested.connect(self.show_context_menu)
     
+    def clear(self):
+        """Remove all databases from the tree."""
+        self.tree_model.set_databases([])
+    
     def populate_databases(self, databases: List[DatabaseInfo]):
         """Populate the tree with database information."""
-        self.clear()
-        
-        for db_info in databases:
-            db_item = QTreeWidgetItem(self)
-            db_item.setText(0, db_info.name)
-            db_item.setIcon(0, qta.icon('fa5s.database', color='#2c3e50'))
-            db_item.setData(0, Qt.UserRole, {'type': 'database', 'info': db_info})
-            
-            # Add database info as tooltip
-            tooltip = f"Database: {db_info.name}\n"
-            tooltip += f"Collections: {db_info.collection_count}\n"
-            tooltip += f"Data Size: {db_info.get_formatted_data_size()}\n"
-            tooltip += f"Storage Size: {format_bytes(db_info.storage_size)}"
-            db_item.setToolTip(0, tooltip)
-            
-            # Add loading placeholder for collections
-            loading_item = QTreeWidgetItem(db_item)
-            loading_item.setText(0, "Loading...")
-            loading_item.setData(0, Qt.UserRole, {'type': 'loading'})
+        self.tree_model.set_databases(databases)
     
     def populate_collections(self, database_name: str, collections: List[CollectionInfo]):
         """Populate collections for a specific database."""
-        # Find the database item
-        db_item = None
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            item_data = item.data(0, Qt.UserRole)
-            if item_data and item_data['type'] == 'database' and item_data['info'].name == database_name:
-                db_item = item
-                break
-        
-        if not db_item:
-            return
-        
-        # Clear existing children
-        db_item.takeChildren()
+        first_load = not self.tree_model.collections_loaded(database_name)
         
-        # Add collections
-        for coll_info in collections:
-            coll_item = QTreeWidgetItem(db_item)
-            coll_item.setText(0, coll_info.name)
-            coll_item.setIcon(0, qta.icon('fa5s.table', color='#3498db'))
-            coll_item.setData(0, Qt.UserRole, {'type': 'collection', 'info': coll_info})
+        # Removal, insertion and expansion are repainted once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            db_index = self.tree_model.set_collections(database_name, collections)
             
-            # Add collection info as tooltip
-            tooltip = f"Collection: {coll_info.name}\n"
-            tooltip += f"Documents: {format_number(coll_info.document_count)}\n"
-            tooltip += f"Data Size: {coll_info.get_formatted_data_size()}\n"
-            tooltip += f"Indexes: {coll_info.index_count}\n"
-            tooltip += f"Average Doc Size: {format_bytes(int(coll_info.avg_document_size))}"
-            coll_item.setToolTip(0, tooltip)
-        
-        # Expand the database item
-        db_item.setExpanded(True)
-    
-    @pyqtSlot(QTreeWidgetItem, int)
-    def on_item_clicked(self, item: QTreeWidgetItem, column: int):
+            # Expand the database item, refreshes keep the user's expansion state
+            if first_load and db_index.isValid():
+                self.expand(db_index)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    @pyqtSlot(QModelIndex)
+    def on_item_clicked(self, index: QModelIndex):
         """Handle item click events."""
-        item_data = item.data(0, Qt.UserRole)
-        if not item_data:
+        node = self.tree_model.node(index)
+        if node is None:
             return
         
-        if item_data['type'] == 'database':
-            db_info = item_data['info']
-            self.logger.debug(f"Selected database: {db_info.name}")
+        if node.kind == 'database':
+            self.logger.debug(f"Selected database: {node.info.name}")
             
-            # Load collections if not already loaded
-            if item.childCount() == 1 and item.child(0).data(0, Qt.UserRole)['type'] == 'loading':
-                self.controller.load_collections(db_info.name)
+            # Load collections if not loaded or no longer fresh
+            self.tree_model.request_collections(node)
         
-        elif item_data['type'] == 'collection':
-            coll_info = item_data['info']
-            self.logger.debug(f"Selected collection: {coll_info.get_full_name()}")
+        elif node.kind == 'collection':
+            self.logger.debug(f"Selected collection: {node.info.get_full_name()}")
     
-    @pyqtSlot(QTreeWidgetItem, int)
-    def on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    @pyqtSlot(QModelIndex)
+    def on_item_double_clicked(self, index: QModelIndex):
         """Handle item double-click events."""
-        item_data = item.data(0, Qt.UserRole)
-        if not item_data:
+        node = self.tree_model.node(index)
+        if node is None:
             return
         
-        if item_data['type'] == 'collection':
-            coll_info = item_data['info']
+        if node.kind == 'collection':
+            coll_info = node.info
             self.logger.info(f"Loading documents from {coll_info.get_full_name()}")
             self.controller.load_documents(coll_info.database, coll_info.name)
     
-    @pyqtSlot(QTreeWidgetItem)
-    def on_item_expanded(self, item: QTreeWidgetItem):
+    @pyqtSlot(QModelIndex)
+    def on_item_expanded(self, index: QModelIndex):
         """Handle item expansion events (when arrow is clicked)."""
-        item_data = item.data(0, Qt.UserRole)
-        if not item_data:
-            return
-        
-        if item_data['type'] == 'database':
-            db_info = item_data['info']
-            self.logger.debug(f"Expanded database: {db_info.name}")
-            
-            # Load collections if not already loaded
-            if item.childCount() == 1 and item.child(0).data(0, Qt.UserRole)['type'] == 'loading':
-                self.controller.load_collections(db_info.name)
+        node = self.tree_model.node(index)
+        if node is not None and node.kind == 'database':
+            # The view asks the model to fetch the collections on expansion
+            self.logger.debug(f"Expanded database: {node.info.name}")
     
     def show_context_menu(self, position):
         """Show context menu for tree items."""
@@ -262,12 +573,23 @@ class MainWindow(QMainWindow):
     query execution, and comprehensive status monitoring.
     """
     
+    # Delay used to coalesce bursts of controller results
+    RESULTS_DEBOUNCE_MS = 50
+    
+    # Delay after the last move or resize before the settings are saved
+    SETTINGS_SAVE_DELAY_MS = 1000
+    
+    # Delay used to coalesce rapid theme changes into one restyle
+    THEME_APPLY_DELAY_MS = 50
+    
     def __init__(self):
         super().__init__()
         # Import config here to avoid circular imports
         from ..config.settings import get_config
         self.config = get_config()
         self.controller = DatabaseController(self.config)
+        # Live application state owned by the controller, updated in place
+        self.state = self.controller.get_application_state()
         self.settings_manager = SettingsManager()
         self.logger = get_logger(__name__)
         
@@ -276,6 +598,33 @@ class MainWindow(QMainWindow):
         self.document_viewer = None
         self.status_widget = None
         
+        # Controller results waiting to be applied; bursts collapse to the latest
+        self._pending_databases: Optional[List[DatabaseInfo]] = None
+        self._pending_collections: Dict[str, List[CollectionInfo]] = {}
+        self._pending_documents: Optional[tuple] = None
+        self._results_timer = QTimer(self)
+        self._results_timer.setSingleShot(True)
+        self._results_timer.setInterval(self.RESULTS_DEBOUNCE_MS)
+        self._results_timer.timeout.connect(self._flush_results)
+        # Set while an auto-refresh load has not reported back
+        self._refresh_in_flight = False
+        # Saves the window settings once moving or resizing has settled
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._settings_timer.timeout.connect(self.save_settings)
+        # Theme applied once the theme changes have settled
+        self._pending_theme: Optional[ThemeType] = None
+        self._theme_timer = QTimer(self)
+        self._theme_timer.setSingleShot(True)
+        self._theme_timer.setInterval(self.THEME_APPLY_DELAY_MS)
+        self._theme_timer.timeout.connect(self._apply_pending_theme)
+        # (widget or action, icon name, color) applied on the first show
+        self._deferred_icons: Optional[List[Tuple[Any, str, str]]] = []
+        # Recent connections the menu was last built from, and its actions
+        self._recent_cache_key: Optional[Tuple[Tuple[str, int, str], ...]] = None
+        self._recent_actions: List[QAction] = []
+        
         # Initialize UI
         self.init_ui()
         self.create_menus()
@@ -340,8 +689,8 @@ class MainWindow(QMainWindow):
         actions_layout.setContentsMargins(5, 5, 5, 5)
         
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.setIcon(qta.icon('fa5s.sync-alt', color='white'))
-        refresh_btn.setObjectName("refresh_button")
+        self._deferred_icons.append((refresh_btn, 'fa5s.sync-alt', 'white'))
+        refresh_btn.setProperty("variant", "refresh")
         refresh_btn.setToolTip("Refresh database structure")
         refresh_btn.clicked.connect(self.refresh_databases)
         actions_layout.addWidget(refresh_btn)
@@ -380,6 +729,7 @@ class MainWindow(QMainWindow):
         
         # Recent connections submenu
         self.recent_menu = file_menu.addMenu('Recent Connections')
+        self.recent_menu.triggered.connect(self._on_recent_action_triggered)
         self.update_recent_connections_menu()
         
         file_menu.addSeparator()
@@ -435,38 +785,16 @@ class MainWindow(QMainWindow):
         theme_menu.setStatusTip('Change application theme')
         
         theme_action_group = QActionGroup(self)
+        theme_action_group.triggered.connect(self._on_theme_action_triggered)
         
-        # Light theme
-        light_theme_action = QAction('&Light Theme', self)
-        light_theme_action.setCheckable(True)
-        light_theme_action.setChecked(theme_manager.get_current_theme() == ThemeType.LIGHT)
-        light_theme_action.triggered.connect(lambda: self.change_theme(ThemeType.LIGHT))
-        theme_action_group.addAction(light_theme_action)
-        theme_menu.addAction(light_theme_action)
-        
-        # Dark theme
-        dark_theme_action = QAction('&Dark Theme', self)
-        dark_theme_action.setCheckable(True)
-        dark_theme_action.setChecked(theme_manager.get_current_theme() == ThemeType.DARK)
-        dark_theme_action.triggered.connect(lambda: self.change_theme(ThemeType.DARK))
-        theme_action_group.addAction(dark_theme_action)
-        theme_menu.addAction(dark_theme_action)
-        
-        # Blue theme
-        blue_theme_action = QAction('&Blue Theme', self)
-        blue_theme_action.setCheckable(True)
-        blue_theme_action.setChecked(theme_manager.get_current_theme() == ThemeType.BLUE)
-        blue_theme_action.triggered.connect(lambda: self.change_theme(ThemeType.BLUE))
-        theme_action_group.addAction(blue_theme_action)
-        theme_menu.addAction(blue_theme_action)
-        
-        # Green theme
-        green_theme_action = QAction('&Green Theme', self)
-        green_theme_action.setCheckable(True)
-        green_theme_action.setChecked(theme_manager.get_current_theme() == ThemeType.GREEN)
-        green_theme_action.triggered.connect(lambda: self.change_theme(ThemeType.GREEN))
-        theme_action_group.addAction(green_theme_action)
-        theme_menu.addAction(green_theme_action)
+        current_theme = theme_manager.get_current_theme()
+        for theme in ThemeType:
+            theme_action = QAction(f'&{theme.value.title()} Theme', self)
+            theme_action.setCheckable(True)
+            theme_action.setChecked(current_theme == theme)
+            theme_action.setData(theme)
+            theme_action_group.addAction(theme_action)
+            theme_menu.addAction(theme_action)
         
         # Tools menu
         tools_menu = menubar.addMenu('&Tools')
@@ -500,12 +828,14 @@ class MainWindow(QMainWindow):
         main_toolbar.setIconSize(QSize(20, 20))
         
         # Connection buttons
-        connect_action = QAction(qta.icon('fa5s.plug', color='white'), 'Connect', self)
+        connect_action = QAction('Connect', self)
+        self._deferred_icons.append((connect_action, 'fa5s.plug', 'white'))
         connect_action.setStatusTip('Connect to a MongoDB database')
         connect_action.triggered.connect(self.show_connection_dialog)
         main_toolbar.addAction(connect_action)
         
-        disconnect_action = QAction(qta.icon('fa5s.times-circle', color='white'), 'Disconnect', self)
+        disconnect_action = QAction('Disconnect', self)
+        self._deferred_icons.append((disconnect_action, 'fa5s.times-circle', 'white'))
         disconnect_action.setStatusTip('Disconnect from current database')
         disconnect_action.triggered.connect(self.disconnect_database)
         main_toolbar.addAction(disconnect_action)
@@ -513,12 +843,14 @@ class MainWindow(QMainWindow):
         main_toolbar.addSeparator()
         
         # View buttons
-        refresh_action = QAction(qta.icon('fa5s.sync-alt', color='white'), 'Refresh', self)
+        refresh_action = QAction('Refresh', self)
+        self._deferred_icons.append((refresh_action, 'fa5s.sync-alt', 'white'))
         refresh_action.setStatusTip('Refresh current view')
         refresh_action.triggered.connect(self.refresh_current_view)
         main_toolbar.addAction(refresh_action)
         
-        export_action = QAction(qta.icon('fa5s.download', color='white'), 'Export', self)
+        export_action = QAction('Export', self)
+        self._deferred_icons.append((export_action, 'fa5s.download', 'white'))
         export_action.setStatusTip('Export current data to file')
         export_action.triggered.connect(self.export_data)
         main_toolbar.addAction(export_action)
@@ -534,6 +866,7 @@ class MainWindow(QMainWindow):
         self.controller.databases_loaded.connect(self.on_databases_loaded)
         self.controller.collections_loaded.connect(self.on_collections_loaded)
         self.controller.documents_loaded.connect(self.on_documents_loaded)
+        self.controller.documents_appended.connect(self.on_documents_appended)
         self.controller.query_executed.connect(self.on_query_executed)
         self.controller.error_occurred.connect(self.on_error_occurred)
         self.controller.performance_updated.connect(self.on_performance_updated)
@@ -551,18 +884,19 @@ class MainWindow(QMainWindow):
     
     def save_settings(self):
         """Save application settings."""
-        self.settings_manager.save_window_geometry(self)
-        self.settings_manager.save_splitter_state(self.main_splitter, "main")
-        self.settings_manager.save_value("auto_refresh", self.auto_refresh_action.isChecked())
-        self.settings_manager.sync()
+        self._settings_timer.stop()
+        with self.settings_manager.batch():
+            self.settings_manager.save_window_geometry(self)
+            self.settings_manager.save_splitter_state(self.main_splitter, "main")
+            self.settings_manager.save_value("auto_refresh", self.auto_refresh_action.isChecked())
+            self.settings_manager.sync()
     
     # Slot methods for controller signals
     
     @pyqtSlot(ConnectionStatus)
     def on_connection_status_changed(self, status: ConnectionStatus):
         """Handle connection status changes."""
-        state = self.controller.get_application_state()
-        self.status_widget.update_connection_status(status, state.current_connection)
+        self.status_widget.update_connection_status(status, self.state.current_connection)
         
         if status == ConnectionStatus.CONNECTED:
             self.logger.info("Connected to database successfully")
@@ -572,20 +906,57 @@ class MainWindow(QMainWindow):
     @pyqtSlot(list)
     def on_databases_loaded(self, databases: List[DatabaseInfo]):
         """Handle databases loaded event."""
-        self.database_tree.populate_databases(databases)
-        self.status_widget.update_performance("Load databases", 0.1, len(databases))
-        self.logger.info(f"Loaded {len(databases)} databases")
+        self._pending_databases = databases
+        self._results_timer.start()
     
     @pyqtSlot(str, list)
     def on_collections_loaded(self, database_name: str, collections: List[CollectionInfo]):
         """Handle collections loaded event."""
-        self.database_tree.populate_collections(database_name, collections)
-        self.status_widget.update_selection(database_name)
-        self.logger.info(f"Loaded {len(collections)} collections for database {database_name}")
+        self._pending_collections.pop(database_name, None)
+        self._pending_collections[database_name] = collections
+        self._results_timer.start()
     
     @pyqtSlot(str, str, list, DocumentStats)
     def on_documents_loaded(self, database: str, collection: str, documents: list, stats: DocumentStats):
         """Handle documents loaded event."""
+        self._refresh_in_flight = False
+        self._pending_documents = (database, collection, documents, stats)
+        self._results_timer.start()
+    
+    @pyqtSlot(str, str, list)
+    def on_documents_appended(self, database: str, collection: str, documents: list):
+        """Handle the next page of documents being loaded."""
+        # Apply a pending full result first so the page lands after it
+        if self._results_timer.isActive():
+            self._results_timer.stop()
+            self._flush_results()
+        self.document_viewer.append_documents(database, collection, documents)
+        self.status_widget.update_performance("Load more documents", 0.5, len(documents))
+        self.logger.info(f"Loaded {len(documents)} more documents from {database}.{collection}")
+    
+    def _flush_results(self):
+        """Apply the latest pending controller results to the views."""
+        databases, self._pending_databases = self._pending_databases, None
+        collections, self._pending_collections = self._pending_collections, {}
+        documents, self._pending_documents = self._pending_documents, None
+        
+        if databases is not None:
+            self.database_tree.populate_databases(databases)
+            self.status_widget.update_performance("Load databases", 0.1, len(databases))
+            self.logger.info(f"Loaded {len(databases)} databases")
+        
+        for database_name, database_collections in collections.items():
+            self.database_tree.populate_collections(database_name, database_collections)
+            self.status_widget.update_selection(database_name)
+            self.logger.info(
+                f"Loaded {len(database_collections)} collections for database {database_name}"
+            )
+        
+        if documents is not None:
+            self._show_documents(*documents)
+    
+    def _show_documents(self, database: str, collection: str, documents: list, stats: DocumentStats):
+        """Display loaded documents."""
         self.document_viewer.display_documents(documents, database, collection, stats)
         self.status_widget.update_selection(database, collection)
         self.status_widget.update_performance("Load documents", 0.5, len(documents))
@@ -605,6 +976,9 @@ class MainWindow(QMainWindow):
     @pyqtSlot(ErrorInfo)
     def on_error_occurred(self, error_info: ErrorInfo):
         """Handle error events."""
+        # A failed load must not block later requests
+        self.database_tree.tree_model.cancel_fetches()
+        self._refresh_in_flight = False
         show_error_message(
             self,
             "Error",
@@ -623,11 +997,18 @@ class MainWindow(QMainWindow):
     
     def show_connection_dialog(self):
         """Show the database connection dialog."""
+        # Imported on first use, the dialog is not needed to show the window
+        from .connection_dialog import ConnectionDialog
+        
         dialog = ConnectionDialog(self, self.controller)
-        if dialog.exec_() == dialog.Accepted:
-            connection_info = dialog.get_connection_info()
-            self.controller.connect_to_database(connection_info)
-            self.update_recent_connections_menu()
+        try:
+            if dialog.exec_() == dialog.Accepted:
+                connection_info = dialog.get_connection_info()
+                self.controller.connect_to_database(connection_info)
+                self.update_recent_connections_menu()
+        finally:
+            # The window owns the dialog, so release it explicitly
+            dialog.deleteLater()
     
     def auto_connect_localhost(self):
         """Automatically connect to localhost MongoDB on startup."""
@@ -656,6 +1037,13 @@ class MainWindow(QMainWindow):
     def disconnect_database(self):
         """Disconnect from the current database."""
         self.controller.disconnect_from_database()
+        
+        # Drop results of the old connection that have not been applied yet
+        self._results_timer.stop()
+        self._pending_databases = None
+        self._pending_collections = {}
+        self._pending_documents = None
+        
         self.database_tree.clear()
         self.document_viewer.clear()
         self.status_widget.update_selection()
@@ -663,10 +1051,11 @@ class MainWindow(QMainWindow):
     def refresh_databases(self):
         """Refresh the database list."""
         self.controller.load_databases()
+        self.database_tree.tree_model.refresh_collections()
     
     def refresh_current_view(self):
         """Refresh the current view."""
-        state = self.controller.get_application_state()
+        state = self.state
         if state.has_selection():
             self.controller.load_documents(
                 state.current_database,
@@ -697,8 +1086,13 @@ class MainWindow(QMainWindow):
     
     def auto_refresh(self):
         """Perform auto-refresh."""
-        state = self.controller.get_application_state()
+        # Nobody sees a hidden window, and a slow previous refresh is still pending
+        if not self.isVisible() or self.isMinimized() or self._refresh_in_flight:
+            return
+        
+        state = self.state
         if state.is_connected() and state.has_selection():
+            self._refresh_in_flight = True
             self.refresh_current_view()
     
     def export_data(self):
@@ -716,8 +1110,22 @@ class MainWindow(QMainWindow):
         # TODO: Implement performance monitor
         show_info_message(self, "Performance Monitor", "Performance monitor coming soon!")
     
+    @pyqtSlot(QAction)
+    def _on_theme_action_triggered(self, action: QAction):
+        """Switch to the theme of a triggered theme menu action."""
+        self.change_theme(action.data())
+    
     def change_theme(self, theme: ThemeType):
         """Change the application theme."""
+        self._pending_theme = theme
+        self._theme_timer.start()
+    
+    def _apply_pending_theme(self):
+        """Apply the latest requested theme."""
+        theme, self._pending_theme = self._pending_theme, None
+        if theme is None:
+            return
+        
         try:
             theme_manager.set_theme(theme)
             self.logger.info(f"Changed theme to: {theme.value}")
@@ -728,45 +1136,67 @@ class MainWindow(QMainWindow):
     
     def show_about(self):
         """Show the about dialog."""
-        about_text = """
-        <h2>MongoDB Visualizer</h2>
-        <p>Version 1.0.0</p>
-        <p>A professional PyQt5-based desktop application for MongoDB database visualization and management.</p>
-        <p>Features:</p>
-        <ul>
-        <li>Database and collection browsing</li>
-        <li>Document visualization and analysis</li>
-        <li>Query execution and history</li>
-        <li>Performance monitoring</li>
-        <li>Data export capabilities</li>
-        </ul>
-        <p>Built with PyQt5 and PyMongo</p>
-        """
-        
-        from PyQt5.QtWidgets import QMessageBox
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle("About MongoDB Visualizer")
-        msg_box.setText(about_text)
+        msg_box.setText(ABOUT_HTML)
         msg_box.setTextFormat(Qt.RichText)
         msg_box.exec_()
     
     def update_recent_connections_menu(self):
         """Update the recent connections menu."""
-        self.recent_menu.clear()
-        
         recent_connections = self.controller.get_recent_connections()
+        key = tuple((c.host, c.port, c.name) for c in recent_connections)
+        if key == self._recent_cache_key:
+            # Keep the actions, but connect with the latest saved settings
+            for action, connection in zip(self._recent_actions, recent_connections):
+                action.setData(connection)
+            return
+        
+        for action in self._recent_actions:
+            self.recent_menu.removeAction(action)
+            action.deleteLater()
+        self._recent_actions = []
+        
         for connection in recent_connections:
             action = self.recent_menu.addAction(connection.get_display_name())
-            action.triggered.connect(
-                lambda checked, conn=connection: self.controller.connect_to_database(conn)
-            )
+            action.setData(connection)
+            self._recent_actions.append(action)
         
         if not recent_connections:
             action = self.recent_menu.addAction("No recent connections")
             action.setEnabled(False)
+            self._recent_actions.append(action)
+        
+        self._recent_cache_key = key
+    
+    def _on_recent_action_triggered(self, action: QAction):
+        """Connect to the connection of a triggered recent connections action."""
+        connection = action.data()
+        if connection is not None:
+            self.controller.connect_to_database(connection)
     
     # Event overrides
     
+    def showEvent(self, event):
+        """Load the toolbar and button icons when the window is first shown."""
+        if self._deferred_icons is not None:
+            for target, name, color in self._deferred_icons:
+                target.setIcon(get_icon(name, color))
+            self._deferred_icons = None
+        super().showEvent(event)
+    
+    def resizeEvent(self, event):
+        """Save the window settings once resizing has settled."""
+        super().resizeEvent(event)
+        if self.isVisible():
+            self._settings_timer.start()
+    
+    def moveEvent(self, event):
+        """Save the window settings once moving has settled."""
+        super().moveEvent(event)
+        if self.isVisible():
+            self._settings_timer.start()
+    
     def closeEvent(self, event):
         """Handle application close event."""
         self.save_settings()
@@ -5,281 +5,382 @@ This module provides syntax highlighting for JSON text and MongoDB queries
 using PyQt5's QSyntaxHighlighter framework.
 """
 
+import bisect
+import functools
 import re
-from typing import List, Tuple
-from PyQt5.QtCore import QRegExp
+import weakref
+from typing import Any, Dict, List, Tuple
+from PyQt5 import sip
 from PyQt5.QtGui import QColor, QTextCharFormat, QFont, QSyntaxHighlighter
 
 
-class JsonSyntaxHighlighter(QSyntaxHighlighter):
+# Theme configurations for different color schemes
+class HighlighterThemes:
+    """Color themes for syntax highlighting."""
+    
+    LIGHT_THEME = {
+        'json_key': QColor(34, 139, 34),      # Forest Green
+        'json_string': QColor(139, 69, 19),   # Saddle Brown
+        'json_number': QColor(0, 0, 255),     # Blue
+        'json_boolean': QColor(255, 20, 147), # Deep Pink
+        'json_null': QColor(128, 128, 128),   # Gray
+        'mongo_operator': QColor(255, 140, 0), # Dark Orange
+        'mongo_objectid': QColor(75, 0, 130), # Indigo
+        'mongo_date': QColor(75, 0, 130),     # Indigo
+        'mongo_regex': QColor(220, 20, 60),   # Crimson
+        'structure': QColor(128, 0, 128),     # Purple
+        'comment': QColor(128, 128, 128),     # Gray
+        'log_error': QColor(255, 0, 0),       # Red
+        'log_warning': QColor(255, 165, 0),   # Orange
+        'log_info': QColor(0, 128, 0),        # Green
+        'log_debug': QColor(128, 128, 128),   # Gray
+        'log_timestamp': QColor(0, 0, 255),   # Blue
+        'log_module': QColor(128, 0, 128),    # Purple
+    }
+    
+    DARK_THEME = {
+        'json_key': QColor(144, 238, 144),    # Light Green
+        'json_string': QColor(255, 218, 185), # Peach Puff
+        'json_number': QColor(135, 206, 250), # Light Sky Blue
+        'json_boolean': QColor(255, 182, 193), # Light Pink
+        'json_null': QColor(192, 192, 192),   # Silver
+        'mongo_operator': QColor(255, 215, 0), # Gold
+        'mongo_objectid': QColor(186, 85, 211), # Medium Orchid
+        'mongo_date': QColor(186, 85, 211),   # Medium Orchid
+        'mongo_regex': QColor(250, 128, 114), # Salmon
+        'structure': QColor(221, 160, 221),   # Plum
+        'comment': QColor(169, 169, 169),     # Dark Gray
+        'log_error': QColor(255, 99, 71),     # Tomato
+        'log_warning': QColor(255, 215, 0),   # Gold
+        'log_info': QColor(144, 238, 144),    # Light Green
+        'log_debug': QColor(169, 169, 169),   # Dark Gray
+        'log_timestamp': QColor(135, 206, 250), # Light Sky Blue
+        'log_module': QColor(221, 160, 221),  # Plum
+    }
+
+
+# Formats of the shared highlighting rules by theme color role
+_themed_formats: Dict[str, List[QTextCharFormat]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _themed_format(role: str, bold: bool = False, italic: bool = False) -> QTextCharFormat:
+    """Get the shared rule format of a theme role and font style, recolored by apply_theme."""
+    text_format = QTextCharFormat()
+    text_format.setForeground(HighlighterThemes.LIGHT_THEME[role])
+    if bold:
+        text_format.setFontWeight(QFont.Bold)
+    if italic:
+        text_format.setFontItalic(True)
+    _themed_formats.setdefault(role, []).append(text_format)
+    return text_format
+
+
+# Live highlighters using the shared formats, rehighlighted by apply_theme
+_highlighters: "weakref.WeakSet[QSyntaxHighlighter]" = weakref.WeakSet()
+
+
+class TextRule:
     """
-    Syntax highlighter for JSON text.
+    Named patterns combined into one alternation matched with Python's re.
     
-    Provides color highlighting for JSON strings, numbers, booleans,
-    null values, keys, and structural elements.
+    A block is scanned once for all of them: at each position the first
+    pattern that matches wins, so tokens never overlap. The rule's format
+    is a dict from pattern name to format, or to a dict from matched text
+    to format for patterns whose matches are only partly highlighted.
+    """
+    
+    __slots__ = ('pattern',)
+    
+    def __init__(self, patterns: List[Tuple[str, str]]):
+        self.pattern = re.compile('|'.join(f'(?P<{name}>{regex})' for name, regex in patterns))
+
+
+class RuleHighlighter(QSyntaxHighlighter):
     """
+    Syntax highlighter applying a list of (pattern, format) rules.
+    
+    Subclasses set RULES at class level, so the patterns are compiled once
+    and shared by every highlighter of that kind. A pattern is either a
+    compiled re pattern with a single format or a TextRule with a format
+    per name.
+    """
+    
+    RULES: List[Tuple[Any, Any]] = []
+    
+    # Number of distinct block texts whose matches are remembered
+    SPAN_CACHE_SIZE = 4096
     
     def __init__(self, document):
         super().__init__(document)
+        # (start, length, format) spans by block text; Qt clears a block's
+        # formats before highlighting it, so unchanged text still needs its
+        # spans applied, but the matching itself can be skipped
+        self._block_spans: Dict[str, List[Tuple[int, int, QTextCharFormat]]] = {}
         self.setup_highlighting_rules()
+        _highlighters.add(self)
     
     def setup_highlighting_rules(self):
-        """Setup syntax highlighting rules for JSON."""
-        self.highlighting_rules = []
+        """Setup the syntax highlighting rules of this highlighter kind."""
+        self.highlighting_rules = self.RULES
+    
+    def rules_for_block(self, text: str) -> List[Tuple[Any, Any]]:
+        """Get the rules that can match in a block of text."""
+        return self.highlighting_rules
+    
+    def highlightBlock(self, text):
+        """Apply highlighting to a block of text."""
+        # Blank lines are frequent while editing and never match anything
+        if not text or text.isspace():
+            return
         
-        # JSON Key format (property names)
-        key_format = QTextCharFormat()
-        key_format.setForeground(QColor(34, 139, 34))  # Forest Green
-        key_format.setFontWeight(QFont.Bold)
-        key_pattern = QRegExp(r'"[^"]*"(?=\s*:)')
-        self.highlighting_rules.append((key_pattern, key_format))
+        spans = self._block_spans.get(text)
+        if spans is None:
+            spans = self.match_spans(text)
+            if len(self._block_spans) >= self.SPAN_CACHE_SIZE:
+                self._block_spans.clear()
+            self._block_spans[text] = spans
         
-        # JSON String values
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor(139, 69, 19))  # Saddle Brown
-        string_pattern = QRegExp(r'"[^"]*"(?!\s*:)')
-        self.highlighting_rules.append((string_pattern, string_format))
+        for start, length, format in spans:
+            self.setFormat(start, length, format)
+    
+    def match_spans(self, text: str) -> List[Tuple[int, int, QTextCharFormat]]:
+        """
+        Match the highlighting rules against a block of text.
         
-        # JSON Numbers
-        number_format = QTextCharFormat()
-        number_format.setForeground(QColor(0, 0, 255))  # Blue
-        number_pattern = QRegExp(r'\b-?\d+\.?\d*([eE][+-]?\d+)?\b')
-        self.highlighting_rules.append((number_pattern, number_format))
+        Args:
+            text: Text of the block
+            
+        Returns:
+            (start, length, format) spans in Qt's UTF-16 offsets
+        """
+        spans = []
         
-        # JSON Boolean values
-        boolean_format = QTextCharFormat()
-        boolean_format.setForeground(QColor(255, 20, 147))  # Deep Pink
-        boolean_format.setFontWeight(QFont.Bold)
-        boolean_pattern = QRegExp(r'\b(true|false)\b')
-        self.highlighting_rules.append((boolean_pattern, boolean_format))
+        # Qt offsets count UTF-16 units, where astral characters take two
+        if text.isascii() or max(text) <= '\uffff':
+            astral = None
+        else:
+            astral = [i for i, char in enumerate(text) if char > '\uffff']
         
-        # JSON null values
-        null_format = QTextCharFormat()
-        null_format.setForeground(QColor(128, 128, 128))  # Gray
-        null_format.setFontWeight(QFont.Bold)
-        null_pattern = QRegExp(r'\bnull\b')
-        self.highlighting_rules.append((null_pattern, null_format))
+        # Apply all highlighting rules
+        for expression, format in self.rules_for_block(text):
+            if isinstance(expression, TextRule):
+                pattern, formats = expression.pattern, format
+            else:
+                pattern, formats = expression, None
+            
+            for match in pattern.finditer(text):
+                start, end = match.span()
+                if astral:
+                    start += bisect.bisect_left(astral, start)
+                    end += bisect.bisect_left(astral, end)
+                if formats is not None:
+                    format = formats[match.lastgroup]
+                    if type(format) is dict:
+                        format = format.get(match.group())
+                        if format is None:
+                            continue
+                spans.append((start, end - start, format))
         
-        # JSON Structural characters
-        structure_format = QTextCharFormat()
-        structure_format.setForeground(QColor(128, 0, 128))  # Purple
-        structure_format.setFontWeight(QFont.Bold)
-        structure_pattern = QRegExp(r'[{}[\]:,]')
-        self.highlighting_rules.append((structure_pattern, structure_format))
+        return spans
+
+
+def _build_json_rules() -> List[Tuple[Any, Any]]:
+    """Build the highlighting rules for JSON, a single tokenizing TextRule."""
+    patterns = []
+    formats = {}
     
-    def highlightBlock(self, text):
-        """Apply highlighting to a block of text."""
-        # Apply all highlighting rules
-        for pattern, format in self.highlighting_rules:
-            expression = QRegExp(pattern)
-            index = expression.indexIn(text)
-            while index >= 0:
-                length = expression.matchedLength()
-                self.setFormat(index, length, format)
-                index = expression.indexIn(text, index + length)
+    # JSON Key format (property names)
+    formats['key'] = _themed_format('json_key', bold=True)
+    patterns.append(('key', r'"[^"]*"(?=\s*:)'))
+    
+    # JSON String values
+    formats['string'] = _themed_format('json_string')
+    patterns.append(('string', r'"[^"]*"'))
+    
+    # JSON Numbers
+    formats['number'] = _themed_format('json_number')
+    patterns.append(('number', r'\b-?\d+\.?\d*(?:[eE][+-]?\d+)?\b'))
+    
+    # JSON Boolean values
+    formats['boolean'] = _themed_format('json_boolean', bold=True)
+    patterns.append(('boolean', r'\b(?:true|false)\b'))
+    
+    # JSON null values
+    formats['null'] = _themed_format('json_null', bold=True)
+    patterns.append(('null', r'\bnull\b'))
+    
+    # JSON Structural characters
+    formats['structure'] = _themed_format('structure', bold=True)
+    patterns.append(('structure', r'[{}[\]:,]'))
+    
+    return [(TextRule(patterns), formats)]
 
 
-class MongoQueryHighlighter(QSyntaxHighlighter):
+class JsonSyntaxHighlighter(RuleHighlighter):
+    """
+    Syntax highlighter for JSON text.
+    
+    Provides color highlighting for JSON strings, numbers, booleans,
+    null values, keys, and structural elements.
+    """
+    
+    # Compiled once at import and shared by every instance
+    RULES = _build_json_rules()
+
+
+# MongoDB operator names highlighted in queries
+_MONGO_OPERATORS = frozenset((
+    # Query operators
+    'eq', 'ne', 'gt', 'gte', 'lt', 'lte', 'in', 'nin', 'exists', 'type',
+    'regex', 'options', 'where', 'all', 'elemMatch', 'size', 'mod',
+    # Logical operators
+    'and', 'or', 'not', 'nor',
+    # Update operators
+    'set', 'unset', 'inc', 'mul', 'rename', 'setOnInsert', 'push', 'pull',
+    'addToSet', 'pop', 'pullAll', 'each', 'slice', 'sort', 'position',
+    # Aggregation operators
+    'match', 'group', 'limit', 'skip', 'project', 'unwind', 'lookup',
+    'addFields', 'replaceRoot', 'facet', 'bucket', 'sample', 'count', 'sum',
+    'avg', 'min', 'max', 'first', 'last',
+))
+
+# Any $-prefixed word; the names are looked up in _MONGO_OPERATORS, which
+# is cheaper than trying every operator as a regex alternative
+_MONGO_OPERATOR_PATTERN = r'\$[a-zA-Z]+\b'
+
+
+def _build_mongo_rules() -> List[Tuple[Any, Any]]:
+    """Build the highlighting rules for MongoDB queries, a single tokenizing TextRule."""
+    patterns = []
+    formats = {}
+    
+    # Comments (for documentation purposes), ahead of regular expressions
+    formats['comment'] = _themed_format('comment', italic=True)
+    patterns.append(('comment', r'//[^\n]*'))
+    
+    # ObjectId pattern
+    formats['objectid'] = _themed_format('mongo_objectid', bold=True)
+    patterns.append(('objectid', r'ObjectId\("[\da-fA-F]{24}"\)'))
+    
+    # ISODate pattern, bounded so a half-typed date fails fast
+    formats['isodate'] = _themed_format('mongo_date')
+    patterns.append(('isodate', r'ISODate\("[^"]{0,64}"\)'))
+    
+    # Field names (keys in quotes)
+    formats['key'] = _themed_format('json_key', bold=True)
+    patterns.append(('key', r'"[^"]*"(?=\s*:)'))
+    
+    # String values
+    formats['string'] = _themed_format('json_string')
+    patterns.append(('string', r'"[^"]*"'))
+    
+    # MongoDB operators
+    formats['operator'] = dict.fromkeys(
+        ('$' + op for op in _MONGO_OPERATORS), _themed_format('mongo_operator', bold=True)
+    )
+    patterns.append(('operator', _MONGO_OPERATOR_PATTERN))
+    
+    # Numbers
+    formats['number'] = _themed_format('json_number')
+    patterns.append(('number', r'\b-?\d+\.?\d*(?:[eE][+-]?\d+)?\b'))
+    
+    # Boolean values
+    formats['boolean'] = _themed_format('json_boolean', bold=True)
+    patterns.append(('boolean', r'\b(?:true|false)\b'))
+    
+    # null values
+    formats['null'] = _themed_format('json_null', bold=True)
+    patterns.append(('null', r'\bnull\b'))
+    
+    # Regular expressions, bounded so an unterminated slash fails fast
+    formats['regex'] = _themed_format('mongo_regex', italic=True)
+    patterns.append(('regex', r'/[^/\n]{0,256}/'))
+    
+    # Structural characters
+    formats['structure'] = _themed_format('structure', bold=True)
+    patterns.append(('structure', r'[{}[\]:,]'))
+    
+    return [(TextRule(patterns), formats)]
+
+
+class MongoQueryHighlighter(RuleHighlighter):
     """
     Syntax highlighter for MongoDB queries.
     
     Extends JSON highlighting with MongoDB-specific operators and functions.
     """
     
-    def __init__(self, document):
-        super().__init__(document)
-        self.setup_highlighting_rules()
+    # Compiled once at import and shared by every instance
+    RULES = _build_mongo_rules()
+
+
+def _build_log_rules() -> List[Tuple[Any, Any]]:
+    """Build the (pattern, format) highlighting rules for log files."""
+    rules = []
     
-    def setup_highlighting_rules(self):
-        """Setup syntax highlighting rules for MongoDB queries."""
-        self.highlighting_rules = []
-        
-        # MongoDB operators
-        operator_format = QTextCharFormat()
-        operator_format.setForeground(QColor(255, 140, 0))  # Dark Orange
-        operator_format.setFontWeight(QFont.Bold)
-        
-        # Query operators
-        query_operators = [
-            r'\$eq\b', r'\$ne\b', r'\$gt\b', r'\$gte\b', r'\$lt\b', r'\$lte\b',
-            r'\$in\b', r'\$nin\b', r'\$exists\b', r'\$type\b', r'\$regex\b',
-            r'\$options\b', r'\$where\b', r'\$all\b', r'\$elemMatch\b',
-            r'\$size\b', r'\$mod\b'
-        ]
-        
-        # Logical operators
-        logical_operators = [
-            r'\$and\b', r'\$or\b', r'\$not\b', r'\$nor\b'
-        ]
-        
-        # Update operators
-        update_operators = [
-            r'\$set\b', r'\$unset\b', r'\$inc\b', r'\$mul\b', r'\$rename\b',
-            r'\$setOnInsert\b', r'\$push\b', r'\$pull\b', r'\$addToSet\b',
-            r'\$pop\b', r'\$pullAll\b', r'\$each\b', r'\$slice\b', r'\$sort\b',
-            r'\$position\b'
-        ]
-        
-        # Aggregation operators
-        aggregation_operators = [
-            r'\$match\b', r'\$group\b', r'\$sort\b', r'\$limit\b', r'\$skip\b',
-            r'\$project\b', r'\$unwind\b', r'\$lookup\b', r'\$addFields\b',
-            r'\$replaceRoot\b', r'\$facet\b', r'\$bucket\b', r'\$sample\b',
-            r'\$count\b', r'\$sum\b', r'\$avg\b', r'\$min\b', r'\$max\b',
-            r'\$first\b', r'\$last\b', r'\$push\b', r'\$addToSet\b'
-        ]
-        
-        # Combine all operators
-        all_operators = query_operators + logical_operators + update_operators + aggregation_operators
-        
-        for op in all_operators:
-            pattern = QRegExp(op)
-            self.highlighting_rules.append((pattern, operator_format))
-        
-        # Field names (keys in quotes)
-        key_format = QTextCharFormat()
-        key_format.setForeground(QColor(34, 139, 34))  # Forest Green
-        key_format.setFontWeight(QFont.Bold)
-        key_pattern = QRegExp(r'"[^"]*"(?=\s*:)')
-        self.highlighting_rules.append((key_pattern, key_format))
-        
-        # String values
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor(139, 69, 19))  # Saddle Brown
-        string_pattern = QRegExp(r'"[^"]*"(?!\s*:)')
-        self.highlighting_rules.append((string_pattern, string_format))
-        
-        # Numbers
-        number_format = QTextCharFormat()
-        number_format.setForeground(QColor(0, 0, 255))  # Blue
-        number_pattern = QRegExp(r'\b-?\d+\.?\d*([eE][+-]?\d+)?\b')
-        self.highlighting_rules.append((number_pattern, number_format))
-        
-        # Boolean values
-        boolean_format = QTextCharFormat()
-        boolean_format.setForeground(QColor(255, 20, 147))  # Deep Pink
-        boolean_format.setFontWeight(QFont.Bold)
-        boolean_pattern = QRegExp(r'\b(true|false)\b')
-        self.highlighting_rules.append((boolean_pattern, boolean_format))
-        
-        # null values
-        null_format = QTextCharFormat()
-        null_format.setForeground(QColor(128, 128, 128))  # Gray
-        null_format.setFontWeight(QFont.Bold)
-        null_pattern = QRegExp(r'\bnull\b')
-        self.highlighting_rules.append((null_pattern, null_format))
-        
-        # ObjectId pattern
-        objectid_format = QTextCharFormat()
-        objectid_format.setForeground(QColor(75, 0, 130))  # Indigo
-        objectid_format.setFontWeight(QFont.Bold)
-        objectid_pattern = QRegExp(r'ObjectId\("[\da-fA-F]{24}"\)')
-        self.highlighting_rules.append((objectid_pattern, objectid_format))
-        
-        # ISODate pattern
-        isodate_format = QTextCharFormat()
-        isodate_format.setForeground(QColor(75, 0, 130))  # Indigo
-        isodate_pattern = QRegExp(r'ISODate\("[^"]*"\)')
-        self.highlighting_rules.append((isodate_pattern, isodate_format))
-        
-        # Regular expressions
-        regex_format = QTextCharFormat()
-        regex_format.setForeground(QColor(220, 20, 60))  # Crimson
-        regex_format.setFontItalic(True)
-        regex_pattern = QRegExp(r'/[^/]*/')
-        self.highlighting_rules.append((regex_pattern, regex_format))
-        
-        # Comments (for documentation purposes)
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor(128, 128, 128))  # Gray
-        comment_format.setFontItalic(True)
-        comment_pattern = QRegExp(r'//[^\n]*')
-        self.highlighting_rules.append((comment_pattern, comment_format))
-        
-        # Structural characters
-        structure_format = QTextCharFormat()
-        structure_format.setForeground(QColor(128, 0, 128))  # Purple
-        structure_format.setFontWeight(QFont.Bold)
-        structure_pattern = QRegExp(r'[{}[\]:,]')
-        self.highlighting_rules.append((structure_pattern, structure_format))
+    # Error level
+    error_format = _themed_format('log_error', bold=True)
+    error_pattern = re.compile(r'\bERROR\b|\bFATAL\b|\bCRITICAL\b')
+    rules.append((error_pattern, error_format))
     
-    def highlightBlock(self, text):
-        """Apply highlighting to a block of text."""
-        # Apply all highlighting rules
-        for pattern, format in self.highlighting_rules:
-            expression = QRegExp(pattern)
-            index = expression.indexIn(text)
-            while index >= 0:
-                length = expression.matchedLength()
-                self.setFormat(index, length, format)
-                index = expression.indexIn(text, index + length)
+    # Warning level
+    warning_format = _themed_format('log_warning', bold=True)
+    warning_pattern = re.compile(r'\bWARN\b|\bWARNING\b')
+    rules.append((warning_pattern, warning_format))
+    
+    # Info level
+    info_format = _themed_format('log_info')
+    info_pattern = re.compile(r'\bINFO\b')
+    rules.append((info_pattern, info_format))
+    
+    # Debug level
+    debug_format = _themed_format('log_debug')
+    debug_pattern = re.compile(r'\bDEBUG\b')
+    rules.append((debug_pattern, debug_format))
+    
+    # Timestamps
+    timestamp_format = _themed_format('log_timestamp')
+    timestamp_pattern = re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}')
+    rules.append((timestamp_pattern, timestamp_format))
+    
+    # Class/module names, kept last for LogHighlighter.rules_for_block
+    module_format = _themed_format('log_module')
+    module_pattern = re.compile(r'(?:[a-zA-Z_][a-zA-Z0-9_]*\.)+[a-zA-Z_][a-zA-Z0-9_]*')
+    rules.append((module_pattern, module_format))
+    
+    return rules
 
 
-class LogHighlighter(QSyntaxHighlighter):
+class LogHighlighter(RuleHighlighter):
     """Syntax highlighter for log files."""
     
-    def __init__(self, document):
-        super().__init__(document)
-        self.setup_highlighting_rules()
+    # Compiled once at import and shared by every instance
+    RULES = _build_log_rules()
     
-    def setup_highlighting_rules(self):
-        """Setup syntax highlighting rules for log files."""
-        self.highlighting_rules = []
-        
-        # Error level
-        error_format = QTextCharFormat()
-        error_format.setForeground(QColor(255, 0, 0))  # Red
-        error_format.setFontWeight(QFont.Bold)
-        error_pattern = QRegExp(r'\bERROR\b|\bFATAL\b|\bCRITICAL\b')
-        self.highlighting_rules.append((error_pattern, error_format))
-        
-        # Warning level
-        warning_format = QTextCharFormat()
-        warning_format.setForeground(QColor(255, 165, 0))  # Orange
-        warning_format.setFontWeight(QFont.Bold)
-        warning_pattern = QRegExp(r'\bWARN\b|\bWARNING\b')
-        self.highlighting_rules.append((warning_pattern, warning_format))
-        
-        # Info level
-        info_format = QTextCharFormat()
-        info_format.setForeground(QColor(0, 128, 0))  # Green
-        info_pattern = QRegExp(r'\bINFO\b')
-        self.highlighting_rules.append((info_pattern, info_format))
-        
-        # Debug level
-        debug_format = QTextCharFormat()
-        debug_format.setForeground(QColor(128, 128, 128))  # Gray
-        debug_pattern = QRegExp(r'\bDEBUG\b')
-        self.highlighting_rules.append((debug_pattern, debug_format))
-        
-        # Timestamps
-        timestamp_format = QTextCharFormat()
-        timestamp_format.setForeground(QColor(0, 0, 255))  # Blue
-        timestamp_pattern = QRegExp(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}')
-        self.highlighting_rules.append((timestamp_pattern, timestamp_format))
-        
-        # Class/module names
-        module_format = QTextCharFormat()
-        module_format.setForeground(QColor(128, 0, 128))  # Purple
-        module_pattern = QRegExp(r'[a-zA-Z_][a-zA-Z0-9_.]*\.[a-zA-Z_][a-zA-Z0-9_]*')
-        self.highlighting_rules.append((module_pattern, module_format))
+    # Rules for lines without a dot, which the module name rule needs
+    DOTLESS_RULES = RULES[:-1]
     
-    def highlightBlock(self, text):
-        """Apply highlighting to a block of text."""
-        # Apply all highlighting rules
-        for pattern, format in self.highlighting_rules:
-            expression = QRegExp(pattern)
-            index = expression.indexIn(text)
-            while index >= 0:
-                length = expression.matchedLength()
-                self.setFormat(index, length, format)
-                index = expression.indexIn(text, index + length)
+    def rules_for_block(self, text: str) -> List[Tuple[Any, Any]]:
+        """Get the rules that can match in a block of text."""
+        return self.highlighting_rules if '.' in text else self.DOTLESS_RULES
+
+
+# Highlighter classes by create_highlighter type name
+_HIGHLIGHTER_TYPES = {
+    'json': JsonSyntaxHighlighter,
+    'mongo': MongoQueryHighlighter,
+    'log': LogHighlighter,
+}
 
 
 def create_highlighter(highlighter_type: str, document):
     """
     Factory function to create syntax highlighters.
     
+    A document already highlighted by the requested kind keeps its
+    highlighter, which is returned instead of attaching a second one.
+    
     Args:
         highlighter_type: Type of highlighter ('json', 'mongo', 'log')
         document: QTextDocument to highlight
@@ -287,53 +388,36 @@ def create_highlighter(highlighter_type: str, document):
     Returns:
         QSyntaxHighlighter instance
     """
-    if highlighter_type.lower() == 'json':
-        return JsonSyntaxHighlighter(document)
-    elif highlighter_type.lower() == 'mongo':
-        return MongoQueryHighlighter(document)
-    elif highlighter_type.lower() == 'log':
-        return LogHighlighter(document)
-    else:
+    highlighter_class = _HIGHLIGHTER_TYPES.get(highlighter_type.lower())
+    if highlighter_class is None:
         raise ValueError(f"Unknown highlighter type: {highlighter_type}")
-
-
-# Theme configurations for different color schemes
-class HighlighterThemes:
-    """Color themes for syntax highlighting."""
-    
-    LIGHT_THEME = {
-        'json_key': QColor(34, 139, 34),      # Forest Green
-        'json_string': QColor(139, 69, 19),   # Saddle Brown
-        'json_number': QColor(0, 0, 255),     # Blue
-        'json_boolean': QColor(255, 20, 147), # Deep Pink
-        'json_null': QColor(128, 128, 128),   # Gray
-        'mongo_operator': QColor(255, 140, 0), # Dark Orange
-        'structure': QColor(128, 0, 128),     # Purple
-        'comment': QColor(128, 128, 128),     # Gray
-    }
     
-    DARK_THEME = {
-        'json_key': QColor(144, 238, 144),    # Light Green
-        'json_string': QColor(255, 218, 185), # Peach Puff
-        'json_number': QColor(135, 206, 250), # Light Sky Blue
-        'json_boolean': QColor(255, 182, 193), # Light Pink
-        'json_null': QColor(192, 192, 192),   # Silver
-        'mongo_operator': QColor(255, 215, 0), # Gold
-        'structure': QColor(221, 160, 221),   # Plum
-        'comment': QColor(169, 169, 169),     # Dark Gray
-    }
+    for highlighter in document.findChildren(QSyntaxHighlighter):
+        if type(highlighter) is highlighter_class:
+            return highlighter
+    return highlighter_class(document)
 
 
 def apply_theme(highlighter, theme_name: str = 'light'):
     """
     Apply a color theme to a syntax highlighter.
     
+    The rule formats are shared, so every live highlighter takes the
+    theme and is rehighlighted; only their colors change and the rules
+    are kept.
+    
     Args:
-        highlighter: QSyntaxHighlighter instance
+        highlighter: QSyntaxHighlighter instance, rehighlighted even if it
+            does not use the shared formats
         theme_name: Name of the theme ('light' or 'dark')
     """
     theme = HighlighterThemes.LIGHT_THEME if theme_name == 'light' else HighlighterThemes.DARK_THEME
     
-    # This would require modifying the highlighter to accept theme colors
-    # Implementation would depend on specific highlighter design
-    pass
+    for role, formats in _themed_formats.items():
+        color = theme[role]
+        for text_format in formats:
+            text_format.setForeground(color)
+    
+    for live in {highlighter, *_highlighters}:
+        if not sip.isdeleted(live):
+            live.rehighlight()
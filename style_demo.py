@@ -18,19 +18,45 @@ from PyQt5.QtWidgets import (
     QSpinBox, QCheckBox, QGroupBox, QFormLayout, QTreeWidget, QTreeWidgetItem,
     QTableWidget, QTableWidgetItem, QFrame, QProgressBar, QSplitter
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 import qtawesome as qta
 
 from src.styles.theme_manager import theme_manager, ThemeType
 from src.styles.modern_styles import ModernStyles
 
+# Stylesheet templates, filled from ModernStyles.COLORS when the tabs are built
+HEADER_STYLE = "font-size: 24px; font-weight: bold; padding: 16px; color: {primary}"
+
+CARD_STYLE = """
+    QFrame {{
+        background-color: {surface};
+        border: 1px solid {border};
+        border-radius: 12px;
+        padding: 16px;
+        margin: 8px 0px;
+    }}
+    QFrame:hover {{
+        border-color: {primary};
+        box-shadow: 0 4px 12px {shadow};
+    }}
+"""
+
 
 class StyleDemoWindow(QMainWindow):
     """Demonstration window for modern styles."""
     
+    # Delay used to coalesce rapid theme changes into one restyle
+    THEME_APPLY_DELAY_MS = 50
+    
     def __init__(self):
         super().__init__()
+        # Theme applied once the theme button clicks have settled
+        self._pending_theme = None
+        self._theme_timer = QTimer(self)
+        self._theme_timer.setSingleShot(True)
+        self._theme_timer.setInterval(self.THEME_APPLY_DELAY_MS)
+        self._theme_timer.timeout.connect(self._apply_pending_theme)
         self.init_ui()
         
     def init_ui(self):
@@ -49,7 +75,8 @@ class StyleDemoWindow(QMainWindow):
         tab_widget = QTabWidget()
         main_layout.addWidget(tab_widget)
         
-        # Add tabs
+        # Add tabs, sharing one header stylesheet
+        self.header_style = HEADER_STYLE.format(**ModernStyles.COLORS)
         self.create_components_tab(tab_widget)
         self.create_forms_tab(tab_widget)
         self.create_data_tab(tab_widget)
@@ -68,8 +95,7 @@ class StyleDemoWindow(QMainWindow):
         
         # Header
         header = QLabel("UI Components Showcase")
-        header.setStyleSheet("font-size: 24px; font-weight: bold; padding: 16px; color: " + 
-                           ModernStyles.COLORS['primary'])
+        header.setStyleSheet(self.header_style)
         layout.addWidget(header)
         
         # Buttons section
@@ -114,19 +140,7 @@ class StyleDemoWindow(QMainWindow):
         cards_layout = QVBoxLayout(cards_group)
         
         card1 = QFrame()
-        card1.setStyleSheet(f"""
-            QFrame {{
-                background-color: {ModernStyles.COLORS['surface']};
-                border: 1px solid {ModernStyles.COLORS['border']};
-                border-radius: 12px;
-                padding: 16px;
-                margin: 8px 0px;
-            }}
-            QFrame:hover {{
-                border-color: {ModernStyles.COLORS['primary']};
-                box-shadow: 0 4px 12px {ModernStyles.COLORS['shadow']};
-            }}
-        """)
+        card1.setStyleSheet(CARD_STYLE.format(**ModernStyles.COLORS))
         card1_layout = QVBoxLayout(card1)
         card1_layout.addWidget(QLabel("Sample Document Card"))
         card1_layout.addWidget(QLabel("This demonstrates how documents appear in the viewer"))
@@ -144,8 +158,7 @@ class StyleDemoWindow(QMainWindow):
         
         # Header
         header = QLabel("Form Controls")
-        header.setStyleSheet("font-size: 24px; font-weight: bold; padding: 16px; color: " + 
-                           ModernStyles.COLORS['primary'])
+        header.setStyleSheet(self.header_style)
         layout.addWidget(header)
         
         # Form group
@@ -194,8 +207,7 @@ class StyleDemoWindow(QMainWindow):
         
         # Header
         header = QLabel("Data Visualization")
-        header.setStyleSheet("font-size: 24px; font-weight: bold; padding: 16px; color: " + 
-                           ModernStyles.COLORS['primary'])
+        header.setStyleSheet(self.header_style)
         layout.addWidget(header)
         
         # Splitter with tree and table
@@ -221,11 +233,7 @@ class StyleDemoWindow(QMainWindow):
         tree.expandAll()
         splitter.addWidget(tree)
         
-        # Table widget
-        table = QTableWidget(5, 3)
-        table.setHorizontalHeaderLabels(["Field", "Type", "Value"])
-        
-        # Add sample data
+        # Sample data
         sample_data = [
             ["_id", "ObjectId", "507f1f77bcf86cd799439011"],
             ["name", "String", "John Doe"],
@@ -234,10 +242,15 @@ class StyleDemoWindow(QMainWindow):
             ["active", "Boolean", "true"]
         ]
         
-        for row, (field, type_val, value) in enumerate(sample_data):
-            table.setItem(row, 0, QTableWidgetItem(field))
-            table.setItem(row, 1, QTableWidgetItem(type_val))
-            table.setItem(row, 2, QTableWidgetItem(value))
+        # Table widget, sized for the data up front and filled in one batch
+        table = QTableWidget(len(sample_data), 3)
+        table.setHorizontalHeaderLabels(["Field", "Type", "Value"])
+        
+        table.setUpdatesEnabled(False)
+        for row, values in enumerate(sample_data):
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(value))
+        table.setUpdatesEnabled(True)
         
         table.resizeColumnsToContents()
         splitter.addWidget(table)
@@ -254,8 +267,7 @@ class StyleDemoWindow(QMainWindow):
         
         # Header
         header = QLabel("Theme Selection")
-        header.setStyleSheet("font-size: 24px; font-weight: bold; padding: 16px; color: " + 
-                           ModernStyles.COLORS['primary'])
+        header.setStyleSheet(self.header_style)
         layout.addWidget(header)
         
         # Theme buttons
@@ -296,6 +308,15 @@ class StyleDemoWindow(QMainWindow):
     
     def change_theme(self, theme: ThemeType):
         """Change the application theme."""
+        self._pending_theme = theme
+        self._theme_timer.start()
+    
+    def _apply_pending_theme(self):
+        """Apply the latest requested theme."""
+        theme, self._pending_theme = self._pending_theme, None
+        if theme is None:
+            return
+        
         theme_manager.set_theme(theme)
         self.statusBar().showMessage(f"Theme changed to: {theme.value.title()}")
 
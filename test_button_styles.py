@@ -22,31 +22,24 @@ class ButtonTestWidget(QWidget):
         
         layout = QVBoxLayout()
         
-        # Create test buttons with the problematic object names
+        # Create test buttons with the problematic style variants
         button_layout = QHBoxLayout()
         
-        # Execute button test
-        execute_btn = QPushButton("Execute Query")
-        execute_btn.setObjectName("execute_button")
-        button_layout.addWidget(execute_btn)
-        
-        # Clear button test
-        clear_btn = QPushButton("Clear")
-        clear_btn.setObjectName("clear_button")
-        button_layout.addWidget(clear_btn)
-        
-        # Other enhanced buttons for comparison
-        connect_btn = QPushButton("Connect")
-        connect_btn.setObjectName("connect_button")
-        button_layout.addWidget(connect_btn)
-        
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.setObjectName("refresh_button")
-        button_layout.addWidget(refresh_btn)
-        
-        # Regular button without special styling
-        regular_btn = QPushButton("Regular Button")
-        button_layout.addWidget(regular_btn)
+        button_specs = (
+            # Execute and Clear buttons under test
+            ("Execute Query", "execute"),
+            ("Clear", "clear"),
+            # Other enhanced buttons for comparison
+            ("Connect", "connect"),
+            ("Refresh", "refresh"),
+            # Regular button without special styling
+            ("Regular Button", None),
+        )
+        for text, variant in button_specs:
+            button = QPushButton(text)
+            if variant:
+                button.setProperty("variant", variant)
+            button_layout.addWidget(button)
         
         layout.addLayout(button_layout)
         self.setLayout(layout)
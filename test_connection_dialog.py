@@ -38,14 +38,18 @@ class TestWindow(QMainWindow):
     def show_connection_dialog(self):
         """Show the connection dialog."""
         dialog = ConnectionDialog(self, self.controller)
-        result = dialog.exec_()
-        
-        if result == ConnectionDialog.Accepted:
-            print("Connection accepted!")
-            connection_info = dialog.get_connection_info()
-            print(f"Connection details: {connection_info}")
-        else:
-            print("Connection cancelled.")
+        try:
+            result = dialog.exec_()
+            
+            if result == ConnectionDialog.Accepted:
+                print("Connection accepted!")
+                connection_info = dialog.get_connection_info()
+                print(f"Connection details: {connection_info}")
+            else:
+                print("Connection cancelled.")
+        finally:
+            # The window owns the dialog, so release it explicitly
+            dialog.deleteLater()
 
 
 def main():
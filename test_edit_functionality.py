@@ -6,12 +6,38 @@ Test script to verify the document editing functionality
 import json
 from bson import ObjectId
 
+try:
+    import orjson
+except ImportError:  # Optional dependency, falls back to the json module
+    orjson = None
+
+
+def dumps_pretty(value):
+    """Serialize a value to JSON text indented by two spaces, like the editor."""
+    if orjson is not None:
+        return orjson.dumps(
+            value, default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        ).decode()
+    return json.dumps(value, indent=2, default=str)
+
+
+def round_trip(value):
+    """Serialize a value and parse it back."""
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(value, option=orjson.OPT_PASSTHROUGH_DATETIME))
+    return json.loads(json.dumps(value))
+
+# Id of the test document, generated once at import
+TEST_DOCUMENT_ID = ObjectId()
+
+
 def test_document_edit():
     """Test the document editing functionality"""
     
     # Test document
     test_doc = {
-        "_id": ObjectId(),
+        "_id": TEST_DOCUMENT_ID,
         "name": "Test User",
         "age": 25,
         "email": "test@example.com"
@@ -26,17 +52,18 @@ def test_document_edit():
     }
     
     print("Original document:")
-    print(json.dumps(test_doc, indent=2, default=str))
+    print(dumps_pretty(test_doc))
     
     print("\nEdited document:")
-    print(json.dumps(edited_doc, indent=2, default=str))
+    print(dumps_pretty(edited_doc))
     
     print("\nDocument ID for update:", str(test_doc['_id']))
     
     # Test JSON validation
     try:
-        json.loads(json.dumps(edited_doc))
+        round_trip(edited_doc)
         print("\n✓ JSON validation passed")
+    # orjson.JSONDecodeError derives from json.JSONDecodeError
     except json.JSONDecodeError as e:
         print(f"\n✗ JSON validation failed: {e}")
 
@@ -12,33 +12,66 @@ import os
 # Add src directory to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Progress output is skipped in CI and under python -O, where only failures
+# and the result line are printed; MONGO_TESTS_VERBOSE=0/1 overrides this
+VERBOSE = os.environ.get(
+    'MONGO_TESTS_VERBOSE', '0' if os.environ.get('CI') or sys.flags.optimize else '1'
+) == '1'
+
+
+def report(*args, **kwargs):
+    """Print progress output when VERBOSE is set."""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
+# Imported once for every test; failures are reported by test_style_imports
+try:
+    from src.styles.modern_styles import ModernStyles
+    modern_styles_error = None
+except ImportError as e:
+    ModernStyles = None
+    modern_styles_error = e
+
+try:
+    from src.styles.theme_manager import theme_manager, ThemeType
+    theme_manager_error = None
+except ImportError as e:
+    theme_manager = ThemeType = None
+    theme_manager_error = e
+
+__all__ = [
+    'test_style_imports',
+    'test_style_generation',
+    'test_theme_functionality',
+    'test_color_schemes',
+    'show_style_preview',
+    'main',
+]
+
 def test_style_imports():
     """Test that all style modules can be imported."""
-    print("🧪 Testing Style Module Imports...")
+    report("🧪 Testing Style Module Imports...")
     
-    try:
-        from src.styles.modern_styles import ModernStyles
-        print("✅ ModernStyles imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import ModernStyles: {e}")
+    if modern_styles_error is not None:
+        print(f"❌ Failed to import ModernStyles: {modern_styles_error}")
         return False
+    report("✅ ModernStyles imported successfully")
     
-    try:
-        from src.styles.theme_manager import theme_manager, ThemeType
-        print("✅ ThemeManager imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import ThemeManager: {e}")
+    if theme_manager_error is not None:
+        print(f"❌ Failed to import ThemeManager: {theme_manager_error}")
         return False
+    report("✅ ThemeManager imported successfully")
     
     return True
 
 def test_style_generation():
     """Test that styles can be generated."""
-    print("\n🎨 Testing Style Generation...")
+    report("\n🎨 Testing Style Generation...")
     
+    # Report lines, written in one print when the test ends
+    lines = []
     try:
-        from src.styles.modern_styles import ModernStyles
-        
         # Test individual style components
         components = [
             ("Main Window", ModernStyles.get_main_window_style),
@@ -59,43 +92,44 @@ def test_style_generation():
             try:
                 style = style_func()
                 if style and len(style) > 10:  # Basic validation
-                    print(f"✅ {name} styles generated ({len(style)} characters)")
+                    lines.append(f"✅ {name} styles generated ({len(style)} characters)")
                 else:
-                    print(f"⚠️  {name} styles seem too short")
+                    lines.append(f"⚠️  {name} styles seem too short")
             except Exception as e:
-                print(f"❌ Failed to generate {name} styles: {e}")
+                lines.append(f"❌ Failed to generate {name} styles: {e}")
+                print("\n".join(lines))
                 return False
         
         # Test complete stylesheet
         complete_style = ModernStyles.get_complete_stylesheet()
-        print(f"✅ Complete stylesheet generated ({len(complete_style)} characters)")
+        lines.append(f"✅ Complete stylesheet generated ({len(complete_style)} characters)")
+        report("\n".join(lines))
         
         return True
         
     except Exception as e:
-        print(f"❌ Style generation failed: {e}")
+        lines.append(f"❌ Style generation failed: {e}")
+        print("\n".join(lines))
         return False
 
 def test_theme_functionality():
     """Test theme switching functionality."""
-    print("\n🌈 Testing Theme Functionality...")
+    report("\n🌈 Testing Theme Functionality...")
     
     try:
-        from src.styles.theme_manager import theme_manager, ThemeType
-        
         # Test theme enumeration
         themes = theme_manager.get_theme_names()
-        print(f"✅ Available themes: {', '.join(themes)}")
+        report(f"✅ Available themes: {', '.join(themes)}")
         
         # Test current theme
         current = theme_manager.get_current_theme()
-        print(f"✅ Current theme: {current.value}")
+        report(f"✅ Current theme: {current.value}")
         
         # Test theme switching
         for theme in ThemeType:
             try:
                 theme_manager.set_theme(theme)
-                print(f"✅ Successfully switched to {theme.value} theme")
+                report(f"✅ Successfully switched to {theme.value} theme")
             except Exception as e:
                 print(f"❌ Failed to switch to {theme.value}: {e}")
                 return False
@@ -108,55 +142,61 @@ def test_theme_functionality():
 
 def test_color_schemes():
     """Test that all color schemes are properly defined."""
-    print("\n🎯 Testing Color Schemes...")
+    report("\n🎯 Testing Color Schemes...")
     
+    # Report lines, written in one print when the test ends
+    lines = []
     try:
-        from src.styles.theme_manager import theme_manager, ThemeType
-        from src.styles.modern_styles import ModernStyles
-        
-        required_colors = [
+        required_colors = (
             'primary', 'primary_light', 'primary_dark',
             'secondary', 'secondary_light', 'secondary_dark',
             'success', 'warning', 'error', 'info',
             'background', 'surface', 'on_background', 'on_surface',
             'border', 'border_dark', 'text_primary', 'text_secondary',
             'text_disabled', 'hover', 'selection', 'shadow'
-        ]
+        )
+        color_prefixes = ('#', 'rgba')
         
         for theme in ThemeType:
             theme_manager.set_theme(theme)
-            print(f"\n🎨 Validating {theme.value} theme:")
+            colors = ModernStyles.COLORS
             
-            missing_colors = []
+            present = colors.keys()
+            missing_colors = [color for color in required_colors if color not in present]
+            lines.append(f"\n🎨 Validating {theme.value} theme:")
             for color in required_colors:
-                if color in ModernStyles.COLORS:
-                    color_value = ModernStyles.COLORS[color]
-                    if color_value and (color_value.startswith('#') or color_value.startswith('rgba')):
-                        print(f"  ✅ {color}: {color_value}")
-                    else:
-                        print(f"  ⚠️  {color}: {color_value} (unusual format)")
+                if color not in present:
+                    continue
+                color_value = colors[color]
+                if color_value and color_value.startswith(color_prefixes):
+                    lines.append(f"  ✅ {color}: {color_value}")
                 else:
-                    missing_colors.append(color)
+                    lines.append(f"  ⚠️  {color}: {color_value} (unusual format)")
             
             if missing_colors:
-                print(f"  ❌ Missing colors: {', '.join(missing_colors)}")
+                lines.append(f"  ❌ Missing colors: {', '.join(missing_colors)}")
+                print("\n".join(lines))
                 return False
         
+        report("\n".join(lines))
         return True
         
     except Exception as e:
-        print(f"❌ Color scheme test failed: {e}")
+        lines.append(f"❌ Color scheme test failed: {e}")
+        print("\n".join(lines))
         return False
 
 def show_style_preview():
     """Show a preview of the styling system capabilities."""
-    print("\n🖼️  Style System Preview")
-    print("=" * 50)
+    report("\n🖼️  Style System Preview")
+    report("=" * 50)
     
-    from src.styles.modern_styles import ModernStyles
-    from src.styles.theme_manager import theme_manager, ThemeType
+    colors = ModernStyles.COLORS
+    primary, background, surface, text = (
+        colors[key] for key in ('primary', 'background', 'surface', 'text_primary')
+    )
     
-    print(f"""
+    report(f"""
 📱 Modern MongoDB Visualizer Styling System
 
 🎨 Features:
@@ -169,10 +209,10 @@ def show_style_preview():
    • Consistent design language
 
 🌈 Current Theme: {theme_manager.get_current_theme().value.title()}
-   Primary Color: {ModernStyles.COLORS['primary']}
-   Background: {ModernStyles.COLORS['background']}
-   Surface: {ModernStyles.COLORS['surface']}
-   Text: {ModernStyles.COLORS['text_primary']}
+   Primary Color: {primary}
+   Background: {background}
+   Surface: {surface}
+   Text: {text}
 
 🛠️  Styled Components:
    ✅ Main window and layouts
@@ -195,8 +235,8 @@ def show_style_preview():
 
 def main():
     """Run all style validation tests."""
-    print("🎨 MongoDB Visualizer - Modern Styling Validation")
-    print("=" * 60)
+    report("🎨 MongoDB Visualizer - Modern Styling Validation")
+    report("=" * 60)
     
     tests = [
         ("Module Imports", test_style_imports),
@@ -207,20 +247,24 @@ def main():
     
     passed = 0
     total = len(tests)
+    # FAST_FAIL=1 skips the remaining tests after the first failure
+    fast_fail = os.environ.get('FAST_FAIL') == '1'
     
     for name, test_func in tests:
-        print(f"\n{'='*20} {name} {'='*20}")
+        report(f"\n{'='*20} {name} {'='*20}")
         if test_func():
             passed += 1
-            print(f"✅ {name} - PASSED")
+            report(f"✅ {name} - PASSED")
         else:
             print(f"❌ {name} - FAILED")
+            if fast_fail:
+                break
     
-    print(f"\n{'='*60}")
+    report(f"\n{'='*60}")
     print(f"🏆 Test Results: {passed}/{total} tests passed")
     
     if passed == total:
-        print("🎉 All styling tests passed! The modern styling system is ready.")
+        report("🎉 All styling tests passed! The modern styling system is ready.")
         show_style_preview()
         return 0
     else: